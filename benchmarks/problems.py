@@ -0,0 +1,139 @@
+"""
+Familias de problemas de programación lineal reproducibles para los benchmarks.
+
+Los generadores de n variables retornan un LinearProblem (arreglos listos
+para TwoPhaseMethodModel.from_arrays); los de dos variables retornan las
+restricciones en el formato del método gráfico, [(coef1, coef2, inequality, limit)].
+La misma semilla produce siempre el mismo problema.
+"""
+import math
+
+import numpy as np
+from scipy import sparse
+
+
+class LinearProblem:
+    def __init__(self, name, opt_type, objective, matrix, relations, rhs):
+        self.name = name
+        self.opt_type = opt_type
+        self.objective = objective
+        self.matrix = matrix
+        self.relations = relations
+        self.rhs = rhs
+
+
+def random_dense(num_constraints, num_vars, seed=0):
+    """max c x con A x <= b, A y c positivos: factible (x = 0) y acotado."""
+    rng = np.random.default_rng(seed)
+    matrix = rng.uniform(0.1, 1.0, (num_constraints, num_vars))
+    rhs = matrix.sum(axis=1) * rng.uniform(0.2, 0.6, num_constraints)
+    objective = rng.uniform(1.0, 2.0, num_vars)
+    relations = np.full(num_constraints, "<=")
+    return LinearProblem(f"dense_{num_constraints}x{num_vars}", "Maximizar", objective, matrix, relations, rhs)
+
+
+def random_sparse(num_constraints, num_vars, density=0.02, seed=0):
+    """min c x con A x >= b disperso; cada fila tiene al menos un coeficiente (requiere Fase 1)."""
+    rng = np.random.default_rng(seed)
+    matrix = sparse.random(num_constraints, num_vars, density=density, format="lil", random_state=rng)
+    for row, col in enumerate(rng.integers(0, num_vars, num_constraints)):
+        matrix[row, col] = 0.5 + rng.random()
+    matrix = matrix.tocsr()
+    rhs = rng.uniform(1.0, 5.0, num_constraints)
+    objective = rng.uniform(1.0, 2.0, num_vars)
+    relations = np.full(num_constraints, ">=")
+    return LinearProblem(f"sparse_{num_constraints}x{num_vars}", "Minimizar", objective, matrix, relations, rhs)
+
+
+def klee_minty(dimension):
+    """Cubo de Klee-Minty: con la regla de Dantzig el simplex visita 2^n - 1 vértices."""
+    matrix = np.zeros((dimension, dimension))
+    for row in range(dimension):
+        for col in range(row):
+            matrix[row, col] = 2.0 ** (row - col + 1)
+        matrix[row, row] = 1.0
+    rhs = 5.0 ** np.arange(1, dimension + 1)
+    objective = 2.0 ** np.arange(dimension - 1, -1, -1)
+    relations = np.full(dimension, "<=")
+    return LinearProblem(f"klee_minty_{dimension}", "Maximizar", objective, matrix, relations, rhs)
+
+
+def transportation(num_sources, num_sinks, seed=0):
+    """Transporte balanceado con igualdades (una de ellas redundante)."""
+    rng = np.random.default_rng(seed)
+    supply = rng.integers(10, 50, num_sources).astype(float)
+    demand = rng.multinomial(int(supply.sum()), np.full(num_sinks, 1.0 / num_sinks)).astype(float)
+    num_vars = num_sources * num_sinks
+    matrix = np.zeros((num_sources + num_sinks, num_vars))
+    for source in range(num_sources):
+        matrix[source, source * num_sinks:(source + 1) * num_sinks] = 1.0
+    for sink in range(num_sinks):
+        matrix[num_sources + sink, sink::num_sinks] = 1.0
+    objective = rng.uniform(1.0, 10.0, num_vars)
+    relations = np.full(num_sources + num_sinks, "=")
+    rhs = np.concatenate([supply, demand])
+    return LinearProblem(f"transportation_{num_sources}x{num_sinks}", "Minimizar", objective, matrix, relations, rhs)
+
+
+def assignment(size, seed=0):
+    """Asignación n x n: transporte con ofertas y demandas 1, muy degenerado."""
+    problem = transportation(size, size, seed)
+    problem.rhs = np.ones(2 * size)
+    problem.name = f"assignment_{size}"
+    return problem
+
+
+def degenerate(num_constraints, num_vars, seed=0):
+    """Muchas restricciones activas en el origen (lado derecho 0) más una cota sum(x) <= n."""
+    rng = np.random.default_rng(seed)
+    matrix = rng.uniform(-1.0, 1.0, (num_constraints, num_vars))
+    rhs = np.where(np.arange(num_constraints) % 2 == 0, 0.0, rng.uniform(0.5, 2.0, num_constraints))
+    matrix = np.vstack([matrix, np.ones(num_vars)])
+    rhs = np.append(rhs, float(num_vars))
+    objective = rng.uniform(0.5, 1.5, num_vars)
+    relations = np.full(num_constraints + 1, "<=")
+    return LinearProblem(f"degenerate_{num_constraints}x{num_vars}", "Maximizar", objective, matrix, relations, rhs)
+
+
+def two_variable_cuts(num_cuts, seed=0):
+    """
+    Problema de dos variables con `num_cuts` cortes tangentes a un círculo.
+
+    Retorna (coef_x1, coef_x2, restrictions, obj_type) para el método gráfico.
+    """
+    rng = np.random.default_rng(seed)
+    angles = np.sort(rng.uniform(0.0, math.pi / 2, num_cuts))
+    radius = 50.0
+    restrictions = [
+        (float(math.cos(angle)), float(math.sin(angle)), "≤", float(radius + rng.uniform(0.0, 1.0)))
+        for angle in angles
+    ]
+    return 3.0, 2.0, restrictions, "max"
+
+
+def lp_families(quick=False):
+    """Produce (familia, problema) con los tamaños del benchmark; `quick` deja solo los chicos."""
+    sizes = {
+        "dense": [(20, 20), (80, 80), (200, 200)],
+        "sparse": [(100, 200), (400, 800)],
+        "klee_minty": [8, 12],
+        "transportation": [(5, 8), (15, 20)],
+        "assignment": [8, 20],
+        "degenerate": [(40, 20), (150, 80)],
+    }
+    builders = {
+        "dense": lambda size: random_dense(*size),
+        "sparse": lambda size: random_sparse(*size),
+        "klee_minty": klee_minty,
+        "transportation": lambda size: transportation(*size),
+        "assignment": assignment,
+        "degenerate": lambda size: degenerate(*size),
+    }
+    for family, family_sizes in sizes.items():
+        for size in family_sizes[:1] if quick else family_sizes:
+            yield family, builders[family](size)
+
+
+def two_variable_sizes(quick=False):
+    sizes = [10, 300, 3000]
+    return sizes[:1] if quick else sizes
@@ -0,0 +1,106 @@
+"""
+Mide el tiempo de arranque de la interfaz y falla si supera el presupuesto.
+
+Uso:
+    python -m benchmarks.startup [--budget-ms 250] [--repeat 5] [--window]
+
+Por defecto importa view.TwoPhaseMethodView en procesos nuevos con
+-X importtime y toma la mediana del tiempo acumulado de ese import, que es
+todo lo que se carga antes de crear la primera ventana. Con --window además
+crea la ventana real (requiere pantalla) y mide hasta que se dibuja.
+Retorna 1 si la mediana supera el presupuesto.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENTRY_MODULE = "view.TwoPhaseMethodView"
+BUDGET_MS = 250.0
+
+WINDOW_SCRIPT = """
+import time
+start = time.perf_counter()
+import tkinter
+
+def first_window(self, n=0):
+    self.update()
+    print(f"{(time.perf_counter() - start) * 1000:.3f}")
+    self.destroy()
+
+tkinter.Tk.mainloop = first_window
+from view.TwoPhaseMethodView import TwoPhaseMethodView
+TwoPhaseMethodView()
+"""
+
+
+def parse_importtime(stderr):
+    """Retorna {módulo: (propio_us, acumulado_us)} a partir de la salida de -X importtime."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        fields = line[len("import time:"):].split("|")
+        try:
+            own, cumulative = int(fields[0]), int(fields[1])
+        except ValueError:
+            continue
+        modules[fields[2].strip()] = (own, cumulative)
+    return modules
+
+
+def measure_imports(module=ENTRY_MODULE):
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(completed.stderr)
+
+
+def measure_window():
+    completed = subprocess.run([sys.executable, "-c", WINDOW_SCRIPT], cwd=ROOT, capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+    return float(completed.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.startup")
+    parser.add_argument("--budget-ms", type=float, default=BUDGET_MS)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="módulos más lentos a listar")
+    parser.add_argument("--window", action="store_true", help="mide también la primera ventana real")
+    arguments = parser.parse_args(argv)
+
+    runs = [measure_imports() for _ in range(arguments.repeat)]
+    totals = [run[ENTRY_MODULE][1] / 1000 for run in runs]
+    median = statistics.median(totals)
+    print(f"import {ENTRY_MODULE}: mediana {median:.1f} ms (min {min(totals):.1f}, max {max(totals):.1f})")
+
+    slowest = sorted(runs[-1].items(), key=lambda item: item[1][0], reverse=True)[:arguments.top]
+    for name, (own, _) in slowest:
+        print(f"  {own / 1000:8.1f} ms  {name}")
+
+    if arguments.window:
+        try:
+            windows = [measure_window() for _ in range(arguments.repeat)]
+        except RuntimeError as error:
+            print(f"No se pudo abrir la ventana: {error}")
+            return 1
+        median = max(median, statistics.median(windows))
+        print(f"primera ventana: mediana {statistics.median(windows):.1f} ms")
+
+    if median > arguments.budget_ms:
+        print(f"FALLA: {median:.1f} ms supera el presupuesto de {arguments.budget_ms:.1f} ms")
+        return 1
+    print(f"OK: dentro del presupuesto de {arguments.budget_ms:.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,179 @@
+"""
+Mide los solvers y el método gráfico sobre las familias de benchmarks.problems.
+
+Uso:
+    python -m benchmarks.suite --save baseline.json
+    python -m benchmarks.suite --compare baseline.json [--threshold 0.25]
+    python -m benchmarks.suite --quick --filter dense
+
+Cada caso se ejecuta una vez de calentamiento y luego --repeat veces; se
+guarda la mediana y el mínimo en milisegundos. Con --compare se marca como
+regresión todo caso cuya mediana supere la de la línea base en más de
+--threshold (proporción) y se retorna 1 si hay alguna. La caché de
+soluciones se desactiva para medir siempre una resolución completa.
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+
+import numpy as np
+
+from benchmarks import problems
+
+BACKENDS = ("tableau", "revised", "highs", "portfolio", "ipm")
+THRESHOLD = 0.25
+# Diferencias por debajo de esto son ruido del reloj aunque la proporción sea grande.
+MIN_REGRESSION_MS = 1.0
+
+
+def time_call(function, repeat):
+    function()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {"median_ms": statistics.median(samples), "min_ms": min(samples), "repeat": repeat}
+
+
+def two_phase_cases(quick):
+    from model.two_phase_model import TwoPhaseMethodModel
+
+    for family, problem in problems.lp_families(quick):
+        for backend in BACKENDS:
+            def solve(problem=problem, backend=backend):
+                model = TwoPhaseMethodModel.from_arrays(
+                    problem.opt_type, problem.objective, problem.matrix, problem.relations, problem.rhs, backend=backend
+                )
+                result = model.solve()
+                if isinstance(result, str):
+                    raise RuntimeError(f"{problem.name} ({backend}): {result}")
+
+            yield f"two_phase/{backend}/{problem.name}", solve
+
+
+def graphic_cases(quick):
+    from model.GraphicMethodModel import solve_2d
+    from utils.calculate_optimal_solution import calculate_optimal_solution
+    from utils.half_plane_intersection import feasible_polygon
+
+    viewport = (0.0, 100.0, 0.0, 100.0)
+    for size in problems.two_variable_sizes(quick):
+        coef_x1, coef_x2, restrictions, obj_type = problems.two_variable_cuts(size)
+        costs = [-coef_x1, -coef_x2]
+        yield f"vertices/cuts_{size}", lambda r=restrictions: calculate_optimal_solution(coef_x1, coef_x2, r, obj_type)
+        yield f"polygon/cuts_{size}", lambda r=restrictions: feasible_polygon(r, viewport)
+        yield f"seidel/cuts_{size}", lambda r=restrictions: solve_2d(costs, r)
+        yield from plot_cases(size, coef_x1, coef_x2, restrictions, obj_type)
+
+
+def plot_cases(size, coef_x1, coef_x2, restrictions, obj_type):
+    """Dibujo completo e incremental de GraphicMethodView sobre un lienzo Agg (sin Tk)."""
+    try:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+    except ImportError:
+        return
+    from utils.half_plane_intersection import feasible_polygon
+    from view.GraphicMethodView import GraphicMethodView
+
+    class Label:
+        def config(self, **options):
+            pass
+
+    view = GraphicMethodView.__new__(GraphicMethodView)
+    view.colors = {"accent": "#22d3ee", "bg": "#0f172a"}
+    view.figure = Figure(figsize=(6, 4))
+    view.ax = view.figure.add_subplot()
+    view.canvas = FigureCanvasAgg(view.figure)
+    view.result_label = Label()
+    view.create_plot_artists()
+
+    extent = view.plot_extent(restrictions)
+    polygon = feasible_polygon(restrictions, (0.0, extent, 0.0, extent))
+    result = {"X": [0.0, 0.0], "Z": 0.0}
+    edited = list(restrictions)
+
+    def full():
+        view.background = None
+        view.plot_solution(restrictions, extent, polygon, result)
+
+    def incremental():
+        # Cambia el límite del último corte: con más cortes que LEGEND_LIMIT queda
+        # fuera de la leyenda y solo se recalcula esa recta.
+        coef1, coef2, inequality, limit = edited[-1]
+        edited[-1] = (coef1, coef2, inequality, limit + 1e-3)
+        view.plot_solution(edited, extent, polygon, result)
+
+    yield f"plot_full/cuts_{size}", full
+    yield f"plot_incremental/cuts_{size}", incremental
+
+
+def run(quick=False, repeat=5, pattern=None):
+    from model.two_phase_model import TwoPhaseMethodModel
+
+    cache, TwoPhaseMethodModel.cache = TwoPhaseMethodModel.cache, None
+    results = {}
+    try:
+        for name, function in [*two_phase_cases(quick), *graphic_cases(quick)]:
+            if pattern and pattern not in name:
+                continue
+            results[name] = time_call(function, repeat)
+            print(f"{results[name]['median_ms']:10.2f} ms  {name}", flush=True)
+    finally:
+        TwoPhaseMethodModel.cache = cache
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Retorna [(caso, base_ms, actual_ms, proporción)] de los casos que empeoraron más que `threshold`."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        ratio = current["median_ms"] / max(previous["median_ms"], 1e-9)
+        if ratio > 1.0 + threshold and current["median_ms"] - previous["median_ms"] > MIN_REGRESSION_MS:
+            regressions.append((name, previous["median_ms"], current["median_ms"], ratio))
+    return regressions
+
+
+def environment():
+    return {"python": platform.python_version(), "numpy": np.__version__, "machine": platform.machine()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite")
+    parser.add_argument("--save", help="escribe los resultados como línea base JSON")
+    parser.add_argument("--compare", help="línea base JSON contra la cual comparar")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="empeoramiento tolerado (0.25 = 25%%)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--quick", action="store_true", help="solo el tamaño más chico de cada familia")
+    parser.add_argument("--filter", help="solo los casos cuyo nombre contiene este texto")
+    arguments = parser.parse_args(argv)
+
+    results = run(arguments.quick, arguments.repeat, arguments.filter)
+    if arguments.save:
+        with open(arguments.save, "w", encoding="utf-8") as stream:
+            json.dump({"environment": environment(), "results": results}, stream, indent=2, sort_keys=True)
+
+    if not arguments.compare:
+        return 0
+    with open(arguments.compare, encoding="utf-8") as stream:
+        baseline = json.load(stream)
+    regressions = compare(results, baseline["results"], arguments.threshold)
+    if baseline.get("environment") != environment():
+        print(f"Aviso: la línea base se tomó en otro entorno {baseline.get('environment')}", file=sys.stderr)
+    for name, previous, current, ratio in regressions:
+        print(f"REGRESIÓN {name}: {previous:.2f} ms -> {current:.2f} ms (x{ratio:.2f})")
+    if regressions:
+        return 1
+    print(f"OK: ningún caso empeoró más de {arguments.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,4 @@
+from cli.batch_solver import main
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,175 @@
+"""
+Resolución por lotes sin interfaz gráfica.
+
+Uso:
+    python -m cli problemas/ otro.json - --output resultados.jsonl
+
+Cada entrada puede ser un archivo .json (un problema o una lista), un
+archivo .jsonl (un problema por línea), un directorio (se recorren sus
+.json/.jsonl en orden) o "-" para leer JSON Lines desde la entrada
+estándar. Un problema tiene la forma:
+
+    {"name": "p1", "opt_type": "Maximizar", "objective": [3, 2],
+     "constraints": [[[1, 2], "<=", 10], {"coeffs": [3, 1], "relation": "<=", "rhs": 15}]}
+
+Por cada problema se escribe una línea JSON con el estado, la solución y
+el tiempo de resolución. Este módulo no importa tkinter ni matplotlib.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+from model.instrumentation import Instrumentation, JsonlSink, optional_stage
+from model.two_phase_model import TwoPhaseMethodModel
+
+OPT_TYPES = {"max": "Maximizar", "maximizar": "Maximizar", "min": "Minimizar", "minimizar": "Minimizar"}
+STATUS_BY_MESSAGE = {
+    "El problema no tiene solución factible.": "infeasible",
+    "El problema no está acotado.": "unbounded",
+    "No se pudo encontrar una solución óptima.": "not_solved",
+}
+PROBLEM_SUFFIXES = (".json", ".jsonl")
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m cli", description="Resuelve problemas de programación lineal por lotes.")
+    parser.add_argument("inputs", nargs="+", help="archivos .json/.jsonl, directorios o - para la entrada estándar")
+    parser.add_argument("-o", "--output", default="-", help="archivo JSON Lines de salida (por defecto la salida estándar)")
+    parser.add_argument("--backend", choices=("tableau", "revised", "highs", "highs-ds", "highs-ipm", "portfolio", "ipm"), default="revised")
+    parser.add_argument("--presolve", action="store_true", help="aplica presolve antes de resolver")
+    parser.add_argument("--tableaus", action="store_true", help="incluye los tableaus de cada fase en la salida")
+    parser.add_argument("--cache", help="ruta de una caché SQLite persistente de soluciones")
+    parser.add_argument("--instrument", action="store_true", help="incluye tiempos y contadores por etapa en la salida")
+    parser.add_argument("--instrument-sink", help="además escribe esos registros en este archivo JSON Lines")
+    parser.add_argument(
+        "--instrument-allocations", action="store_true", help="con --instrument o --instrument-sink, mide también la memoria por etapa (más lento)"
+    )
+    return parser.parse_args(argv)
+
+
+def iter_sources(inputs):
+    """Produce (origen, texto JSON) para cada problema de las entradas dadas."""
+    for source in inputs:
+        if source == "-":
+            yield from _iter_lines("<stdin>", sys.stdin)
+        elif os.path.isdir(source):
+            for name in sorted(os.listdir(source)):
+                if name.endswith(PROBLEM_SUFFIXES):
+                    yield from iter_sources([os.path.join(source, name)])
+        elif source.endswith(".jsonl"):
+            with open(source, encoding="utf-8") as stream:
+                yield from _iter_lines(source, stream)
+        else:
+            with open(source, encoding="utf-8") as stream:
+                yield source, stream.read()
+
+
+def _iter_lines(source, stream):
+    for number, line in enumerate(stream, start=1):
+        if line.strip():
+            yield f"{source}:{number}", line
+
+
+def iter_problems(inputs):
+    for source, text in iter_sources(inputs):
+        try:
+            data = json.loads(text)
+        except ValueError as error:
+            yield source, None, f"JSON inválido: {error}"
+            continue
+        problems = data if isinstance(data, list) else [data]
+        for index, problem in enumerate(problems):
+            name = source if len(problems) == 1 else f"{source}[{index}]"
+            yield name, problem, None
+
+
+def build_model(problem, backend, presolve):
+    """Arma un TwoPhaseMethodModel a partir del diccionario de un problema."""
+    opt_type = OPT_TYPES.get(str(problem.get("opt_type", "Maximizar")).lower())
+    if opt_type is None:
+        raise ValueError(f"Tipo de optimización inválido: {problem.get('opt_type')}")
+    objective = [float(value) for value in problem["objective"]]
+    constraints = []
+    for constraint in problem["constraints"]:
+        if isinstance(constraint, dict):
+            coeffs, relation, rhs = constraint["coeffs"], constraint["relation"], constraint["rhs"]
+        else:
+            coeffs, relation, rhs = constraint
+        constraints.append(([float(value) for value in coeffs], relation, float(rhs)))
+    return TwoPhaseMethodModel(
+        len(objective),
+        len(constraints),
+        opt_type,
+        objective,
+        constraints,
+        backend=problem.get("backend", backend),
+        presolve=problem.get("presolve", presolve),
+    )
+
+
+def solve_problem(name, problem, arguments, sink=None):
+    record = {"name": problem.get("name", name) if isinstance(problem, dict) else name}
+    instrumentation = None
+    if arguments.instrument or sink is not None:
+        # El archivo del problema puede elegir su propio backend.
+        backend = problem.get("backend", arguments.backend) if isinstance(problem, dict) else arguments.backend
+        instrumentation = Instrumentation(
+            sink, arguments.instrument_allocations, source="cli", name=record["name"], backend=backend
+        )
+    start = time.perf_counter()
+    try:
+        with optional_stage(instrumentation, "input_parsing"):
+            model = build_model(problem, arguments.backend, arguments.presolve)
+        result = model.solve(instrumentation=instrumentation)
+    except (AttributeError, KeyError, TypeError, ValueError) as error:
+        result = f"Error en la configuración del problema: {error}"
+    record["seconds"] = time.perf_counter() - start
+
+    if isinstance(result, str):
+        record["status"] = STATUS_BY_MESSAGE.get(result, "error")
+        record["message"] = result
+    else:
+        record["status"] = "optimal"
+        record["X"] = result["solution"]["X"]
+        record["Z"] = result["solution"]["Z"]
+        for key in ("iterations", "presolve", "portfolio"):
+            if key in result:
+                record[key] = result[key]
+        if arguments.tableaus:
+            with optional_stage(instrumentation, "tableau_formatting"):
+                record["phase1_tableaus"] = [tableau.to_rows() for tableau in result["phase1_tableaus"]]
+                record["phase2_tableaus"] = [tableau.to_rows() for tableau in result["phase2_tableaus"]]
+
+    if instrumentation is not None:
+        summary = instrumentation.emit(status=record["status"])
+        if arguments.instrument:
+            record["instrumentation"] = {"stages": summary["stages"], "counters": summary["counters"]}
+    return record
+
+
+def main(argv=None):
+    arguments = parse_arguments(argv)
+    if arguments.cache:
+        from model.disk_cache import DiskSolveCache
+        from model.solve_cache import SolveCache
+
+        TwoPhaseMethodModel.cache = DiskSolveCache(arguments.cache, memory=SolveCache())
+    sink = JsonlSink(arguments.instrument_sink) if arguments.instrument_sink else None
+
+    output = sys.stdout if arguments.output == "-" else open(arguments.output, "w", encoding="utf-8")
+    failures = 0
+    try:
+        for name, problem, error in iter_problems(arguments.inputs):
+            if error is not None:
+                record = {"name": name, "status": "error", "message": error, "seconds": 0.0}
+            else:
+                record = solve_problem(name, problem, arguments, sink)
+            failures += record["status"] == "error"
+            output.write(json.dumps(record, ensure_ascii=False, default=float) + "\n")
+            output.flush()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    return 1 if failures else 0
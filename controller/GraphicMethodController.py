@@ -5,8 +5,8 @@ class GraphicMethodController:
     def __init__(self):
         self.model = GraphicMethodModel()
 
-    def solve(self, obj_type, coef_x1, coef_x2, restrictions):
-        """Resuelve el problema de programación lineal."""
+    def solve(self, obj_type, coef_x1, coef_x2, restrictions, check=None):
+        """Resuelve el problema de programación lineal; `check` permite cancelarlo."""
         self.model.set_objective(obj_type, coef_x1, coef_x2)
         self.model.set_restrictions(restrictions)
-        return self.model.solve()
\ No newline at end of file
+        return self.model.solve(check)
\ No newline at end of file
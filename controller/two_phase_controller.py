@@ -1,8 +1,12 @@
-from model.two_phase_model import TwoPhaseMethodModel
+from model.instrumentation import instrumentation_from_environment, optional_stage
+from utils.solver_worker import SolverWorker
+
 
 class TwoPhaseMethodController:
     def __init__(self, view):
         self.view = view
+        self.model = None
+        self.worker = SolverWorker(view.root)
 
     def create_matrix_entries(self, num_vars, num_constraints):
         self.view.create_objective_entries(num_vars)
@@ -20,30 +24,6 @@ class TwoPhaseMethodController:
             values.append(num)
         return values
 
-    def get_constraints_values(self, num_constraints, num_vars):
-        A = []
-        b = []
-        for cons in self.view.constraint_entries:
-            coeff_entries = cons.get("coeff_entries", [])
-            coeffs = self.get_entries_values(coeff_entries[:num_vars])
-            sign = cons.get("sign").get()
-            try:
-                rhs = float(cons.get("rhs").get())
-            except ValueError:
-                rhs = 0
-            if sign == ">=":
-                A.append([-c for c in coeffs])
-                b.append(-rhs)
-            elif sign == "<=":
-                A.append(coeffs)
-                b.append(rhs)
-            elif sign == "=":
-                A.append(coeffs)
-                b.append(rhs)
-                A.append([-c for c in coeffs])
-                b.append(-rhs)
-        return A, b
-
     def calculate_solution(self):
         try:
             num_vars = int(self.view.num_vars_entry.get())
@@ -52,14 +32,49 @@ class TwoPhaseMethodController:
             self.view.display_result("Número de variables o restricciones inválido.")
             return
 
-        obj_type = self.view.opt_type.get()        
-        objective_coeffs = self.get_entries_values(self.view.obj_coeff_entries)
-        constraints = self.get_constraints(num_vars)
+        # Solo se instrumenta si CALCULADORA_INSTRUMENTACION apunta a un archivo.
+        instrumentation = instrumentation_from_environment(source="interfaz", num_vars=num_vars, num_constraints=num_constraints)
+        with optional_stage(instrumentation, "input_parsing"):
+            obj_type = self.view.opt_type.get()
+            objective_coeffs = self.get_entries_values(self.view.obj_coeff_entries)
+            constraints = self.get_constraints(num_vars)
+
+        def solve(progress):
+            # Corre en el hilo del worker, que es el único que toca self.model.
+            # El modelo (numpy/scipy) se importa recién al primer cálculo.
+            from model.two_phase_model import TwoPhaseMethodModel
+
+            if self.model is None or self.model.num_vars != num_vars:
+                self.model = TwoPhaseMethodModel(num_vars, num_constraints, obj_type, objective_coeffs, constraints)
+            else:
+                self.model.update(obj_type, objective_coeffs, constraints)
+            return self.model.solve(progress=progress, instrumentation=instrumentation)
+
+        self.view.set_busy(True)
+        self.view.status_bar.start()
+        self.worker.submit(
+            solve,
+            lambda result: self.on_solution(result, instrumentation),
+            self.view.status_bar.show_progress,
+            self.on_cancelled,
+        )
+
+    def on_solution(self, result, instrumentation=None):
+        self.view.set_busy(False)
+        self.view.status_bar.finish()
+        with optional_stage(instrumentation, "render"):
+            self.view.display_result(result)
+            # Incluye el dibujo real de la ventana, no solo la creación de widgets.
+            self.view.root.update_idletasks()
+        if instrumentation is not None:
+            instrumentation.emit(status="optimal" if isinstance(result, dict) else result)
 
-        model = TwoPhaseMethodModel(num_vars, num_constraints, obj_type, objective_coeffs, constraints)
-        result = model.solve()
+    def on_cancelled(self):
+        self.view.set_busy(False)
+        self.view.status_bar.finish("Cálculo cancelado.")
 
-        self.view.display_result(result)
+    def cancel_solution(self):
+        self.worker.cancel()
 
     def get_constraints(self, num_vars):
         constraints = []
@@ -1,3 +1,179 @@
+import math
+
+import numpy as np
+
+TOLERANCE = 1e-9
+BOX = 1e9
+MAX_BOX_GROWTH = 4
+SCAN_BLOCK = 1024
+VECTORIZE_FROM = 64
+LESS_EQUAL = ("≤", "<=")
+GREATER_EQUAL = ("≥", ">=")
+
+
+def _normalize(restrictions, nonnegative):
+    """Lleva las restricciones a filas a x1 + b x2 <= c con (a, b) unitario."""
+    rows = []
+    for coef1, coef2, inequality, limit in restrictions:
+        if inequality not in GREATER_EQUAL:
+            rows.append((coef1, coef2, limit))
+        if inequality not in LESS_EQUAL:
+            rows.append((-coef1, -coef2, -limit))
+    if nonnegative:
+        rows += [(-1.0, 0.0, 0.0), (0.0, -1.0, 0.0)]
+    rows = np.array(rows, dtype=float).reshape(-1, 3)
+    norms = np.hypot(rows[:, 0], rows[:, 1])
+    empty = norms <= TOLERANCE
+    if np.any(rows[empty, 2] < -TOLERANCE):
+        return None
+    return rows[~empty] / norms[~empty, None]
+
+
+def _bounds_loop(previous, origin, direction, num_box):
+    low = real_low = -math.inf
+    high = real_high = math.inf
+    for position, (row_a, row_b, row_limit) in enumerate(previous):
+        slope = row_a * direction[0] + row_b * direction[1]
+        room = row_limit - row_a * origin[0] - row_b * origin[1]
+        if slope > TOLERANCE:
+            bound = room / slope
+            high = min(high, bound)
+            if position >= num_box:
+                real_high = min(real_high, bound)
+        elif slope < -TOLERANCE:
+            bound = room / slope
+            low = max(low, bound)
+            if position >= num_box:
+                real_low = max(real_low, bound)
+        elif room < -TOLERANCE * (1.0 + abs(row_limit)):
+            return None
+    return low, high, real_low, real_high
+
+
+def _bounds_vectorized(previous, origin, direction, num_box):
+    slopes = previous[:, :2] @ direction
+    room = previous[:, 2] - previous[:, :2] @ origin
+    parallel = np.abs(slopes) <= TOLERANCE
+    if np.any(room[parallel] < -TOLERANCE * (1.0 + np.abs(previous[parallel, 2]))):
+        return None
+    ratios = np.divide(room, slopes, out=np.zeros_like(room), where=~parallel)
+    upper = np.where(slopes > TOLERANCE, ratios, np.inf)
+    lower = np.where(slopes < -TOLERANCE, ratios, -np.inf)
+    return lower.max(), upper.min(), lower[num_box:].max(initial=-np.inf), upper[num_box:].min(initial=np.inf)
+
+
+def _solve_on_line(rows, row_list, index, costs, num_box):
+    """
+    LP de una dimensión sobre la recta a x = b de la fila `index` con las anteriores.
+
+    Las primeras `num_box` filas son la caja artificial. Si el costo es
+    constante sobre la recta se prefiere un extremo dado por una restricción
+    real, así los empates no terminan en la caja. Retorna el punto óptimo o
+    None si el intervalo factible es vacío.
+    """
+    a, b, limit = rows[index].tolist()
+    origin = (a * limit, b * limit)
+    direction = (-b, a)
+    if index < VECTORIZE_FROM:
+        bounds = _bounds_loop(row_list[:index], origin, direction, num_box)
+    else:
+        bounds = _bounds_vectorized(rows[:index], np.array(origin), np.array(direction), num_box)
+    if bounds is None:
+        return None
+    low, high, real_low, real_high = bounds
+    if low > high + TOLERANCE * (1.0 + abs(low)):
+        return None
+
+    trend = costs[0] * direction[0] + costs[1] * direction[1]
+    threshold = TOLERANCE * math.hypot(costs[0], costs[1])
+    if trend > threshold:
+        t = low
+    elif trend < -threshold:
+        t = high
+    elif real_low > -math.inf:
+        t = max(real_low, low)
+    elif real_high < math.inf:
+        t = min(real_high, high)
+    else:
+        t = min(max(0.0, low), high)
+    return np.array([origin[0] + t * direction[0], origin[1] + t * direction[1]])
+
+
+def _seidel(costs, rows, box, rng, check=None):
+    """
+    Minimiza costs x sobre las filas `rows` dentro de la caja |x_i| <= box.
+
+    Método incremental aleatorizado de Seidel: se agregan las restricciones
+    en orden aleatorio y solo cuando el óptimo vigente viola la nueva se
+    resuelve un LP de una dimensión sobre su recta. En dos dimensiones el
+    tiempo esperado es O(n). `check` se llama en cada bloque revisado y en
+    cada LP de una dimensión (puede lanzar SolveCancelled). Retorna el punto
+    óptimo o None si es infactible.
+    """
+    box_rows = np.array([[1.0, 0.0, box], [-1.0, 0.0, box], [0.0, 1.0, box], [0.0, -1.0, box]])
+    point = np.where(costs > 0, -box, box).astype(float)
+    point[costs == 0] = 0.0
+    order = rng.permutation(rows.shape[0])
+    rows = np.vstack([box_rows, rows[order]])
+    limits = rows[:, 2] + TOLERANCE * (1.0 + np.abs(rows[:, 2]))
+    row_list = rows[:VECTORIZE_FROM].tolist()
+    cost_pair = costs.tolist()
+
+    # Las violaciones son raras (probabilidad <= 2/i), así que se buscan por
+    # bloques vectorizados en lugar de revisar fila por fila.
+    index = box_rows.shape[0]
+    while index < rows.shape[0]:
+        if check is not None:
+            check()
+        stop = min(index + SCAN_BLOCK, rows.shape[0])
+        violated = np.flatnonzero(rows[index:stop, :2] @ point > limits[index:stop])
+        if not violated.size:
+            index = stop
+            continue
+        index += int(violated[0])
+        point = _solve_on_line(rows, row_list, index, cost_pair, box_rows.shape[0])
+        if point is None:
+            return None
+        index += 1
+    return point
+
+
+def solve_2d(costs, restrictions, nonnegative=True, seed=0, check=None):
+    """
+    Minimiza costs x con dos variables.
+
+    `restrictions` es [(coef1, coef2, inequality, limit)] y `check` un
+    callback opcional de cancelación (ver _seidel). Retorna
+    ("optimal", x), ("infeasible", None) o ("unbounded", None). Si el óptimo
+    toca la caja artificial se revisa el cono de recesión: si hay una
+    dirección de mejora el problema no está acotado; si no, se agranda la
+    caja (algún vértice quedaba fuera).
+    """
+    costs = np.asarray(costs, dtype=float)
+    rows = _normalize(restrictions, nonnegative)
+    if rows is None:
+        return "infeasible", None
+    rng = np.random.default_rng(seed)
+    scale = max(1.0, float(np.max(np.abs(rows[:, 2]), initial=0.0)))
+
+    box = BOX * scale
+    for _ in range(MAX_BOX_GROWTH):
+        point = _seidel(costs, rows, box, rng, check)
+        if point is None:
+            return "infeasible", None
+        if np.max(np.abs(point)) < box * (1.0 - TOLERANCE):
+            return "optimal", point
+
+        recession = rows.copy()
+        recession[:, 2] = 0.0
+        direction = _seidel(costs, recession, 1.0, rng, check)
+        if costs @ direction < -TOLERANCE * (1.0 + np.linalg.norm(costs)):
+            return "unbounded", None
+
+        box *= 1e3
+    return "optimal", point
+
+
 class GraphicMethodModel:
     def __init__(self):
         self.objective = None
@@ -12,10 +188,25 @@ class GraphicMethodModel:
         }
 
     def set_restrictions(self, restrictions):
-        """Define las restricciones."""
+        """Define las restricciones como [(coef1, coef2, inequality, limit)] con x1, x2 >= 0."""
         self.restrictions = restrictions
 
-    def solve(self):
-        """Resuelve el problema de programación lineal."""
-        # Aquí implementarías el método gráfico
-        return "Solución calculada"  # Placeholder
\ No newline at end of file
+    def solve(self, check=None):
+        """
+        Resuelve el problema de dos variables con el método de Seidel.
+
+        `check` se llama periódicamente durante la resolución; el worker de
+        la vista pasa progress.check para poder cancelar. Retorna
+        {"X": [x1, x2], "Z": z} o el mensaje de infactibilidad o de problema
+        no acotado.
+        """
+        sign = -1.0 if self.objective["type"] in ("max", "Maximizar") else 1.0
+        coefficients = np.array([self.objective["coef_x1"], self.objective["coef_x2"]], dtype=float)
+        status, point = solve_2d(sign * coefficients, self.restrictions, check=check)
+        if status == "infeasible":
+            return "El problema no tiene solución factible."
+        if status == "unbounded":
+            return "El problema no está acotado."
+        point = np.where(np.abs(point) <= TOLERANCE, 0.0, point)
+        x1, x2 = point.tolist()
+        return {"X": [x1, x2], "Z": float(coefficients @ point)}
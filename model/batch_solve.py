@@ -0,0 +1,183 @@
+import numpy as np
+from scipy import sparse
+
+from model.revised_simplex import FEASIBILITY_TOLERANCE, BasisFactorization, RevisedSimplexSolver
+from model.standard_form import build_standard_form
+
+EPSILON = 1e-9
+
+
+class _BatchResults:
+    def __init__(self, num_scenarios, num_vars):
+        self.status = np.full(num_scenarios, "", dtype="<U16")
+        self.values = np.full((num_scenarios, num_vars), np.nan)
+        self.objective = np.full(num_scenarios, np.nan)
+        self.iterations = np.zeros(num_scenarios, dtype=np.int64)
+
+    def record(self, scenario, status, values, costs, iterations):
+        self.status[scenario] = status
+        self.iterations[scenario] = iterations
+        if status == "optimal":
+            self.values[scenario] = values[:self.values.shape[1]]
+            self.objective[scenario] = costs @ values
+
+    def as_dict(self):
+        return {"status": self.status, "X": self.values, "Z": self.objective, "iterations": self.iterations}
+
+
+class _Layout:
+    """
+    Forma estándar compartida por todos los escenarios y la base óptima vigente.
+
+    La forma se arma sin invertir filas y con una artificial en cada fila,
+    así sirve para cualquier lado derecho: cada arranque en frío solo
+    ajusta el signo de las artificiales al de su escenario para que la base
+    inicial sea factible.
+    """
+
+    def __init__(self, matrix, relations, num_vars):
+        relations = np.asarray(relations)
+        num_rows = matrix.shape[0]
+        form = build_standard_form(matrix, relations, np.zeros(num_rows), "sparse")
+        less_equal = np.flatnonzero(relations == "<=")
+        extra = sparse.csc_matrix(
+            (np.ones(less_equal.size), (less_equal, np.arange(less_equal.size))),
+            shape=(num_rows, less_equal.size),
+        )
+        self.matrix = sparse.hstack([form.matrix, extra], format="csc")
+        self.slack_basis = form.basis
+        self.artificial_columns = np.empty(num_rows, dtype=np.intp)
+        self.artificial_columns[relations != "<="] = form.artificial_indices
+        self.artificial_columns[less_equal] = form.matrix.shape[1] + np.arange(less_equal.size)
+        self.less_equal = relations == "<="
+        self.allowed = np.ones(self.matrix.shape[1], dtype=bool)
+        self.allowed[self.artificial_columns] = False
+        self.num_vars = num_vars
+        self.basis = None
+
+    def solver(self, rhs, costs):
+        return RevisedSimplexSolver(self.matrix, rhs, self.costs(costs))
+
+    def costs(self, costs):
+        padded = np.zeros(self.matrix.shape[1])
+        padded[:self.num_vars] = costs
+        return padded
+
+    def cold_solve(self, rhs, costs):
+        # Las filas "<=" con lado derecho >= 0 arrancan con su holgura; el
+        # resto con su artificial, con el signo del lado derecho.
+        scale = np.ones(self.matrix.shape[1])
+        scale[self.artificial_columns] = np.where(rhs < 0, -1.0, 1.0)
+        basis = np.where(self.less_equal & (rhs >= 0), self.slack_basis, self.artificial_columns)
+        solver = RevisedSimplexSolver(self.matrix @ sparse.diags(scale), rhs, self.costs(costs))
+        result = solver.solve(basis, self.artificial_columns)
+        if result["status"] == "optimal":
+            self.basis = result["basis"].copy()
+        return result["status"], result["x"], sum(result["iterations"].values())
+
+    def artificials_clear(self, basis, basic_values):
+        return np.all(np.abs(basic_values[~self.allowed[basis]]) <= FEASIBILITY_TOLERANCE, axis=0)
+
+    def full_values(self, basic_values):
+        values = np.zeros(self.matrix.shape[1])
+        values[self.basis] = np.maximum(basic_values, 0.0)
+        return values
+
+
+def solve_rhs_batch(matrix, relations, costs, rhs_batch):
+    """
+    Resuelve min costs x para cada fila de `rhs_batch` con la misma matriz.
+
+    La base óptima vigente se factoriza una sola vez para calcular B^-1 b de
+    todos los escenarios pendientes; los que siguen siendo factibles quedan
+    resueltos sin pivoteos y el primero que no lo es se reoptimiza con
+    simplex dual desde esa base, que pasa a ser la nueva base compartida.
+    """
+    rhs_batch = np.atleast_2d(np.asarray(rhs_batch, dtype=float))
+    costs = np.asarray(costs, dtype=float)
+    results = _BatchResults(rhs_batch.shape[0], matrix.shape[1])
+    layout = _Layout(matrix, relations, matrix.shape[1])
+    pending = list(range(rhs_batch.shape[0]))
+
+    while pending:
+        if layout.basis is None:
+            scenario = pending.pop(0)
+            status, values, iterations = layout.cold_solve(rhs_batch[scenario], costs)
+            results.record(scenario, status, values, layout.costs(costs), iterations)
+            continue
+
+        factor = BasisFactorization(layout.matrix, layout.basis)
+        basic_values = factor.lu.solve(np.ascontiguousarray(rhs_batch[pending].T))
+        if basic_values.ndim == 1:
+            basic_values = basic_values[:, None]
+        feasible = np.all(basic_values >= -FEASIBILITY_TOLERANCE, axis=0) & layout.artificials_clear(layout.basis, basic_values)
+        padded_costs = layout.costs(costs)
+        for position in np.flatnonzero(feasible):
+            results.record(pending[position], "optimal", layout.full_values(basic_values[:, position]), padded_costs, 0)
+        pending = [scenario for scenario, ok in zip(pending, feasible) if not ok]
+        if not pending:
+            break
+
+        scenario = pending.pop(0)
+        solver = layout.solver(rhs_batch[scenario], costs)
+        status, basis, values = solver.dual(padded_costs, layout.basis.copy(), layout.allowed)
+        if status == "optimal" and not layout.artificials_clear(basis, values[basis]):
+            status = "infeasible"
+        results.record(scenario, status, values, padded_costs, solver.iterations)
+        if status == "optimal":
+            layout.basis = basis
+
+    return results.as_dict()
+
+
+def solve_objective_batch(matrix, relations, rhs, costs_batch):
+    """
+    Resuelve min c x para cada fila `c` de `costs_batch` con las mismas restricciones.
+
+    Con la base óptima vigente factorizada una vez se calculan los costos
+    reducidos de todos los objetivos pendientes; los que ya son óptimos se
+    resuelven sin pivoteos y el primero que no lo es se reoptimiza con
+    simplex primal desde esa base (sigue siendo factible).
+    """
+    costs_batch = np.atleast_2d(np.asarray(costs_batch, dtype=float))
+    rhs = np.asarray(rhs, dtype=float)
+    results = _BatchResults(costs_batch.shape[0], matrix.shape[1])
+    layout = _Layout(matrix, relations, matrix.shape[1])
+    pending = list(range(costs_batch.shape[0]))
+
+    while pending:
+        if layout.basis is None:
+            scenario = pending.pop(0)
+            status, values, iterations = layout.cold_solve(rhs, costs_batch[scenario])
+            results.record(scenario, status, values, layout.costs(costs_batch[scenario]), iterations)
+            if status == "infeasible":
+                for scenario in pending:
+                    results.record(scenario, "infeasible", None, None, 0)
+                break
+            continue
+
+        factor = BasisFactorization(layout.matrix, layout.basis)
+        padded = np.zeros((layout.matrix.shape[1], len(pending)))
+        padded[:matrix.shape[1]] = costs_batch[pending].T
+        duals = factor.lu.solve(np.ascontiguousarray(padded[layout.basis]), trans="T")
+        if duals.ndim == 1:
+            duals = duals[:, None]
+        reduced = padded - layout.matrix.T @ duals
+        optimal = np.all(reduced[layout.allowed] >= -EPSILON, axis=0)
+
+        solver = layout.solver(rhs, costs_batch[pending[0]])
+        values = layout.full_values(factor.ftran(solver.rhs))
+        for position in np.flatnonzero(optimal):
+            results.record(pending[position], "optimal", values, padded[:, position], 0)
+        pending = [scenario for scenario, ok in zip(pending, optimal) if not ok]
+        if not pending:
+            break
+
+        scenario = pending.pop(0)
+        solver = layout.solver(rhs, costs_batch[scenario])
+        status, basis, values = solver.primal(solver.costs, layout.basis.copy(), layout.allowed)
+        results.record(scenario, status, values, solver.costs, solver.iterations)
+        if status == "optimal":
+            layout.basis = basis
+
+    return results.as_dict()
@@ -0,0 +1,145 @@
+import os
+import pickle
+import sqlite3
+import threading
+import time
+
+MAX_BYTES = 256 * 1024 * 1024
+MAX_AGE_SECONDS = 30 * 24 * 3600
+BUSY_TIMEOUT_SECONDS = 30.0
+_MISSING = object()
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS solutions (
+    key TEXT PRIMARY KEY,
+    payload BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL
+)
+"""
+
+
+class DiskSolveCache:
+    """
+    Caché persistente de soluciones en SQLite, compartida entre procesos.
+
+    Tiene la misma interfaz que SolveCache (get/put/clear/stats) y usa como
+    clave la huella de problem_fingerprint. La base usa modo WAL para que
+    varios lectores convivan con un escritor; las entradas más viejas que
+    `max_age_seconds` se descartan y, si el total supera `max_bytes`, se
+    eliminan las usadas hace más tiempo. `memory` es una caché opcional en
+    memoria que se consulta antes que el disco; sus entradas guardan la
+    fecha de creación y vencen con la misma antigüedad.
+    """
+
+    def __init__(self, path, max_bytes=MAX_BYTES, max_age_seconds=MAX_AGE_SECONDS, memory=None):
+        self.path = os.fspath(path)
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.memory = memory
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._connection = None
+        self._pid = None
+
+    def _connect(self):
+        # Una conexión por proceso: las conexiones SQLite no sobreviven a fork().
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT_SECONDS, check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(SCHEMA)
+            connection.execute("CREATE INDEX IF NOT EXISTS solutions_accessed ON solutions (accessed)")
+            connection.commit()
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def get(self, key, default=None):
+        now = time.time()
+        if self.memory is not None:
+            # La memoria guarda (created, valor) para aplicar la misma antigüedad que el disco.
+            entry = self.memory.get(key, _MISSING)
+            if entry is not _MISSING and now - entry[0] <= self.max_age_seconds:
+                with self._lock:
+                    self.hits += 1
+                return entry[1]
+
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute("SELECT payload, created FROM solutions WHERE key = ?", (key,)).fetchone()
+            if row is not None and now - row[1] > self.max_age_seconds:
+                connection.execute("DELETE FROM solutions WHERE key = ?", (key,))
+                connection.commit()
+                row = None
+            if row is None:
+                self.misses += 1
+                return default
+            connection.execute("UPDATE solutions SET accessed = ? WHERE key = ?", (now, key))
+            connection.commit()
+            self.hits += 1
+
+        value = pickle.loads(row[0])
+        if self.memory is not None:
+            self.memory.put(key, (row[1], value))
+        return value
+
+    def put(self, key, value):
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+        if self.memory is not None:
+            self.memory.put(key, (now, value))
+        if len(payload) > self.max_bytes:
+            return
+
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO solutions (key, payload, size, created, accessed) VALUES (?, ?, ?, ?, ?)",
+                    (key, payload, len(payload), now, now),
+                )
+                connection.execute("DELETE FROM solutions WHERE created < ?", (now - self.max_age_seconds,))
+                self._evict(connection)
+
+    def _evict(self, connection):
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM solutions").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        victims = []
+        for key, size in connection.execute("SELECT key, size FROM solutions ORDER BY accessed"):
+            if total <= self.max_bytes:
+                break
+            victims.append((key,))
+            total -= size
+        connection.executemany("DELETE FROM solutions WHERE key = ?", victims)
+
+    def __contains__(self, key):
+        with self._lock:
+            row = self._connect().execute("SELECT created FROM solutions WHERE key = ?", (key,)).fetchone()
+        return row is not None and time.time() - row[0] <= self.max_age_seconds
+
+    def __len__(self):
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
+
+    def clear(self):
+        if self.memory is not None:
+            self.memory.clear()
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("DELETE FROM solutions")
+
+    def stats(self):
+        with self._lock:
+            entries, size = self._connect().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM solutions").fetchone()
+            return {"entries": entries, "bytes": size, "hits": self.hits, "misses": self.misses}
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
@@ -0,0 +1,107 @@
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+# Ruta de un archivo JSON Lines; si está definida la interfaz instrumenta cada cálculo.
+SINK_ENVIRONMENT_VARIABLE = "CALCULADORA_INSTRUMENTACION"
+# Con valor "1" además se mide la memoria asignada por etapa (tracemalloc, más lento).
+ALLOCATIONS_ENVIRONMENT_VARIABLE = "CALCULADORA_INSTRUMENTACION_MEMORIA"
+
+
+class JsonlSink:
+    """Agrega un registro JSON por línea a `path`; se puede compartir entre hilos."""
+
+    def __init__(self, path):
+        self.path = path
+        self.lock = threading.Lock()
+
+    def write(self, record):
+        line = json.dumps(record, ensure_ascii=False, default=float) + "\n"
+        with self.lock, open(self.path, "a", encoding="utf-8") as stream:
+            stream.write(line)
+
+
+class Instrumentation:
+    """
+    Tiempos y contadores por etapa de un cálculo (opcional).
+
+    `stage(nombre)` mide el tiempo de reloj y de CPU del bloque y, con
+    `track_allocations`, la memoria asignada (tracemalloc). Si una etapa se
+    repite los valores se acumulan y `calls` cuenta las veces. `count`
+    suma contadores sueltos (pivoteos, aciertos de caché...). Quien crea
+    la instancia la pasa a TwoPhaseMethodModel.solve(instrumentation=...)
+    y al final llama a `emit()` para escribirla en el sink.
+    """
+
+    def __init__(self, sink=None, track_allocations=False, **context):
+        self.sink = sink
+        self.track_allocations = track_allocations
+        self.context = context
+        self.stages = {}
+        self.counters = {}
+        # Pico de memoria de cada etapa abierta (de afuera hacia adentro).
+        self._peaks = []
+
+    @contextmanager
+    def stage(self, name):
+        if self.track_allocations:
+            started = not tracemalloc.is_tracing()
+            if started:
+                tracemalloc.start()
+            allocated_before, peak = tracemalloc.get_traced_memory()
+            # reset_peak() también borra el pico de la etapa que contiene a esta: se guarda antes.
+            if self._peaks:
+                self._peaks[-1] = max(self._peaks[-1], peak)
+            tracemalloc.reset_peak()
+            self._peaks.append(0)
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield self
+        finally:
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            totals = self.stages.setdefault(name, {"wall_ms": 0.0, "cpu_ms": 0.0, "calls": 0})
+            totals["wall_ms"] += wall * 1000
+            totals["cpu_ms"] += cpu * 1000
+            totals["calls"] += 1
+            if self.track_allocations:
+                current, peak = tracemalloc.get_traced_memory()
+                peak = max(peak, self._peaks.pop())
+                if self._peaks:
+                    self._peaks[-1] = max(self._peaks[-1], peak)
+                totals["allocated_kb"] = totals.get("allocated_kb", 0.0) + (current - allocated_before) / 1024
+                totals["peak_kb"] = max(totals.get("peak_kb", 0.0), (peak - allocated_before) / 1024)
+                if started:
+                    tracemalloc.stop()
+
+    def count(self, name, value=1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def as_dict(self):
+        return {
+            "stages": {name: dict(totals) for name, totals in self.stages.items()},
+            "counters": dict(self.counters),
+        }
+
+    def emit(self, **extra):
+        """Escribe el registro en el sink (si hay) y lo retorna."""
+        record = {**self.context, **extra, **self.as_dict()}
+        if self.sink is not None:
+            self.sink.write(record)
+        return record
+
+
+def optional_stage(instrumentation, name):
+    """instrumentation.stage(name), o un contexto vacío si no hay instrumentación."""
+    return nullcontext() if instrumentation is None else instrumentation.stage(name)
+
+
+def instrumentation_from_environment(**context):
+    """Instrumentation con JsonlSink si la variable de entorno está definida; si no, None."""
+    path = os.environ.get(SINK_ENVIRONMENT_VARIABLE)
+    if not path:
+        return None
+    track_allocations = os.environ.get(ALLOCATIONS_ENVIRONMENT_VARIABLE) == "1"
+    return Instrumentation(JsonlSink(path), track_allocations, **context)
@@ -0,0 +1,264 @@
+import numpy as np
+from scipy.linalg import LinAlgError, cho_factor, cho_solve, qr
+from scipy.linalg.blas import dsyrk
+
+TOLERANCE = 1e-8
+MAX_ITERATIONS = 100
+STEP_FRACTION = 0.995
+# Más allá de esta norma se considera que las iteraciones divergen (infactible o no acotado).
+DIVERGENCE_LIMIT = 1e12
+# Se corta si el error crece este factor respecto del mejor punto visto.
+DIVERGENCE_FACTOR = 1e4
+CROSSOVER_TOLERANCE = 1e-6
+RANK_TOLERANCE = 1e-9
+MIN_WEIGHT = 1e-6
+SCALING_PASSES = 8
+
+
+def independent_rows(matrix, tolerance=RANK_TOLERANCE):
+    """Índices (ordenados) de un conjunto máximo de filas linealmente independientes."""
+    _, order, rank = _pivoted_rank(matrix.T, tolerance)
+    return np.sort(order[:rank])
+
+
+def _pivoted_rank(matrix, tolerance=RANK_TOLERANCE):
+    """(Q, orden de pivoteo, rango) de un QR con pivoteo de columnas."""
+    if not matrix.shape[1]:
+        return np.zeros((matrix.shape[0], 0)), np.arange(0), 0
+    q, r, order = qr(matrix, mode="economic", pivoting=True)
+    diagonal = np.abs(np.diag(r))
+    return q, order, int(np.count_nonzero(diagonal > tolerance * max(diagonal[0], 1.0)))
+
+
+def push_to_vertex(matrix, x, tolerance=TOLERANCE):
+    """
+    Lleva un punto factible de A x = b, x >= 0 a un vértice sin cambiar A x.
+
+    Mientras las columnas con x_j > 0 sean linealmente dependientes se
+    toma una combinación nula d de ellas y se avanza sobre x + t d hasta
+    que alguna componente llega a cero. Si x es óptimo, c d = 0 sobre la
+    cara óptima y el vértice también lo es. Retorna (x, soporte, Q), con Q
+    una base ortonormal del espacio generado por las columnas del soporte.
+    """
+    x = np.where(x > tolerance * (1.0 + np.abs(x).max(initial=0.0)), x, 0.0)
+    support = np.flatnonzero(x)
+    while True:
+        columns = matrix[:, support]
+        q, order, rank = _pivoted_rank(columns)
+        if rank == support.size:
+            return x, support, q
+        independent, dependent = order[:rank], order[rank]
+        direction = np.zeros(support.size)
+        direction[dependent] = 1.0
+        direction[independent] = -np.linalg.lstsq(columns[:, independent], columns[:, dependent], rcond=None)[0]
+        if not (direction < 0).any():
+            direction = -direction
+        decreasing = direction < 0
+        ratios = x[support][decreasing] / -direction[decreasing]
+        values = x[support] + ratios.min() * direction
+        values[np.flatnonzero(decreasing)[np.argmin(ratios)]] = 0.0
+        x[support] = np.maximum(values, 0.0)
+        support = support[x[support] > tolerance * (1.0 + x.max())]
+        x[np.setdiff1d(np.flatnonzero(x), support)] = 0.0
+
+
+def crossover_basis(matrix, x, s):
+    """
+    Base óptima (o casi) a partir de un punto interior casi óptimo.
+
+    Primero se lleva x a un vértice (push_to_vertex): sus columnas positivas
+    son básicas. La base se completa con las columnas, independientes de
+    las anteriores, de mayor x_j / s_j (las de costo reducido más chico),
+    así el simplex que la limpia necesita pocos pivoteos. `matrix` debe
+    tener rango completo por filas.
+    """
+    _, support, q = push_to_vertex(matrix, x)
+    if support.size == matrix.shape[0]:
+        return support.astype(np.intp)
+    rest = np.setdiff1d(np.arange(matrix.shape[1]), support)
+    projected = matrix[:, rest] - q @ (q.T @ matrix[:, rest])
+    # Los pesos solo ordenan preferencias: acotarlos evita que una columna
+    # independiente de peso ínfimo pierda frente al redondeo de una dependiente.
+    weights = x[rest] / np.maximum(s[rest], np.finfo(float).tiny)
+    weights = np.clip(weights / max(weights.max(initial=0.0), np.finfo(float).tiny), MIN_WEIGHT, 1.0)
+    _, order, _ = _pivoted_rank(projected * weights)
+    completion = rest[order[:matrix.shape[0] - support.size]]
+    return np.concatenate([support, completion]).astype(np.intp)
+
+
+class InteriorPointSolver:
+    """
+    Método primal-dual de punto interior (predictor-corrector de Mehrotra).
+
+    Resuelve min c x, A x = b, x >= 0 con A densa de rango completo por
+    filas. Cada iteración factoriza una vez las ecuaciones normales
+    A (X/S) A^T con Cholesky y las usa para el paso afín y el corrector.
+    La cantidad de iteraciones casi no crece con el tamaño del problema.
+    Retorna "optimal" con (x, y, s) o "failed" si no converge (el caso de
+    los problemas infactibles o no acotados); en ese caso quien llama
+    decide el estado con el simplex. Sin filas retorna "optimal" en x = 0
+    o "unbounded" si algún costo es negativo.
+
+    Antes de iterar se equilibran filas y columnas (Ruiz) y se normalizan b
+    y c: con coeficientes de magnitudes muy distintas las ecuaciones
+    normales pierden precisión y la factibilidad primal se estanca. Las
+    columnas con un solo coeficiente (holguras) no pasan por el producto
+    A (X/S) A^T: su aporte va directo a la diagonal.
+    """
+
+    def __init__(self, matrix, rhs, costs, tolerance=TOLERANCE, max_iterations=MAX_ITERATIONS, on_iteration=None):
+        matrix = np.asarray(matrix, dtype=float)
+        self.row_scale, self.column_scale = _equilibrate(matrix)
+        scaled = matrix * self.row_scale[:, None] * self.column_scale
+        rhs = np.asarray(rhs, dtype=float) * self.row_scale
+        costs = np.asarray(costs, dtype=float) * self.column_scale
+        self.rhs_scale = max(np.abs(rhs).max(initial=0.0), 1.0)
+        self.costs_scale = max(np.abs(costs).max(initial=0.0), 1.0)
+        self.matrix = scaled
+        self.rhs = rhs / self.rhs_scale
+        self.costs = costs / self.costs_scale
+
+        nonzeros = np.count_nonzero(scaled, axis=0)
+        singleton = np.flatnonzero(nonzeros == 1)
+        self.general_columns = np.flatnonzero(nonzeros != 1)
+        self.general_matrix = np.ascontiguousarray(scaled[:, self.general_columns])
+        self.singleton_columns = singleton
+        # Sin filas (el presolve puede eliminarlas todas) no hay columnas con un coeficiente.
+        self.singleton_rows = np.argmax(scaled[:, singleton] != 0, axis=0) if scaled.shape[0] else singleton
+        self.singleton_squares = scaled[self.singleton_rows, singleton] ** 2
+
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.on_iteration = on_iteration
+        self.iterations = 0
+
+    def solve(self):
+        matrix, rhs, costs = self.matrix, self.rhs, self.costs
+        if not matrix.shape[0]:
+            # Sin restricciones el óptimo es x = 0 salvo que algún costo sea negativo.
+            x = np.zeros(costs.size)
+            return self._result("unbounded" if (costs < 0).any() else "optimal", x, np.zeros(0), costs.copy())
+        x, y, s = self._starting_point()
+        rhs_norm = 1.0 + np.linalg.norm(rhs)
+        costs_norm = 1.0 + np.linalg.norm(costs)
+
+        best = (np.inf, x, y, s)
+        for self.iterations in range(self.max_iterations + 1):
+            primal_residual = matrix @ x - rhs
+            dual_residual = matrix.T @ y + s - costs
+            primal_objective, dual_objective = costs @ x, rhs @ y
+            error = max(
+                np.linalg.norm(primal_residual) / rhs_norm,
+                np.linalg.norm(dual_residual) / costs_norm,
+                abs(primal_objective - dual_objective) / (1.0 + abs(primal_objective)),
+            )
+            if error < best[0]:
+                best = (error, x, y, s)
+            if error <= self.tolerance:
+                return self._result("optimal", x, y, s)
+            if (
+                self.iterations == self.max_iterations
+                or error > DIVERGENCE_FACTOR * best[0]
+                or max(np.abs(x).max(), np.abs(y).max(initial=0.0)) > DIVERGENCE_LIMIT
+            ):
+                break
+
+            scaling = x / s
+            factor = self._factor(scaling)
+            if factor is None:
+                break
+            mu = x @ s / x.size
+
+            dx, dy, ds = self._direction(factor, scaling, x, s, primal_residual, dual_residual, x * s)
+            primal_step, dual_step = self._step(x, dx, 1.0), self._step(s, ds, 1.0)
+            affine_mu = (x + primal_step * dx) @ (s + dual_step * ds) / x.size
+            centering = (affine_mu / mu) ** 3
+
+            complementarity = x * s + dx * ds - centering * mu
+            dx, dy, ds = self._direction(factor, scaling, x, s, primal_residual, dual_residual, complementarity)
+            primal_step, dual_step = self._step(x, dx, STEP_FRACTION), self._step(s, ds, STEP_FRACTION)
+            x = x + primal_step * dx
+            y = y + dual_step * dy
+            s = s + dual_step * ds
+            if self.on_iteration is not None:
+                self.on_iteration(self.iterations + 1, self.costs_scale * self.rhs_scale * (costs @ x))
+
+        # Al final la precisión suele estancarse por el redondeo; para elegir la
+        # base del crossover alcanza con el mejor punto si está cerca del óptimo.
+        error, x, y, s = best
+        return self._result("optimal" if error <= CROSSOVER_TOLERANCE else "failed", x, y, s)
+
+    def _starting_point(self):
+        """Punto inicial de Mehrotra: mínimos cuadrados desplazados al interior."""
+        matrix = self.matrix
+        factor = self._factor(np.ones(matrix.shape[1]))
+        if factor is None:
+            raise LinAlgError("La matriz de restricciones no tiene rango completo por filas")
+        x = matrix.T @ cho_solve(factor, self.rhs)
+        y = cho_solve(factor, matrix @ self.costs)
+        s = self.costs - matrix.T @ y
+        x += max(-1.5 * x.min(), 0.0)
+        s += max(-1.5 * s.min(), 0.0)
+        product = x @ s
+        x += 0.5 * product / max(s.sum(), np.finfo(float).tiny) + np.finfo(float).eps
+        s += 0.5 * product / max(x.sum(), np.finfo(float).tiny) + np.finfo(float).eps
+        return x, y, s
+
+    def _factor(self, scaling):
+        """Cholesky (triángulo superior) de A diag(scaling) A^T."""
+        if self.general_columns.size:
+            weighted = self.general_matrix * np.sqrt(scaling[self.general_columns])
+            # dsyrk calcula solo un triángulo; la transpuesta es contigua en orden Fortran y no se copia.
+            normal_matrix = dsyrk(1.0, weighted.T, trans=1)
+        else:
+            normal_matrix = np.zeros((self.matrix.shape[0], self.matrix.shape[0]))
+        diagonal = np.einsum("ii->i", normal_matrix)
+        np.add.at(diagonal, self.singleton_rows, self.singleton_squares * scaling[self.singleton_columns])
+        # Cerca del óptimo X/S abarca muchos órdenes de magnitud; una pequeña
+        # regularización de la diagonal mantiene la factorización estable.
+        regularization = 1e-14 * max(diagonal.max(initial=0.0), 1.0)
+        for _ in range(6):
+            diagonal += regularization
+            try:
+                return cho_factor(normal_matrix, lower=False)
+            except LinAlgError:
+                regularization *= 100.0
+        return None
+
+    def _direction(self, factor, scaling, x, s, primal_residual, dual_residual, complementarity):
+        """Resuelve el sistema de Newton eliminando dx y ds (ecuaciones normales)."""
+        dy = cho_solve(factor, -primal_residual + self.matrix @ (complementarity / s - scaling * dual_residual))
+        ds = -dual_residual - self.matrix.T @ dy
+        dx = -complementarity / s - scaling * ds
+        return dx, dy, ds
+
+    def _step(self, values, direction, fraction):
+        """Mayor paso en [0, 1] que mantiene values + paso * direction > 0."""
+        decreasing = direction < 0
+        if not decreasing.any():
+            return 1.0
+        return min(1.0, fraction * float(np.min(-values[decreasing] / direction[decreasing])))
+
+    def _result(self, status, x, y, s):
+        """Deshace el escalado: retorna x, y, s del problema original."""
+        return {
+            "status": status,
+            "x": x * self.column_scale * self.rhs_scale,
+            "y": y * self.row_scale * self.costs_scale,
+            "s": s / self.column_scale * self.costs_scale,
+            "iterations": self.iterations,
+        }
+
+
+def _equilibrate(matrix, passes=SCALING_PASSES):
+    """Escalas de filas y columnas (Ruiz) que llevan el máximo de cada una cerca de 1."""
+    rows = np.ones(matrix.shape[0])
+    columns = np.ones(matrix.shape[1])
+    magnitudes = np.abs(matrix)
+    for _ in range(passes):
+        scaled = magnitudes * rows[:, None] * columns
+        row_max = scaled.max(axis=1, initial=0.0)
+        column_max = scaled.max(axis=0, initial=0.0)
+        rows /= np.sqrt(np.where(row_max > 0, row_max, 1.0))
+        columns /= np.sqrt(np.where(column_max > 0, column_max, 1.0))
+    return rows, columns
@@ -0,0 +1,89 @@
+import numpy as np
+from scipy import sparse
+
+from model.standard_form import mirror_relations
+
+INEQUALITY = "ub"
+EQUALITY = "eq"
+BOUND = "bound"
+EMPTY = "empty"
+
+
+def _row_counts(matrix):
+    if sparse.issparse(matrix):
+        matrix = sparse.csr_matrix(matrix)
+        matrix.eliminate_zeros()
+        return np.diff(matrix.indptr)
+    return np.count_nonzero(matrix, axis=1)
+
+
+def _singleton_entries(matrix, rows):
+    if sparse.issparse(matrix):
+        matrix = sparse.csr_matrix(matrix)
+        matrix.eliminate_zeros()
+        starts = matrix.indptr[rows]
+        return matrix.indices[starts], matrix.data[starts]
+    cols = np.argmax(matrix[rows] != 0, axis=1)
+    return cols, matrix[rows, cols]
+
+
+def classify_constraints(matrix, relations, rhs):
+    """
+    Clasifica cada restricción antes de armar el problema.
+
+    Las filas con una sola variable son cotas, las filas vacías que se
+    cumplen siempre se descartan y las demás quedan como desigualdades o
+    igualdades. Una fila vacía imposible se conserva para que el solver
+    reporte la infactibilidad.
+    """
+    relations = np.asarray(relations)
+    rhs = np.asarray(rhs, dtype=float)
+    counts = _row_counts(matrix)
+    kinds = np.where(relations == "=", EQUALITY, INEQUALITY).astype(object)
+    kinds[counts == 1] = BOUND
+
+    satisfied = np.where(relations == "<=", rhs >= 0, np.where(relations == ">=", rhs <= 0, rhs == 0))
+    kinds[(counts == 0) & satisfied] = EMPTY
+    return kinds
+
+
+def build_linprog_form(matrix, relations, rhs, num_vars=None):
+    """
+    Arma los argumentos A_ub/b_ub, A_eq/b_eq y bounds para linprog.
+
+    Las igualdades van a A_eq sin duplicarse en dos desigualdades, las
+    filas ">=" se niegan una sola vez y las restricciones de una variable se
+    convierten en cotas (por defecto x >= 0).
+    """
+    relations = np.asarray(relations)
+    rhs = np.asarray(rhs, dtype=float)
+    num_vars = matrix.shape[1] if num_vars is None else num_vars
+    kinds = classify_constraints(matrix, relations, rhs)
+
+    inequality_rows = np.flatnonzero(kinds == INEQUALITY)
+    equality_rows = np.flatnonzero(kinds == EQUALITY)
+    signs = np.where(relations[inequality_rows] == ">=", -1.0, 1.0)
+
+    if sparse.issparse(matrix):
+        matrix = sparse.csr_matrix(matrix)
+        A_ub = sparse.diags(signs) @ matrix[inequality_rows] if inequality_rows.size else None
+    else:
+        A_ub = matrix[inequality_rows] * signs[:, None] if inequality_rows.size else None
+    b_ub = rhs[inequality_rows] * signs if inequality_rows.size else None
+    A_eq = matrix[equality_rows] if equality_rows.size else None
+    b_eq = rhs[equality_rows] if equality_rows.size else None
+
+    bounds = np.zeros((num_vars, 2))
+    bounds[:, 1] = np.inf
+    bound_rows = np.flatnonzero(kinds == BOUND)
+    if bound_rows.size:
+        cols, coeffs = _singleton_entries(matrix, bound_rows)
+        values = rhs[bound_rows] / coeffs
+        row_relations = relations[bound_rows]
+        row_relations = np.where(coeffs < 0, mirror_relations(row_relations), row_relations)
+        upper = row_relations != ">="
+        lower = row_relations != "<="
+        np.minimum.at(bounds[:, 1], cols[upper], values[upper])
+        np.maximum.at(bounds[:, 0], cols[lower], values[lower])
+
+    return {"A_ub": A_ub, "b_ub": b_ub, "A_eq": A_eq, "b_eq": b_eq, "bounds": bounds}
@@ -0,0 +1,200 @@
+"""
+Resolución de muchos modelos independientes en un pool de procesos.
+
+Las matrices grandes se copian una sola vez a multiprocessing.shared_memory
+y los procesos las leen desde ahí, en vez de recibirlas serializadas con
+cada tarea. Si varios problemas usan el mismo objeto matriz (un barrido de
+lados derechos u objetivos), comparten también el bloque de memoria.
+"""
+import os
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+
+import numpy as np
+from scipy import sparse
+
+SHARE_MIN_BYTES = 256 * 1024
+MAX_ATTACHED = 8
+ALIGNMENT = 64
+
+# Bloques abiertos en cada proceso del pool: nombre -> SharedMemory.
+_attached = OrderedDict()
+
+
+def _matrix_arrays(matrix):
+    """Retorna (tipo, arreglos, forma) de una matriz densa, CSR o CSC."""
+    if sparse.issparse(matrix):
+        layout = "csc" if matrix.format == "csc" else "csr"
+        matrix = matrix.asformat(layout)
+        return layout, (matrix.data, matrix.indices, matrix.indptr), matrix.shape
+    matrix = np.asarray(matrix, dtype=float)
+    return "dense", (matrix,), matrix.shape
+
+
+class SharedMatrix:
+    """
+    Matriz copiada a un bloque de memoria compartida.
+
+    Lo que viaja a los procesos es `descriptor`: el nombre del bloque y la
+    posición, forma y tipo de cada arreglo. El proceso que la crea debe
+    llamar a `release()` cuando ninguna tarea la use.
+    """
+
+    def __init__(self, matrix):
+        layout, arrays, shape = _matrix_arrays(matrix)
+        offsets, position = [], 0
+        for array in arrays:
+            offsets.append(position)
+            position += -(-array.nbytes // ALIGNMENT) * ALIGNMENT
+        self.memory = shared_memory.SharedMemory(create=True, size=max(position, 1))
+        fields = []
+        for array, offset in zip(arrays, offsets):
+            view = np.ndarray(array.shape, dtype=array.dtype, buffer=self.memory.buf, offset=offset)
+            view[...] = array
+            fields.append((offset, array.shape, array.dtype.str))
+        self.descriptor = ("shared", self.memory.name, layout, shape, tuple(fields))
+
+    def release(self):
+        self.memory.close()
+        self.memory.unlink()
+
+
+def _attach(name):
+    memory = _attached.pop(name, None)
+    if memory is None:
+        # Los workers solo cierran su vista; el bloque lo borra quien lo creó.
+        memory = shared_memory.SharedMemory(name=name)
+        while len(_attached) >= MAX_ATTACHED:
+            _attached.popitem(last=False)[1].close()
+    _attached[name] = memory
+    return memory
+
+
+def _resolve_matrix(matrix):
+    """En el worker, reconstruye la matriz (sin copiar) a partir de su descriptor."""
+    if not (isinstance(matrix, tuple) and matrix and matrix[0] == "shared"):
+        return matrix
+    _, name, layout, shape, fields = matrix
+    memory = _attach(name)
+    arrays = []
+    for offset, array_shape, dtype in fields:
+        array = np.ndarray(array_shape, dtype=np.dtype(dtype), buffer=memory.buf, offset=offset)
+        array.flags.writeable = False
+        arrays.append(array)
+    if layout == "dense":
+        return arrays[0]
+    constructor = sparse.csc_matrix if layout == "csc" else sparse.csr_matrix
+    return constructor(tuple(arrays), shape=shape, copy=False)
+
+
+def _solve_one(problem, keep_tableaus):
+    from model.two_phase_model import TwoPhaseMethodModel
+
+    model = TwoPhaseMethodModel.from_arrays(
+        problem.get("opt_type", "Maximizar"),
+        problem["objective"],
+        _resolve_matrix(problem["matrix"]),
+        problem["relations"],
+        problem["rhs"],
+        backend=problem.get("backend", "revised"),
+        presolve=problem.get("presolve", False),
+    )
+    result = model.solve()
+    if isinstance(result, dict) and not keep_tableaus:
+        result["phase1_tableaus"] = []
+        result["phase2_tableaus"] = []
+    return result
+
+
+def _worker_initializer():
+    from model.two_phase_model import TwoPhaseMethodModel
+
+    # Los problemas de un barrido no se repiten: la caché solo agregaría serialización.
+    TwoPhaseMethodModel.cache = None
+
+
+def solve_parallel(problems, processes=None, ordered=True, max_in_flight=None, keep_tableaus=False, share_min_bytes=SHARE_MIN_BYTES):
+    """
+    Resuelve `problems` en paralelo y produce (índice, resultado) a medida que terminan.
+
+    Cada problema es un diccionario con "objective", "matrix" (densa o
+    scipy.sparse), "relations", "rhs" y opcionalmente "opt_type",
+    "backend" (por defecto "revised") y "presolve". `problems` puede ser un
+    generador: se consume de a poco y nunca hay más de `max_in_flight`
+    problemas enviados o resultados esperando (por defecto 2 por proceso).
+    Con `ordered` los resultados salen en el orden de entrada; si no, en el
+    orden en que terminan. Las matrices de al menos `share_min_bytes` van
+    por memoria compartida. Los resultados son los de
+    TwoPhaseMethodModel.solve; sin `keep_tableaus` se omiten los tableaus.
+    """
+    processes = processes or os.cpu_count() or 1
+    max_in_flight = max_in_flight or 2 * processes
+    shared = {}
+    users = {}
+    # Bloques sin tareas en curso; se conservan (hasta MAX_ATTACHED) por si
+    # llegan más problemas con la misma matriz.
+    idle = OrderedDict()
+    pending = {}
+    finished = {}
+    next_index = 0
+    source = enumerate(problems)
+    exhausted = False
+
+    def share(problem):
+        matrix = problem["matrix"]
+        arrays = _matrix_arrays(matrix)[1]
+        if sum(array.nbytes for array in arrays) < share_min_bytes:
+            return problem, None
+        key = id(matrix)
+        if key not in shared:
+            shared[key] = (SharedMatrix(matrix), matrix)
+            users[key] = 0
+        idle.pop(key, None)
+        users[key] += 1
+        return {**problem, "matrix": shared[key][0].descriptor}, key
+
+    def done_with(key):
+        if key is None:
+            return
+        users[key] -= 1
+        if users[key] == 0:
+            idle[key] = None
+            while len(idle) > MAX_ATTACHED:
+                oldest, _ = idle.popitem(last=False)
+                shared.pop(oldest)[0].release()
+                del users[oldest]
+
+    with ProcessPoolExecutor(max_workers=processes, initializer=_worker_initializer) as executor:
+        try:
+            while True:
+                while not exhausted and len(pending) + len(finished) < max_in_flight:
+                    try:
+                        index, problem = next(source)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    task, key = share(problem)
+                    pending[executor.submit(_solve_one, task, keep_tableaus)] = (index, key)
+                if not pending and not finished:
+                    return
+
+                if pending:
+                    completed, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in completed:
+                        index, key = pending.pop(future)
+                        done_with(key)
+                        finished[index] = future.result()
+
+                if ordered:
+                    while next_index in finished:
+                        yield next_index, finished.pop(next_index)
+                        next_index += 1
+                else:
+                    for index in list(finished):
+                        yield index, finished.pop(index)
+        finally:
+            for future in pending:
+                future.cancel()
+            for block, _ in shared.values():
+                block.release()
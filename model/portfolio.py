@@ -0,0 +1,115 @@
+import math
+import queue
+import threading
+import time
+
+import numpy as np
+from scipy import sparse
+
+from model.solve_progress import SolveCancelled
+
+# Orden de arranque por defecto; PortfolioStats lo reordena según quién viene ganando.
+PORTFOLIO_BACKENDS = ("highs-ds", "highs-ipm", "revised")
+VERIFY_TOLERANCE = 1e-6
+CONCLUSIVE_MESSAGES = ("El problema no tiene solución factible.", "El problema no está acotado.")
+
+
+def size_class(matrix):
+    """Clase de tamaño de un problema: filas y columnas redondeadas a potencias de 2 y densidad."""
+    rows, cols = matrix.shape
+    nonzeros = matrix.nnz if sparse.issparse(matrix) else np.count_nonzero(matrix)
+    density = nonzeros / max(rows * cols, 1)
+    bucket = lambda value: 2 ** math.ceil(math.log2(max(value, 1)))
+    return f"{bucket(rows)}x{bucket(cols)}/{'dense' if density > 0.1 else 'sparse'}"
+
+
+class PortfolioStats:
+    """
+    Victorias y tiempos de cada backend del portafolio por clase de tamaño.
+
+    Se comparte entre hilos. `ranking` ordena los backends por victorias
+    para que el favorito arranque primero; quien quiera despachar a un
+    solo backend puede consultar `as_dict()`.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.records = {}
+
+    def record(self, size, winner, seconds):
+        with self.lock:
+            entry = self.records.setdefault(size, {}).setdefault(winner, {"wins": 0, "seconds": 0.0})
+            entry["wins"] += 1
+            entry["seconds"] += seconds
+
+    def ranking(self, size, backends=PORTFOLIO_BACKENDS):
+        with self.lock:
+            wins = {name: entry["wins"] for name, entry in self.records.get(size, {}).items()}
+        return sorted(backends, key=lambda name: -wins.get(name, 0))
+
+    def as_dict(self):
+        with self.lock:
+            return {size: {name: dict(entry) for name, entry in entries.items()} for size, entries in self.records.items()}
+
+
+def verify_feasible_value(costs, matrix, relations, rhs, solution, tolerance=VERIFY_TOLERANCE):
+    """
+    Comprueba que X cumple x >= 0 y A x (relación) b, y que c x coincide con Z.
+
+    No certifica optimalidad (no hay duales que revisar): descarta
+    resultados corruptos o infactibles, no un óptimo que no lo sea.
+    """
+    x = np.asarray(solution["X"], dtype=float)
+    if x.shape != (matrix.shape[1],) or not np.all(np.isfinite(x)) or np.any(x < -tolerance):
+        return False
+    slack = matrix @ x - rhs
+    allowed = tolerance * (1.0 + np.abs(rhs))
+    feasible = np.where(
+        relations == "<=", slack <= allowed, np.where(relations == ">=", slack >= -allowed, np.abs(slack) <= allowed)
+    )
+    z = solution["Z"]
+    return bool(np.all(feasible)) and abs(float(costs @ x) - z) <= tolerance * (1.0 + abs(z))
+
+
+def race(racers, accept):
+    """
+    Corre cada racer en su propio hilo y retorna (nombre, resultado, segundos, terminados, aceptado).
+
+    `racers` mapea nombre -> función(cancelled) donde `cancelled` es un
+    threading.Event que se activa cuando la carrera termina; los solvers
+    que lo revisan (el propio, vía progreso) se detienen con
+    SolveCancelled y los demás terminan en segundo plano sin que nadie los
+    espere. Gana el primer resultado para el que `accept(nombre, resultado)`
+    es verdadero; si ninguno lo es se retorna el primero que llegó con
+    `aceptado` en False. Un SolveCancelled que no causó la carrera (una
+    cancelación externa) se propaga.
+    """
+    cancelled = threading.Event()
+    results = queue.SimpleQueue()
+    start = time.perf_counter()
+
+    def run(name, function):
+        try:
+            result = function(cancelled)
+        except SolveCancelled as error:
+            result = error
+        except Exception as error:
+            result = f"Error: {str(error)}"
+        results.put((name, result, time.perf_counter() - start))
+
+    for name, function in racers.items():
+        threading.Thread(target=run, args=(name, function), name=f"portfolio-{name}", daemon=True).start()
+
+    finished, first = [], None
+    try:
+        for _ in racers:
+            name, result, seconds = results.get()
+            if isinstance(result, SolveCancelled):
+                raise result
+            finished.append(name)
+            if accept(name, result):
+                return name, result, seconds, finished, True
+            first = first or (name, result, seconds)
+        return (*first, finished, False)
+    finally:
+        cancelled.set()
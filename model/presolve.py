@@ -0,0 +1,331 @@
+import numpy as np
+from scipy import sparse
+
+from model.standard_form import auxiliary_names, mirror_relations
+
+TOLERANCE = 1e-9
+MAX_PASSES = 20
+MIRRORED = {"<=": ">=", ">=": "<=", "=": "="}
+
+
+class PresolveStop(Exception):
+    """Presolve demostró que el problema es infactible."""
+
+
+class PresolvedProblem:
+    """
+    Problema reducido por `presolve` y la información para deshacerlo.
+
+    `variable_indices` son las columnas originales que siguen en el modelo,
+    `row_labels` la fila original de la que proviene cada fila reducida
+    (las cotas se vuelven a escribir como filas con la etiqueta de la
+    restricción que las fijó) y `fixed_values` el valor de las columnas
+    sustituidas.
+    """
+
+    def __init__(self, costs, matrix, relations, rhs):
+        self.original = (matrix, np.asarray(relations), np.asarray(rhs, dtype=float))
+        self.original_costs = np.asarray(costs, dtype=float)
+        self.status = "reduced"
+        self.matrix = None
+        self.relations = None
+        self.rhs = None
+        self.variable_indices = np.arange(matrix.shape[1])
+        self.row_labels = np.arange(matrix.shape[0])
+        self.fixed_values = np.zeros(matrix.shape[1])
+
+    @property
+    def removed_rows(self):
+        return self.original[0].shape[0] - self.row_labels.size
+
+    @property
+    def removed_columns(self):
+        return self.original[0].shape[1] - self.variable_indices.size
+
+    def objective_offset(self, obj_coeffs):
+        """Aporte de las columnas fijadas a la función objetivo dada."""
+        return float(np.asarray(obj_coeffs, dtype=float) @ self.fixed_values)
+
+    def column_names(self):
+        """Nombres (variables, holguras, artificiales) originales para el problema reducido."""
+        _, original_relations, original_rhs = self.original
+        original_slacks, original_artificials = auxiliary_names(original_relations, original_rhs)
+        needed_slacks, needed_artificials = auxiliary_names(self.relations, self.rhs)
+
+        slack_names = self._relabel(needed_slacks, original_slacks, "S")
+        artificial_names = self._relabel(needed_artificials, original_artificials, "R")
+        variable_names = [f"X{col + 1}" for col in self.variable_indices]
+        return variable_names, slack_names, artificial_names
+
+    def _relabel(self, needed, original, prefix):
+        labelled = (needed != "") & (self.row_labels >= 0)
+        names = np.where(labelled, original[self.row_labels], "").astype(object)
+        missing = np.flatnonzero((needed != "") & (names == ""))
+        used = int((original != "").sum())
+        names[missing] = [f"{prefix}{used + number}" for number in range(1, missing.size + 1)]
+        return names
+
+    def postsolve(self, reduced_values):
+        """Lleva la solución del problema reducido a las columnas X1..Xn originales."""
+        values = self.fixed_values.copy()
+        values[self.variable_indices] = reduced_values
+        return values
+
+    def postsolve_columns(self, values):
+        """Valor de cada columna del tableau original (X, S y R) para la solución completa."""
+        matrix, relations, rhs = self.original
+        activity = matrix @ values
+        slack_names, artificial_names = auxiliary_names(relations, rhs)
+        columns = {f"X{col + 1}": float(value) for col, value in enumerate(values)}
+        slack_values = np.abs(rhs - activity)
+        for name, value in zip(slack_names, slack_values):
+            if name:
+                columns[name] = float(value)
+        for name in artificial_names:
+            if name:
+                columns[name] = 0.0
+        return columns
+
+
+class _Presolver:
+    def __init__(self, costs, matrix, relations, rhs):
+        self.matrix = sparse.csr_matrix(matrix, dtype=float)
+        self.matrix.eliminate_zeros()
+        self.matrix.sort_indices()
+        self.relations = np.asarray(relations).astype(object)
+        self.rhs = np.asarray(rhs, dtype=float).copy()
+        self.costs = np.asarray(costs, dtype=float).copy()
+        num_rows, num_cols = self.matrix.shape
+        self.row_ids = np.arange(num_rows)
+        self.col_ids = np.arange(num_cols)
+        self.lower = np.zeros(num_cols)
+        self.upper = np.full(num_cols, np.inf)
+        self.lower_source = np.full(num_cols, -1)
+        self.upper_source = np.full(num_cols, -1)
+        self.fixed_values = np.zeros(num_cols)
+
+    def run(self):
+        for _ in range(MAX_PASSES):
+            changed = self._remove_fixed_columns()
+            changed |= self._remove_small_rows()
+            changed |= self._fix_empty_columns()
+            changed |= self._merge_parallel_rows()
+            changed |= self._remove_dominated_rows()
+            changed |= self._fix_implied_columns()
+            if not changed:
+                break
+
+    def _keep_rows(self, keep):
+        self.matrix = self.matrix[keep]
+        self.relations = self.relations[keep]
+        self.rhs = self.rhs[keep]
+        self.row_ids = self.row_ids[keep]
+
+    def _keep_columns(self, keep):
+        self.matrix = self.matrix[:, keep]
+        for name in ("costs", "col_ids", "lower", "upper", "lower_source", "upper_source"):
+            setattr(self, name, getattr(self, name)[keep])
+
+    def _activity_bounds(self):
+        counts = np.diff(self.matrix.indptr)
+        rows = np.repeat(np.arange(self.matrix.shape[0]), counts)
+        data, cols = self.matrix.data, self.matrix.indices
+        positive = data > 0
+        with np.errstate(invalid="ignore"):
+            low = np.where(positive, data * self.lower[cols], data * self.upper[cols])
+            high = np.where(positive, data * self.upper[cols], data * self.lower[cols])
+        size = self.matrix.shape[0]
+        return np.bincount(rows, low, size), np.bincount(rows, high, size)
+
+    def _remove_fixed_columns(self):
+        fixed = self.upper - self.lower <= TOLERANCE
+        if not fixed.any():
+            return False
+        values = self.lower[fixed]
+        self.rhs -= self.matrix[:, fixed] @ values
+        self.fixed_values[self.col_ids[fixed]] = values
+        self._keep_columns(~fixed)
+        return True
+
+    def _remove_small_rows(self):
+        counts = np.diff(self.matrix.indptr)
+        empty = counts == 0
+        violated = np.where(
+            self.relations == "<=",
+            self.rhs < -TOLERANCE,
+            np.where(self.relations == ">=", self.rhs > TOLERANCE, np.abs(self.rhs) > TOLERANCE),
+        )
+        if (empty & violated).any():
+            raise PresolveStop()
+
+        singletons = np.flatnonzero(counts == 1)
+        starts = self.matrix.indptr[singletons]
+        cols = self.matrix.indices[starts]
+        coeffs = self.matrix.data[starts]
+        values = self.rhs[singletons] / coeffs
+        relations = np.where(coeffs < 0, mirror_relations(self.relations[singletons]), self.relations[singletons])
+        for row, col, value, relation in zip(self.row_ids[singletons], cols, values, relations):
+            if relation != "<=" and value > self.lower[col]:
+                self.lower[col] = value
+                self.lower_source[col] = row
+            if relation != ">=" and value < self.upper[col]:
+                self.upper[col] = value
+                self.upper_source[col] = row
+        self._check_bounds()
+
+        remove = empty | (counts == 1)
+        if not remove.any():
+            return False
+        self._keep_rows(~remove)
+        return True
+
+    def _check_bounds(self):
+        gap = self.lower - self.upper
+        if (gap > TOLERANCE * (1.0 + np.abs(self.upper))).any():
+            raise PresolveStop()
+        crossed = gap > 0
+        self.lower[crossed] = self.upper[crossed]
+
+    def _fix_empty_columns(self):
+        empty = np.diff(sparse.csc_matrix(self.matrix).indptr) == 0
+        to_lower = empty & (self.costs >= 0) & (self.upper > self.lower)
+        to_upper = empty & (self.costs < 0) & np.isfinite(self.upper) & (self.upper > self.lower)
+        if not (to_lower.any() or to_upper.any()):
+            return False
+        self.upper[to_lower] = self.lower[to_lower]
+        self.lower[to_upper] = self.upper[to_upper]
+        return True
+
+    def _merge_parallel_rows(self):
+        self.matrix.sort_indices()
+        groups = {}
+        for row in range(self.matrix.shape[0]):
+            start, end = self.matrix.indptr[row], self.matrix.indptr[row + 1]
+            data = self.matrix.data[start:end]
+            key = (self.matrix.indices[start:end].tobytes(), np.round(data / data[0], 9).tobytes())
+            groups.setdefault(key, []).append(row)
+
+        keep = np.ones(self.matrix.shape[0], dtype=bool)
+        changed = False
+        for rows in groups.values():
+            if len(rows) > 1:
+                changed |= self._merge_group(rows, keep)
+        if changed:
+            self._keep_rows(keep)
+        return changed
+
+    def _merge_group(self, rows, keep):
+        scales = np.array([self.matrix.data[self.matrix.indptr[row]] for row in rows])
+        relations = np.where(scales < 0, mirror_relations(self.relations[rows]), self.relations[rows])
+        values = self.rhs[rows] / scales
+        lows = np.where(relations != "<=", values, -np.inf)
+        highs = np.where(relations != ">=", values, np.inf)
+        low_pos, high_pos = int(np.argmax(lows)), int(np.argmin(highs))
+        low, high = lows[low_pos], highs[high_pos]
+        if low > high + TOLERANCE * (1.0 + abs(high)):
+            raise PresolveStop()
+
+        keep[rows] = False
+        if np.isfinite(low) and np.isfinite(high) and high - low <= TOLERANCE * (1.0 + abs(high)):
+            row = rows[high_pos]
+            keep[row] = True
+            self.relations[row] = "="
+            self.rhs[row] = high * scales[high_pos]
+            return True
+        for position, bound, relation in ((low_pos, low, ">="), (high_pos, high, "<=")):
+            if np.isfinite(bound):
+                row = rows[position]
+                keep[row] = True
+                self.relations[row] = relation if scales[position] > 0 else MIRRORED[relation]
+                self.rhs[row] = bound * scales[position]
+        return True
+
+    def _remove_dominated_rows(self):
+        low, high = self._activity_bounds()
+        margin = TOLERANCE * (1.0 + np.abs(self.rhs))
+        is_le, is_ge = self.relations == "<=", self.relations == ">="
+        infeasible = np.where(is_ge, high < self.rhs - margin, low > self.rhs + margin)
+        infeasible |= (self.relations == "=") & (high < self.rhs - margin)
+        if infeasible.any():
+            raise PresolveStop()
+
+        redundant = (is_le & (high <= self.rhs + margin)) | (is_ge & (low >= self.rhs - margin))
+        if not redundant.any():
+            return False
+        self._keep_rows(~redundant)
+        return True
+
+    def _fix_implied_columns(self):
+        implied_lower = self.lower.copy()
+        implied_upper = self.upper.copy()
+        for sign, rows in ((1.0, self.relations != ">="), (-1.0, self.relations != "<=")):
+            if not rows.any():
+                continue
+            self._tighten(sign, rows, implied_lower, implied_upper)
+
+        span = implied_upper - implied_lower
+        if (span < -TOLERANCE * (1.0 + np.abs(implied_upper))).any():
+            raise PresolveStop()
+        forced = (span <= TOLERANCE) & (self.upper - self.lower > TOLERANCE)
+        if not forced.any():
+            return False
+        self.lower[forced] = self.upper[forced] = np.clip(implied_lower[forced], self.lower[forced], self.upper[forced])
+        return True
+
+    def _tighten(self, sign, rows, implied_lower, implied_upper):
+        """Cotas implícitas de cada variable a partir de las filas escritas como a x <= b."""
+        matrix = sparse.csr_matrix(sparse.diags(np.where(rows, sign, 0.0)) @ self.matrix)
+        matrix.eliminate_zeros()
+        counts = np.diff(matrix.indptr)
+        entry_rows = np.repeat(np.arange(matrix.shape[0]), counts)
+        data, cols = matrix.data, matrix.indices
+        positive = data > 0
+        with np.errstate(invalid="ignore"):
+            low_contrib = np.where(positive, data * self.lower[cols], data * self.upper[cols])
+        row_low = np.bincount(entry_rows, low_contrib, matrix.shape[0])
+        slack = (sign * self.rhs)[entry_rows] - row_low[entry_rows]
+        usable = np.isfinite(slack) & np.isfinite(low_contrib)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            bound = (slack + low_contrib) / data
+        upper_entries = usable & positive
+        lower_entries = usable & ~positive
+        np.minimum.at(implied_upper, cols[upper_entries], bound[upper_entries])
+        np.maximum.at(implied_lower, cols[lower_entries], bound[lower_entries])
+
+    def result(self, problem, dense):
+        bounded_lower = np.flatnonzero(self.lower > TOLERANCE)
+        bounded_upper = np.flatnonzero(np.isfinite(self.upper))
+        num_bounds = bounded_lower.size + bounded_upper.size
+        bound_rows = sparse.csr_matrix(
+            (np.ones(num_bounds), (np.arange(num_bounds), np.concatenate([bounded_lower, bounded_upper]))),
+            shape=(num_bounds, self.matrix.shape[1]),
+        )
+        matrix = sparse.vstack([self.matrix, bound_rows], format="csr")
+
+        problem.matrix = matrix.toarray() if dense else matrix
+        problem.relations = np.concatenate([self.relations, [">="] * bounded_lower.size, ["<="] * bounded_upper.size]).astype(str)
+        problem.rhs = np.concatenate([self.rhs, self.lower[bounded_lower], self.upper[bounded_upper]])
+        problem.row_labels = np.concatenate([self.row_ids, self.lower_source[bounded_lower], self.upper_source[bounded_upper]])
+        problem.variable_indices = self.col_ids
+        problem.fixed_values = self.fixed_values
+        return problem
+
+
+def presolve(costs, matrix, relations, rhs):
+    """
+    Reduce el problema min costs x, matrix x (relations) rhs, x >= 0.
+
+    Elimina filas vacías y paralelas, convierte las filas de una sola
+    variable en cotas, descarta restricciones dominadas por las cotas,
+    fija las variables cuyas cotas implícitas coinciden y sustituye las
+    columnas fijas. Retorna un PresolvedProblem con estado "reduced" o
+    "infeasible".
+    """
+    problem = PresolvedProblem(costs, matrix, relations, rhs)
+    presolver = _Presolver(costs, matrix, relations, rhs)
+    try:
+        presolver.run()
+    except PresolveStop:
+        problem.status = "infeasible"
+        return problem
+    return presolver.result(problem, dense=not sparse.issparse(matrix))
@@ -0,0 +1,242 @@
+import numpy as np
+from scipy.sparse import csc_matrix
+from scipy.sparse.linalg import splu
+
+EPSILON = 1e-9
+FEASIBILITY_TOLERANCE = 1e-7
+MAX_ITERATIONS = 200_000
+DEGENERATE_LIMIT = 50
+REFACTOR_EVERY = 32
+
+
+class BasisFactorization:
+    """
+    Factorización LU dispersa de la base con actualizaciones en forma producto.
+
+    Cada cambio de base agrega una matriz eta en lugar de volver a factorizar;
+    después de `refactor_every` actualizaciones se factoriza de nuevo para
+    acotar el costo de ftran/btran y el error numérico acumulado.
+    """
+
+    def __init__(self, matrix, basis, refactor_every=REFACTOR_EVERY):
+        self.matrix = matrix
+        self.refactor_every = refactor_every
+        self.refactor(basis)
+
+    def refactor(self, basis):
+        basis_matrix = csc_matrix(self.matrix[:, basis])
+        self.lu = splu(basis_matrix, permc_spec="COLAMD")
+        self.etas = []
+
+    @property
+    def needs_refactor(self):
+        return len(self.etas) >= self.refactor_every
+
+    def ftran(self, vector):
+        """Resuelve B y = vector."""
+        result = self.lu.solve(np.asarray(vector, dtype=float))
+        for row, indices, values, pivot_value in self.etas:
+            pivot_entry = result[row] / pivot_value
+            result[indices] -= pivot_entry * values
+            result[row] = pivot_entry
+        return result
+
+    def btran(self, vector):
+        """Resuelve y^T B = vector^T."""
+        result = np.array(vector, dtype=float)
+        for row, indices, values, pivot_value in reversed(self.etas):
+            dot = result[indices] @ values
+            result[row] = (result[row] * (1.0 + pivot_value) - dot) / pivot_value
+        return self.lu.solve(result, trans="T")
+
+    def update(self, row, column):
+        """Registra el cambio de la columna `row` de la base; `column` es B^-1 a_q."""
+        indices = np.flatnonzero(column)
+        self.etas.append((row, indices, column[indices], column[row]))
+
+
+class RevisedSimplexSolver:
+    """
+    Simplex revisado de dos fases sobre min c x, A x = b, x >= 0.
+
+    La matriz se mantiene en formato CSC; solo la base se factoriza y las
+    columnas se extraen directamente de los arreglos indptr/indices. La
+    variable entrante se elige con Dantzig escalado por la norma de cada
+    columna, que reduce mucho las iteraciones en modelos mal escalados.
+    """
+
+    def __init__(self, matrix, rhs, costs, refactor_every=REFACTOR_EVERY, on_iteration=None):
+        self.matrix = csc_matrix(matrix, dtype=float)
+        self.matrix.sort_indices()
+        self.rhs = np.asarray(rhs, dtype=float)
+        self.costs = np.asarray(costs, dtype=float)
+        self.refactor_every = refactor_every
+        self.num_rows, self.num_cols = self.matrix.shape
+        self.iterations = 0
+        self.phase = 2
+        self.on_iteration = on_iteration
+        self.column_norms = np.sqrt(np.asarray(self.matrix.multiply(self.matrix).sum(axis=0)).ravel()) + 1.0
+
+    def column(self, index):
+        start, end = self.matrix.indptr[index], self.matrix.indptr[index + 1]
+        dense = np.zeros(self.num_rows)
+        dense[self.matrix.indices[start:end]] = self.matrix.data[start:end]
+        return dense
+
+    def solve(self, basis, artificial_indices=()):
+        """
+        Resuelve el problema partiendo de una base factible para la Fase 1.
+
+        `basis` debe contener una columna identidad por fila (holguras y
+        artificiales). Retorna un diccionario con el estado, los valores de
+        todas las columnas, la base final y las iteraciones de cada fase.
+        """
+        basis = np.array(basis, dtype=np.intp)
+        allowed = np.ones(self.num_cols, dtype=bool)
+        iterations = {"phase1": 0, "phase2": 0}
+        artificial_indices = np.asarray(artificial_indices, dtype=np.intp)
+
+        if artificial_indices.size:
+            phase1_costs = np.zeros(self.num_cols)
+            phase1_costs[artificial_indices] = 1.0
+            self.phase = 1
+            status, basis, values = self.primal(phase1_costs, basis, allowed)
+            iterations["phase1"] = self.iterations
+            if status != "optimal":
+                return self._result(status, basis, None, iterations)
+            if phase1_costs @ values > FEASIBILITY_TOLERANCE:
+                return self._result("infeasible", basis, None, iterations)
+            allowed[artificial_indices] = False
+            basis = self._drive_out_artificials(basis, allowed)
+
+        self.phase = 2
+        status, basis, values = self.primal(self.costs, basis, allowed)
+        iterations["phase2"] = self.iterations
+        return self._result(status, basis, values, iterations)
+
+    def primal(self, costs, basis, allowed):
+        """Simplex primal desde una base factible; retorna (estado, base, valores)."""
+        factor = BasisFactorization(self.matrix, basis, self.refactor_every)
+        basic_values = factor.ftran(self.rhs)
+        degenerate_streak = 0
+        self.iterations = 0
+
+        while self.iterations < MAX_ITERATIONS:
+            duals = factor.btran(costs[basis])
+            reduced = costs - self.matrix.T @ duals
+            reduced[~allowed] = 0.0
+            reduced[basis] = 0.0
+
+            if degenerate_streak < DEGENERATE_LIMIT:
+                entering = int(np.argmin(reduced / self.column_norms))
+                if reduced[entering] >= -EPSILON:
+                    return "optimal", basis, self._values(basis, basic_values)
+            else:
+                improving = np.flatnonzero(reduced < -EPSILON)
+                if not improving.size:
+                    return "optimal", basis, self._values(basis, basic_values)
+                entering = int(improving[0])
+
+            direction = factor.ftran(self.column(entering))
+            positive = direction > EPSILON
+            if not positive.any():
+                return "unbounded", basis, None
+
+            ratios = np.full(self.num_rows, np.inf)
+            np.divide(basic_values, direction, out=ratios, where=positive)
+            step = ratios.min()
+            ties = np.flatnonzero(ratios <= step + EPSILON)
+            leaving = int(ties[np.argmin(basis[ties])])
+
+            degenerate_streak = degenerate_streak + 1 if step <= EPSILON else 0
+            basic_values -= step * direction
+            basic_values[leaving] = step
+            basis[leaving] = entering
+            self.iterations += 1
+            if self.on_iteration is not None:
+                self.on_iteration(self.phase, self.iterations, costs[basis] @ basic_values)
+
+            if factor.needs_refactor:
+                factor.refactor(basis)
+                basic_values = factor.ftran(self.rhs)
+            else:
+                factor.update(leaving, direction)
+
+        return "iteration_limit", basis, None
+
+    def dual(self, costs, basis, allowed):
+        """
+        Simplex dual desde una base dual factible (Zj - Cj óptimos).
+
+        Sirve para reoptimizar cuando solo cambió el lado derecho: la base
+        anterior sigue siendo dual factible y basta con sacar las variables
+        básicas negativas. Retorna (estado, base, valores).
+        """
+        factor = BasisFactorization(self.matrix, basis, self.refactor_every)
+        basic_values = factor.ftran(self.rhs)
+        self.iterations = 0
+
+        while self.iterations < MAX_ITERATIONS:
+            leaving = int(np.argmin(basic_values))
+            if basic_values[leaving] >= -FEASIBILITY_TOLERANCE:
+                return "optimal", basis, self._values(basis, basic_values)
+
+            unit = np.zeros(self.num_rows)
+            unit[leaving] = 1.0
+            pivot_row = self.matrix.T @ factor.btran(unit)
+            reduced = costs - self.matrix.T @ factor.btran(costs[basis])
+            candidates = allowed & (pivot_row < -EPSILON)
+            candidates[basis] = False
+            candidates = np.flatnonzero(candidates)
+            if not candidates.size:
+                return "infeasible", basis, None
+
+            ratios = np.maximum(reduced[candidates], 0.0) / -pivot_row[candidates]
+            entering = int(candidates[np.argmin(ratios)])
+
+            direction = factor.ftran(self.column(entering))
+            step = basic_values[leaving] / direction[leaving]
+            basic_values -= step * direction
+            basic_values[leaving] = step
+            basis[leaving] = entering
+            self.iterations += 1
+            if self.on_iteration is not None:
+                self.on_iteration(self.phase, self.iterations, costs[basis] @ basic_values)
+
+            if factor.needs_refactor:
+                factor.refactor(basis)
+                basic_values = factor.ftran(self.rhs)
+            else:
+                factor.update(leaving, direction)
+
+        return "iteration_limit", basis, None
+
+    def _drive_out_artificials(self, basis, allowed):
+        factor = BasisFactorization(self.matrix, basis, self.refactor_every)
+        for row in np.flatnonzero(~allowed[basis]):
+            unit = np.zeros(self.num_rows)
+            unit[row] = 1.0
+            tableau_row = self.matrix.T @ factor.btran(unit)
+            candidates = np.flatnonzero((np.abs(tableau_row) > EPSILON) & allowed)
+            candidates = candidates[~np.isin(candidates, basis)]
+            if not candidates.size:
+                continue
+            entering = int(candidates[0])
+            factor.update(row, factor.ftran(self.column(entering)))
+            basis[row] = entering
+        return basis
+
+    def _values(self, basis, basic_values):
+        values = np.zeros(self.num_cols)
+        values[basis] = np.maximum(basic_values, 0.0)
+        return values
+
+    def _result(self, status, basis, values, iterations):
+        objective = float(self.costs @ values) if values is not None else None
+        return {
+            "status": status,
+            "x": values,
+            "basis": basis,
+            "objective": objective,
+            "iterations": iterations,
+        }
@@ -0,0 +1,124 @@
+import numpy as np
+from scipy.linalg.blas import dger
+
+EPSILON = 1e-9
+MAX_ITERATIONS = 50_000
+DEGENERATE_LIMIT = 50
+
+
+def pivot(tableau, row, col):
+    """
+    Pivotea el tableau en (row, col) con una actualización de rango 1 en sitio.
+
+    El tableau debe ser un arreglo float64 contiguo en orden C: su transpuesta
+    es contigua en orden Fortran y BLAS (dger) la actualiza sin copias.
+    """
+    tableau[row] /= tableau[row, col]
+    pivot_row = tableau[row].copy()
+    column = tableau[:, col].copy()
+    column[row] = 0.0
+    dger(-1.0, pivot_row, column, a=tableau.T, overwrite_a=True)
+
+
+def run_simplex(tableau, basis, allowed=None, on_iteration=None, max_iterations=MAX_ITERATIONS):
+    """
+    Ejecuta el simplex primal sobre un tableau de minimización.
+
+    El tableau tiene las filas de restricciones seguidas por la fila objetivo
+    (Zj - Cj) y la última columna es la solución. Una variable entra mientras
+    su Zj - Cj sea positivo; tras varias iteraciones degeneradas seguidas se
+    pasa a la regla de Bland para evitar ciclos.
+
+    Retorna "optimal", "unbounded" o "iteration_limit".
+    """
+    num_rows = tableau.shape[0] - 1
+    objective = tableau[-1, :-1]
+    rhs = tableau[:num_rows, -1]
+    candidates = np.ones(objective.shape[0], dtype=bool) if allowed is None else allowed
+    degenerate_streak = 0
+
+    for _ in range(max_iterations):
+        scores = np.where(candidates, objective, 0.0)
+        if degenerate_streak < DEGENERATE_LIMIT:
+            entering = int(np.argmax(scores))
+            if scores[entering] <= EPSILON:
+                return "optimal"
+        else:
+            improving = np.flatnonzero(scores > EPSILON)
+            if not improving.size:
+                return "optimal"
+            entering = int(improving[0])
+
+        column = tableau[:num_rows, entering]
+        positive = column > EPSILON
+        if not positive.any():
+            return "unbounded"
+
+        ratios = np.full(num_rows, np.inf)
+        np.divide(rhs, column, out=ratios, where=positive)
+        best = ratios.min()
+        ties = np.flatnonzero(ratios <= best + EPSILON)
+        leaving = int(ties[np.argmin(basis[ties])]) if ties.size > 1 else int(ties[0])
+
+        degenerate_streak = degenerate_streak + 1 if best <= EPSILON else 0
+        pivot(tableau, leaving, entering)
+        basis[leaving] = entering
+        if on_iteration is not None:
+            on_iteration(tableau, basis)
+
+    return "iteration_limit"
+
+
+def price_out(tableau, basis, costs):
+    """Reescribe la fila objetivo como Zj - Cj para los costos y la base dados."""
+    num_rows = tableau.shape[0] - 1
+    basic_costs = costs[basis]
+    tableau[-1, :-1] = basic_costs @ tableau[:num_rows, :-1] - costs
+    tableau[-1, -1] = basic_costs @ tableau[:num_rows, -1]
+
+
+def run_dual_simplex(tableau, basis, allowed=None, on_iteration=None, max_iterations=MAX_ITERATIONS):
+    """
+    Ejecuta el simplex dual sobre un tableau con Zj - Cj <= 0 (dualmente factible).
+
+    Sale la fila con la solución más negativa y entra la columna permitida
+    con coeficiente negativo en esa fila que menos empeora Zj - Cj. Tras
+    varias iteraciones degeneradas seguidas sale la primera fila negativa
+    (regla de Bland).
+
+    Retorna "optimal", "infeasible" o "iteration_limit".
+    """
+    num_rows = tableau.shape[0] - 1
+    objective = tableau[-1, :-1]
+    rhs = tableau[:num_rows, -1]
+    candidates = np.ones(objective.shape[0], dtype=bool) if allowed is None else allowed
+    degenerate_streak = 0
+
+    for _ in range(max_iterations):
+        if degenerate_streak < DEGENERATE_LIMIT:
+            leaving = int(np.argmin(rhs))
+            if rhs[leaving] >= -EPSILON:
+                return "optimal"
+        else:
+            negative = np.flatnonzero(rhs < -EPSILON)
+            if not negative.size:
+                return "optimal"
+            leaving = int(negative[0])
+
+        row = tableau[leaving, :-1]
+        eligible = candidates & (row < -EPSILON)
+        if not eligible.any():
+            return "infeasible"
+
+        ratios = np.full(row.shape[0], np.inf)
+        np.divide(objective, row, out=ratios, where=eligible)
+        best = ratios.min()
+        entering = int(np.flatnonzero(ratios <= best + EPSILON)[0])
+
+        degenerate_streak = degenerate_streak + 1 if best <= EPSILON else 0
+        pivot(tableau, leaving, entering)
+        basis[leaving] = entering
+        if on_iteration is not None:
+            on_iteration(tableau, basis)
+
+    return "iteration_limit"
@@ -0,0 +1,114 @@
+import hashlib
+import pickle
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from scipy import sparse
+
+DECIMALS = 9
+MAX_ENTRIES = 256
+MAX_BYTES = 32 * 1024 * 1024
+
+
+def _canonical_array(values, decimals):
+    # Redondear absorbe el ruido de punto flotante y sumar 0.0 convierte -0.0 en 0.0.
+    values = np.round(np.asarray(values, dtype=float), decimals) + 0.0
+    return np.ascontiguousarray(values)
+
+
+def problem_fingerprint(sense, costs, matrix, relations, rhs, bounds=None, context=(), decimals=DECIMALS):
+    """
+    Hash normalizado de un problema (sentido, c, A, relaciones, b, cotas).
+
+    Los coeficientes se redondean a `decimals` para que problemas que solo
+    difieren por ruido numérico compartan la misma entrada. Las matrices
+    scipy.sparse se llevan a CSR canónico antes de hashear. `context`
+    permite distinguir resultados que dependen de otras opciones (backend,
+    presolve, etc.).
+    """
+    digest = hashlib.blake2b(digest_size=20)
+
+    def feed(label, values):
+        array = _canonical_array(values, decimals)
+        digest.update(f"{label}:{array.shape}".encode())
+        digest.update(array.tobytes())
+
+    digest.update(repr((str(sense), tuple(context))).encode())
+    feed("c", costs)
+    if sparse.issparse(matrix):
+        matrix = sparse.csr_matrix(matrix, copy=True)
+        matrix.sum_duplicates()
+        matrix.data = _canonical_array(matrix.data, decimals)
+        matrix.eliminate_zeros()
+        digest.update(f"A:{matrix.shape}".encode())
+        digest.update(matrix.indptr.astype(np.int64).tobytes())
+        digest.update(matrix.indices.astype(np.int64).tobytes())
+        digest.update(matrix.data.tobytes())
+    else:
+        feed("A", matrix)
+    digest.update("|".join(np.asarray(relations, dtype=str).tolist()).encode())
+    feed("b", rhs)
+    if bounds is not None:
+        feed("bounds", bounds)
+    return digest.hexdigest()
+
+
+class SolveCache:
+    """
+    Caché LRU de soluciones acotada por cantidad de entradas y por bytes.
+
+    Los valores se guardan serializados, así cada acierto retorna una copia
+    independiente y el tamaño de la entrada se conoce exactamente. `hits` y
+    `misses` cuentan los aciertos y fallos de get(). Se puede compartir
+    entre hilos: la serialización queda fuera del lock.
+    """
+
+    def __init__(self, max_entries=MAX_ENTRIES, max_bytes=MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def get(self, key, default=None):
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return pickle.loads(payload)
+
+    def put(self, key, value):
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(payload) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self.bytes -= len(self._entries.pop(key))
+            self._entries[key] = payload
+            self.bytes += len(payload)
+            while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.bytes -= len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self.bytes, "hits": self.hits, "misses": self.misses}
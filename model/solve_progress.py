@@ -0,0 +1,36 @@
+import time
+
+PROGRESS_INTERVAL = 0.1
+
+
+class SolveCancelled(Exception):
+    """Se canceló la resolución en curso."""
+
+
+class ProgressReporter:
+    """
+    Callback de progreso para TwoPhaseMethodModel.solve(progress=...).
+
+    Se llama con (fase, iteración, objetivo) en cada pivoteo. Si el evento
+    `cancel_event` está activo lanza SolveCancelled, lo que detiene el
+    simplex en el siguiente pivoteo. Las actualizaciones se entregan a
+    `publish` como mucho una vez cada `interval` segundos.
+    """
+
+    def __init__(self, publish, cancel_event, interval=PROGRESS_INTERVAL):
+        self.publish = publish
+        self.cancel_event = cancel_event
+        self.interval = interval
+        self.start = time.monotonic()
+        self._last = -interval
+
+    def check(self):
+        if self.cancel_event.is_set():
+            raise SolveCancelled()
+
+    def __call__(self, phase, iteration, objective):
+        self.check()
+        elapsed = time.monotonic() - self.start
+        if elapsed - self._last >= self.interval:
+            self._last = elapsed
+            self.publish({"phase": phase, "iteration": iteration, "objective": float(objective), "elapsed": elapsed})
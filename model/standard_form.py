@@ -0,0 +1,124 @@
+import numpy as np
+from scipy import sparse
+
+RELATIONS = ("<=", ">=", "=")
+
+
+class StandardForm:
+    """
+    Problema en forma estándar A x = b, x >= 0 con holguras y artificiales.
+
+    `column_names` es una tupla compartida con el nombre de cada columna
+    (X1..Xn seguidas de S/R en el orden de las restricciones), `basis` la
+    columna básica inicial de cada fila, `artificial_indices` las columnas
+    artificiales y `row_signs` el signo (+1/-1) aplicado a cada fila. Con
+    layout "dense", `tableau` es el buffer completo de (m + 1) x
+    (columnas + 1) y `matrix`/`rhs` son vistas sobre él.
+    """
+
+    def __init__(self, matrix, rhs, column_names, basis, artificial_indices, num_structural, row_signs, tableau=None):
+        self.matrix = matrix
+        self.rhs = rhs
+        self.column_names = column_names
+        self.basis = basis
+        self.artificial_indices = artificial_indices
+        self.num_structural = num_structural
+        self.row_signs = row_signs
+        self.tableau = tableau
+
+
+def mirror_relations(relations):
+    """Invierte el sentido de "<=" y ">=" (lo que ocurre al multiplicar por -1)."""
+    return np.where(relations == "<=", ">=", np.where(relations == ">=", "<=", relations))
+
+
+def normalize_rows(relations, rhs):
+    """Retorna el signo por fila y las relaciones que dejan el lado derecho >= 0."""
+    relations = np.asarray(relations)
+    flip = np.where(np.asarray(rhs, dtype=float) < 0, -1.0, 1.0)
+    return flip, np.where(flip < 0, mirror_relations(relations), relations)
+
+
+def auxiliary_names(relations, rhs):
+    """Nombres de holgura (S) y artificial (R) de cada fila; cadena vacía si no tiene."""
+    _, relations = normalize_rows(relations, rhs)
+    slack_names = np.full(relations.shape[0], "", dtype=object)
+    artificial_names = np.full(relations.shape[0], "", dtype=object)
+    has_slack = relations != "="
+    has_artificial = relations != "<="
+    slack_names[has_slack] = [f"S{number}" for number in range(1, int(has_slack.sum()) + 1)]
+    artificial_names[has_artificial] = [f"R{number}" for number in range(1, int(has_artificial.sum()) + 1)]
+    return slack_names, artificial_names
+
+
+def build_standard_form(matrix, relations, rhs, layout="dense", names=None):
+    """
+    Construye la forma estándar en una sola pasada.
+
+    Primero cuenta las holguras, excesos y artificiales que necesita cada
+    relación y luego llena un arreglo preasignado (o una matriz COO si
+    layout es "sparse") con asignaciones vectorizadas. Las filas con lado
+    derecho negativo se multiplican por -1 antes de elegir las columnas.
+
+    `names` permite fijar (variables, holguras, artificiales) por fila; por
+    defecto se numeran X1..Xn, S1.. y R1.. en orden.
+    """
+    relations = np.asarray(relations)
+    rhs = np.asarray(rhs, dtype=float)
+    num_rows, num_structural = matrix.shape
+    if not np.isin(relations, RELATIONS).all():
+        raise ValueError("Relación de restricción inválida")
+
+    flip, relations = normalize_rows(relations, rhs)
+
+    has_slack = relations != "="
+    has_artificial = relations != "<="
+    widths = has_slack.astype(np.intp) + has_artificial
+    starts = num_structural + np.cumsum(widths) - widths
+    num_cols = num_structural + int(widths.sum())
+
+    slack_rows = np.flatnonzero(has_slack)
+    slack_cols = starts[slack_rows]
+    slack_signs = np.where(relations[slack_rows] == "<=", 1.0, -1.0)
+    artificial_rows = np.flatnonzero(has_artificial)
+    artificial_cols = starts[artificial_rows] + has_slack[artificial_rows]
+
+    basis = np.empty(num_rows, dtype=np.intp)
+    basis[slack_rows] = slack_cols
+    basis[artificial_rows] = artificial_cols
+
+    if names is None:
+        variable_names = [f"X{i + 1}" for i in range(num_structural)]
+        slack_names, artificial_names = auxiliary_names(relations, rhs * flip)
+    else:
+        variable_names, slack_names, artificial_names = names
+    column_names = list(variable_names) + [""] * (num_cols - num_structural)
+    for row, col in zip(slack_rows.tolist(), slack_cols.tolist()):
+        column_names[col] = slack_names[row]
+    for row, col in zip(artificial_rows.tolist(), artificial_cols.tolist()):
+        column_names[col] = artificial_names[row]
+
+    if layout == "sparse":
+        structural = sparse.coo_matrix(sparse.diags(flip) @ sparse.csr_matrix(matrix))
+        rows = np.concatenate([structural.row, slack_rows, artificial_rows])
+        cols = np.concatenate([structural.col, slack_cols, artificial_cols])
+        data = np.concatenate([structural.data, slack_signs, np.ones(artificial_rows.size)])
+        standard = sparse.csc_matrix((data, (rows, cols)), shape=(num_rows, num_cols))
+        return StandardForm(standard, flip * rhs, tuple(column_names), basis, artificial_cols, num_structural, flip)
+
+    tableau = np.zeros((num_rows + 1, num_cols + 1))
+    dense = matrix.toarray() if sparse.issparse(matrix) else matrix
+    np.multiply(dense, flip[:, None], out=tableau[:num_rows, :num_structural])
+    tableau[slack_rows, slack_cols] = slack_signs
+    tableau[artificial_rows, artificial_cols] = 1.0
+    tableau[:num_rows, -1] = flip * rhs
+    return StandardForm(
+        tableau[:num_rows, :-1],
+        tableau[:num_rows, -1],
+        tuple(column_names),
+        basis,
+        artificial_cols,
+        num_structural,
+        flip,
+        tableau,
+    )
@@ -0,0 +1,68 @@
+import numpy as np
+
+DISPLAY_DECIMALS = 4
+
+
+class Tableau:
+    """
+    Una iteración del simplex guardada en arreglos.
+
+    `body` es el tableau float64 (filas de restricciones y fila Zj - Cj, con
+    la solución en la última columna) y `basis` los índices int32 de las
+    variables básicas. `column_names`, `costs` y `sign` se comparten entre
+    todas las iteraciones de una fase. Las vistas leen las celdas con
+    `cell(row, col)`, que arma el valor mostrado sin copiar el tableau; el
+    formato anterior en listas anidadas se obtiene con `to_rows()`.
+
+    Filas mostradas: 0 es la fila Z, 1..m las restricciones y m + 1 la fila
+    Zj - Cj. Columnas: 0 la variable básica, 1 Z, luego las variables y al
+    final la solución.
+    """
+
+    __slots__ = ("body", "basis", "column_names", "costs", "sign")
+
+    def __init__(self, body, basis, column_names, costs, sign=1.0):
+        self.body = body
+        self.basis = basis
+        self.column_names = column_names
+        self.costs = costs
+        self.sign = sign
+
+    @classmethod
+    def snapshot(cls, tableau, basis, column_names, costs, sign=1.0):
+        """Copia el tableau y la base vigentes; los demás datos se comparten."""
+        return cls(np.array(tableau, dtype=np.float64), np.array(basis, dtype=np.int32), column_names, costs, sign)
+
+    @property
+    def header(self):
+        return ("V. Básica", "Z", *self.column_names, "Solución")
+
+    @property
+    def shape(self):
+        """(filas, columnas) mostradas, sin contar el encabezado."""
+        return self.body.shape[0] + 1, self.body.shape[1] + 2
+
+    def cell(self, row, col):
+        last_row = self.body.shape[0]
+        if col == 0:
+            if row == 0:
+                return "Z"
+            return "Zj - Cj" if row == last_row else self.column_names[self.basis[row - 1]]
+        if col == 1:
+            return 0.0 if 0 < row < last_row else 1.0
+        if row == 0:
+            value = -self.costs[col - 2] if col - 2 < self.costs.shape[0] else 0.0
+        elif row == last_row:
+            value = self.sign * self.body[-1, col - 2]
+        else:
+            value = self.body[row - 1, col - 2]
+        return round(float(value), DISPLAY_DECIMALS) + 0.0
+
+    def to_rows(self):
+        """Tableau como listas: encabezado, fila Z, restricciones y fila Zj - Cj."""
+        values = np.round(self.body, DISPLAY_DECIMALS) + 0.0
+        rows = [list(self.header), ["Z", 1.0, *(0.0 - self.costs).tolist(), 0.0]]
+        for basic, row_values in zip(self.basis.tolist(), values[:-1].tolist()):
+            rows.append([self.column_names[basic], 0.0, *row_values])
+        rows.append(["Zj - Cj", 1.0, *(self.sign * values[-1] + 0.0).tolist()])
+        return rows
@@ -0,0 +1,96 @@
+from array import array
+
+import numpy as np
+
+from model.simplex_tableau import pivot
+from model.tableau import Tableau
+
+CHECKPOINT_EVERY = 32
+CHECKPOINT_BYTES = 32 * 1024 * 1024
+
+
+class TableauHistory:
+    """
+    Iteraciones de una fase del simplex guardadas como tableau inicial más pivoteos.
+
+    Se guarda la secuencia de pivoteos (fila saliente, columna entrante) y
+    cada `checkpoint_every` pivoteos una copia del tableau. Si las copias
+    superan `max_checkpoint_bytes` se descarta una de cada dos y el
+    intervalo se duplica, así la memoria queda acotada. `history[k]`
+    reconstruye la iteración k desde la copia más cercana repitiendo los
+    pivoteos (el resultado es idéntico al original: son las mismas
+    operaciones sobre los mismos datos). Se usa como la lista de tableaus
+    de antes: len(), índices e iteración producen Tableau.
+    """
+
+    def __init__(self, tableau, basis, column_names, costs, sign=1.0, checkpoint_every=CHECKPOINT_EVERY, max_checkpoint_bytes=CHECKPOINT_BYTES):
+        initial = Tableau.snapshot(tableau, basis, column_names, costs, sign)
+        self.column_names = column_names
+        self.costs = costs
+        self.sign = sign
+        self.checkpoint_every = checkpoint_every
+        self.max_checkpoint_bytes = max_checkpoint_bytes
+        self.checkpoints = [(initial.body, initial.basis)]
+        self.rows = array("i")
+        self.columns = array("i")
+        self._basis = initial.basis.copy()
+        self._cursor = None
+
+    def __len__(self):
+        return len(self.rows) + 1
+
+    def record(self, tableau, basis):
+        """Callback on_iteration de los runners: registra el pivoteo recién hecho."""
+        row = int(np.flatnonzero(basis != self._basis)[0])
+        col = int(basis[row])
+        self._basis[row] = col
+        self.rows.append(row)
+        self.columns.append(col)
+        if len(self.rows) % self.checkpoint_every == 0:
+            self.checkpoints.append((np.array(tableau, dtype=np.float64), self._basis.copy()))
+            if len(self.checkpoints) > 2 and len(self.checkpoints) * tableau.nbytes > self.max_checkpoint_bytes:
+                self.checkpoints = self.checkpoints[::2]
+                self.checkpoint_every *= 2
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        body, basis, start = self._start_for(index)
+        for step in range(start, index):
+            self._replay(body, basis, step)
+        self._cursor = (index, body, basis)
+        return Tableau.snapshot(body, basis, self.column_names, self.costs, self.sign)
+
+    def __iter__(self):
+        body, basis = (array.copy() for array in self.checkpoints[0])
+        yield Tableau.snapshot(body, basis, self.column_names, self.costs, self.sign)
+        for step in range(len(self.rows)):
+            self._replay(body, basis, step)
+            yield Tableau.snapshot(body, basis, self.column_names, self.costs, self.sign)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_cursor"] = None
+        return state
+
+    def _start_for(self, index):
+        """Punto de partida más cercano a `index`: el último reconstruido o una copia guardada."""
+        checkpoint = min(index // self.checkpoint_every, len(self.checkpoints) - 1)
+        start = checkpoint * self.checkpoint_every
+        if self._cursor is not None and start <= self._cursor[0] <= index:
+            position, body, basis = self._cursor
+            return body, basis, position
+        body, basis = self.checkpoints[checkpoint]
+        return body.copy(), basis.copy(), start
+
+    def _replay(self, body, basis, step):
+        row, col = self.rows[step], self.columns[step]
+        pivot(body, row, col)
+        basis[row] = col
+
+    @property
+    def nbytes(self):
+        checkpoints = sum(body.nbytes + basis.nbytes for body, basis in self.checkpoints)
+        return checkpoints + 8 * len(self.rows)
@@ -1,149 +1,585 @@
+import os
+import threading
+import time
+
 import numpy as np
-from scipy.optimize import linprog
+from scipy import sparse
+
+from model.batch_solve import solve_objective_batch, solve_rhs_batch
+from model.instrumentation import optional_stage
+from model.interior_point import InteriorPointSolver, crossover_basis, independent_rows
+from model.linprog_form import build_linprog_form
+from model.portfolio import CONCLUSIVE_MESSAGES, PortfolioStats, race, size_class, verify_feasible_value
+from model.presolve import presolve
+from model.revised_simplex import RevisedSimplexSolver
+from model.solve_cache import SolveCache, problem_fingerprint
+from model.solve_progress import SolveCancelled
+from model.simplex_tableau import EPSILON, pivot, price_out, run_dual_simplex, run_simplex
+from model.standard_form import RELATIONS, build_standard_form
+from model.tableau_history import TableauHistory
+
+FEASIBILITY_TOLERANCE = 1e-7
+# Serializar historiales más grandes para la caché cuesta más que volver a resolver.
+MAX_CACHED_HISTORY_BYTES = 4 * 1024 * 1024
+BACKENDS = ("tableau", "revised", "highs", "highs-ds", "highs-ipm", "portfolio", "ipm")
+
 
 class TwoPhaseMethodModel:
-    def __init__(self, num_vars, num_constraints, opt_type, obj_coeffs, constraints):
+    # Caché compartida entre instancias; None la desactiva y
+    # DiskSolveCache(ruta, memory=SolveCache()) la hace persistente.
+    cache = SolveCache()
+    # Qué backend ganó cada carrera del modo "portfolio", por clase de tamaño.
+    portfolio_stats = PortfolioStats()
+
+    def __init__(self, num_vars, num_constraints, opt_type, obj_coeffs, constraints, backend="tableau", presolve=False):
         self.num_vars = num_vars
         self.num_constraints = num_constraints
         self.opt_type = opt_type
         self.obj_coeffs = np.array(obj_coeffs, dtype=float)
         self.constraints = constraints
+        self.backend = backend
+        self.presolve = presolve
+        self._arrays = None
+        self._labels = None
+        self._warm_start = None
+        self._progress = None
+        self._instrumentation = None
 
-    def solve(self):
-        try:
-            constraints_matrix, rhs, var_names, artificial_indices = self._build_constraint_matrix()
-            if constraints_matrix is None:
-                return "Error en la configuración del problema"
+    @classmethod
+    def from_arrays(cls, opt_type, obj_coeffs, matrix, relations, rhs, backend="revised", presolve=False, labels=None):
+        """Crea el modelo desde una matriz densa o scipy.sparse sin pasar por listas."""
+        if backend != "revised":
+            matrix = matrix.toarray() if sparse.issparse(matrix) else np.asarray(matrix, dtype=float)
+        model = cls(matrix.shape[1], matrix.shape[0], opt_type, obj_coeffs, None, backend, presolve)
+        model._labels = labels
+        model._arrays = (matrix, np.asarray(relations), np.asarray(rhs, dtype=float))
+        return model
 
-            lp_solution = self._solve_with_linprog()
-            if isinstance(lp_solution, str):
-                return lp_solution
+    def update(self, opt_type, obj_coeffs, constraints):
+        """
+        Reemplaza el objetivo y las restricciones conservando la última base óptima.
+
+        Si solo cambian costos o lados derechos, el siguiente solve() del
+        backend tableau reoptimiza desde esa base en vez de empezar de cero.
+        """
+        self.opt_type = opt_type
+        self.obj_coeffs = np.array(obj_coeffs, dtype=float)
+        self.constraints = constraints
+        self.num_constraints = len(constraints)
+        self._arrays = None
 
-            phase1_tableaus = [self._build_phase1_tableau(constraints_matrix, rhs, var_names, artificial_indices)]
-            phase2_tableaus = [self._build_phase2_tableau(lp_solution, var_names, artificial_indices)]
+    def solve(self, progress=None, instrumentation=None):
+        """
+        Resuelve el problema con el backend elegido.
 
-            solution = self._format_solution(lp_solution)
-            return {
-                "phase1_tableaus": phase1_tableaus,
-                "phase2_tableaus": phase2_tableaus,
-                "solution": solution,
-            }
+        `progress`, si se da, se llama con (fase, iteración, objetivo) en cada
+        pivoteo (ver model.solve_progress.ProgressReporter); si lanza
+        SolveCancelled la resolución se interrumpe y la excepción se propaga.
+        Con `instrumentation` (model.instrumentation.Instrumentation) se
+        registran los tiempos de cada etapa y los pivoteos de cada fase, y
+        el resultado incluye el resumen en "instrumentation".
+        """
+        self._progress = progress
+        self._instrumentation = instrumentation
+        try:
+            if self.backend not in BACKENDS:
+                raise ValueError(f"Backend desconocido: {self.backend}")
+            # Se valida acá y no en cada backend: linprog tomaría una relación desconocida como "<=".
+            _, relations, _ = self._constraint_arrays()
+            if not np.isin(relations, RELATIONS).all():
+                return "Error en la configuración del problema"
+            result = self._solve_cached()
+            if instrumentation is not None and isinstance(result, dict):
+                result["instrumentation"] = instrumentation.as_dict()
+            return result
+        except SolveCancelled:
+            raise
         except Exception as e:
             return f"Error: {str(e)}"
+        finally:
+            self._progress = None
+            self._instrumentation = None
+
+    def _solve_cached(self):
+        key = None
+        if self.cache is not None:
+            with self._stage("cache_lookup"):
+                key = self._fingerprint()
+                cached = self.cache.get(key)
+            if cached is not None:
+                self._count("cache_hits")
+                result, warm_start = cached
+                if warm_start is not None:
+                    self._warm_start = warm_start
+                return result
+        with self._stage("solver"):
+            result = self._solve_presolved() if self.presolve else self._solve_backend()
+        if key is not None and self._cacheable(result):
+            with self._stage("cache_store"):
+                self.cache.put(key, (result, self._warm_start if isinstance(result, dict) else None))
+        return result
+
+    def _cacheable(self, result):
+        if not isinstance(result, dict):
+            return True
+        histories = (result[name] for name in ("phase1_tableaus", "phase2_tableaus"))
+        size = sum(history.nbytes for history in histories if isinstance(history, TableauHistory))
+        return size <= MAX_CACHED_HISTORY_BYTES
+
+    def _stage(self, name):
+        return optional_stage(self._instrumentation, name)
+
+    def _count(self, name, value=1):
+        if self._instrumentation is not None:
+            self._instrumentation.count(name, value)
+
+    def _fingerprint(self):
+        matrix, relations, rhs = self._constraint_arrays()
+        return problem_fingerprint(
+            self.opt_type,
+            self.obj_coeffs[:self.num_vars],
+            matrix,
+            relations,
+            rhs,
+            context=(self.backend, self.presolve),
+        )
+
+    def solve_batch(self, rhs=None, objectives=None):
+        """
+        Resuelve el mismo conjunto de restricciones para muchos escenarios.
+
+        `rhs` es un arreglo (escenarios x restricciones) de lados derechos o
+        `objectives` uno (escenarios x variables) de funciones objetivo. Los
+        escenarios comparten la forma estándar y la factorización de la base
+        óptima vigente. Retorna arreglos apilados "status", "X", "Z" e
+        "iterations" (pivoteos propios de cada escenario).
+        """
+        if (rhs is None) == (objectives is None):
+            raise ValueError("Indique solo rhs u objectives")
+        matrix, relations, base_rhs = self._constraint_arrays()
+        sign = -1.0 if self.opt_type == "Maximizar" else 1.0
+        if rhs is not None:
+            result = solve_rhs_batch(matrix, relations, sign * self.obj_coeffs[:self.num_vars], rhs)
+        else:
+            result = solve_objective_batch(matrix, relations, base_rhs, sign * np.atleast_2d(objectives))
+        result["Z"] = sign * result["Z"]
+        return result
+
+    def _solve_backend(self):
+        if self.backend == "revised":
+            return self._solve_revised()
+        if self.backend in ("highs", "highs-ds", "highs-ipm"):
+            return self._solve_highs()
+        if self.backend == "portfolio":
+            return self._solve_portfolio()
+        if self.backend == "ipm":
+            return self._solve_interior_point()
+        return self._solve_tableau()
+
+    def _solve_presolved(self):
+        matrix, relations, rhs = self._constraint_arrays()
+        sign = -1.0 if self.opt_type == "Maximizar" else 1.0
+        obj_coeffs = self.obj_coeffs[:self.num_vars]
+        with self._stage("presolve"):
+            reduced = presolve(sign * obj_coeffs, matrix, relations, rhs)
+        if reduced.status == "infeasible":
+            return "El problema no tiene solución factible."
+
+        kept = reduced.variable_indices
+        if kept.size:
+            model = TwoPhaseMethodModel.from_arrays(
+                self.opt_type,
+                obj_coeffs[kept],
+                reduced.matrix,
+                reduced.relations,
+                reduced.rhs,
+                backend=self.backend,
+                labels=reduced.column_names(),
+            )
+            model._progress = self._progress
+            model._instrumentation = self._instrumentation
+            result = model._solve_backend()
+            if isinstance(result, str):
+                return result
+        else:
+            result = {"phase1_tableaus": [], "phase2_tableaus": [], "solution": {"X": [], "Z": 0.0}}
+
+        values = reduced.postsolve(result["solution"]["X"])
+        result["solution"] = {
+            "X": values.tolist(),
+            "Z": result["solution"]["Z"] + reduced.objective_offset(obj_coeffs),
+            "columns": reduced.postsolve_columns(values),
+        }
+        result["presolve"] = {"rows_removed": reduced.removed_rows, "columns_removed": reduced.removed_columns}
+        return result
+
+    def _solve_tableau(self):
+        form = self._standard_form("dense")
+        if form is None:
+            return "Error en la configuración del problema"
+
+        warm = self._solve_warm(form)
+        if warm is not None:
+            return warm
+
+        tableau, basis = form.tableau, form.basis
+        var_names = tuple(form.column_names)
+        artificial_indices = form.artificial_indices
+
+        phase1_tableaus = []
+        if artificial_indices.size:
+            phase1_costs = np.zeros(len(var_names))
+            phase1_costs[artificial_indices] = 1.0
+            price_out(tableau, basis, phase1_costs)
+            status, phase1_tableaus = self._run_phase(tableau, basis, var_names, phase1_costs, 1.0, phase=1)
+            if status != "optimal":
+                return "No se pudo encontrar una solución óptima."
+            if tableau[-1, -1] > FEASIBILITY_TOLERANCE:
+                return "El problema no tiene solución factible."
+            tableau, basis = self._drive_out_artificials(tableau, basis, artificial_indices, var_names, phase1_tableaus)
+
+        keep = np.setdiff1d(np.arange(len(var_names)), artificial_indices)
+        redundant = tableau.shape[0] - 1 < form.basis.shape[0]
+        tableau, basis = self._remove_columns(tableau, basis, keep)
+        return self._solve_phase2(tableau, basis, form, keep, phase1_tableaus, run_simplex, redundant)
+
+    def _solve_interior_point(self):
+        """
+        Punto interior (Mehrotra) seguido de crossover a una base óptima.
+
+        Trabaja sobre la forma estándar sin artificiales y sin las filas
+        linealmente dependientes. Desde la base del crossover se arma el
+        tableau y el simplex de la Fase 2 (primal, o dual si la base no
+        quedó factible) hace los pivoteos de limpieza que falten, así el
+        resultado tiene tableaus y variables básicas como el backend
+        tableau. Si el punto interior no converge (problemas infactibles o
+        no acotados) se resuelve con el método de las dos fases.
+        """
+        form = self._standard_form("dense")
+        if form is None:
+            return "Error en la configuración del problema"
+
+        warm = self._solve_warm(form)
+        if warm is not None:
+            return warm
+
+        sign = -1.0 if self.opt_type == "Maximizar" else 1.0
+        keep = np.setdiff1d(np.arange(len(form.column_names)), form.artificial_indices)
+        costs = np.zeros(keep.size)
+        costs[:self.num_vars] = sign * self.obj_coeffs[:self.num_vars]
+        on_iteration = None
+        if self._progress is not None:
+            progress = self._progress
 
-    def _build_constraint_matrix(self):
-        variable_names = [f"X{i + 1}" for i in range(self.num_vars)]
-        rows = []
-        rhs_values = []
-        artificial_indices = []
-        slack_count = 1
-        artificial_count = 1
-
-        for coeffs, relation, rhs in self.constraints:
-            row = [0.0 for _ in variable_names]
-            for idx, coeff in enumerate(coeffs):
-                row[idx] = coeff
-
-            if relation == "<=":
-                variable_names.append(f"S{slack_count}")
-                self._extend_existing_rows(rows)
-                row.append(1.0)
-                slack_count += 1
-                basic_name = variable_names[-1]
-            elif relation == ">=":
-                variable_names.append(f"S{slack_count}")
-                self._extend_existing_rows(rows)
-                row.append(-1.0)
-                slack_count += 1
-
-                variable_names.append(f"R{artificial_count}")
-                self._extend_existing_rows(rows)
-                row.append(1.0)
-                artificial_indices.append(len(variable_names) - 1)
-                basic_name = variable_names[-1]
-                artificial_count += 1
-            elif relation == "=":
-                variable_names.append(f"R{artificial_count}")
-                self._extend_existing_rows(rows)
-                row.append(1.0)
-                artificial_indices.append(len(variable_names) - 1)
-                basic_name = variable_names[-1]
-                artificial_count += 1
-            else:
-                return None, None, None, None
-
-            rows.append({"basic": basic_name, "values": row})
-            rhs_values.append(rhs)
-
-        return rows, rhs_values, variable_names, artificial_indices
-
-    def _extend_existing_rows(self, rows):
-        for row in rows:
-            row["values"].append(0.0)
+            def on_iteration(iteration, objective):
+                progress(1, iteration, sign * objective)
+
+        with self._stage("interior_point"):
+            # Cada desigualdad tiene su propia holgura: solo las igualdades pueden ser redundantes.
+            _, relations, _ = self._constraint_arrays()
+            equalities = np.flatnonzero(relations == "=")
+            equality_matrix = form.matrix[np.ix_(equalities, keep)]
+            independent = independent_rows(equality_matrix)
+            # Una fila que se descarta por dependiente también tiene que serlo con su lado
+            # derecho; si [A | b] tiene más rango que A las igualdades son incompatibles.
+            if independent_rows(np.column_stack([equality_matrix, form.rhs[equalities]])).size > independent.size:
+                return self._solve_tableau()
+            rows = np.sort(np.concatenate([np.flatnonzero(relations != "="), equalities[independent]]))
+            matrix, rhs = form.matrix[np.ix_(rows, keep)], form.rhs[rows]
+            result = InteriorPointSolver(matrix, rhs, costs, on_iteration=on_iteration).solve()
+        self._count("ipm_iterations", result["iterations"])
+        if result["status"] == "unbounded":
+            return "El problema no está acotado."
+        if result["status"] != "optimal":
+            return self._solve_tableau()
+
+        with self._stage("crossover"):
+            basis = crossover_basis(matrix, result["x"], result["s"])
+            tableau = np.zeros((rows.size + 1, keep.size + 1))
+            try:
+                tableau[:-1] = np.linalg.solve(matrix[:, basis], np.column_stack([matrix, rhs]))
+            except np.linalg.LinAlgError:
+                return self._solve_tableau()
+        price_out(tableau, basis, costs)
+        if np.all(tableau[:-1, -1] >= -FEASIBILITY_TOLERANCE):
+            np.maximum(tableau[:-1, -1], 0.0, out=tableau[:-1, -1])
+            runner = run_simplex
+        elif np.all(tableau[-1, :-1] <= EPSILON):
+            runner = run_dual_simplex
+        else:
+            return self._solve_tableau()
+
+        solution = self._solve_phase2(tableau, basis, form, keep, [], runner, rows.size < form.matrix.shape[0])
+        if isinstance(solution, dict):
+            solution["iterations"] = {"interior_point": result["iterations"], "crossover": len(solution["phase2_tableaus"]) - 1}
+        return solution
+
+    def _solve_warm(self, form):
+        """
+        Reoptimiza desde la base óptima guardada si la matriz y las relaciones no cambiaron.
+
+        Con la base vigente se recalcula B^-1 [A | b] y la fila Zj - Cj: si la
+        solución sigue siendo factible (cambió el objetivo) se continúa con
+        simplex primal; si sigue siendo óptima pero no factible (cambió el
+        lado derecho) se usa simplex dual. Si no aplica ninguno retorna None.
+
+        La Fase 1 no depende del objetivo: con el mismo lado derecho se
+        muestran los tableaus de la Fase 1 anterior. Si el lado derecho
+        cambió y el problema tenía Fase 1 se resuelve desde cero, para que
+        la interfaz no muestre una Fase 1 de otro problema.
+        """
+        if self._warm_start is None:
+            return None
+        matrix, relations, rhs = self._constraint_arrays()
+        saved_matrix, saved_relations, saved_signs, saved_rhs, keep, basis, phase1_tableaus = self._warm_start
+        if not (
+            np.array_equal(saved_matrix, matrix)
+            and np.array_equal(saved_relations, relations)
+            and np.array_equal(saved_signs, form.row_signs)
+        ):
+            return None
+        if not np.array_equal(saved_rhs, rhs):
+            if len(phase1_tableaus):
+                return None
+            phase1_tableaus = []
+
+        body = form.tableau[:-1, np.append(keep, form.tableau.shape[1] - 1)]
+        tableau = np.zeros((body.shape[0] + 1, body.shape[1]))
+        tableau[:-1] = np.linalg.solve(body[:, basis], body)
+        basis = basis.copy()
+
+        sign = -1.0 if self.opt_type == "Maximizar" else 1.0
+        costs = np.zeros(keep.size)
+        costs[:self.num_vars] = sign * self.obj_coeffs[:self.num_vars]
+        price_out(tableau, basis, costs)
+
+        if np.all(tableau[:-1, -1] >= -FEASIBILITY_TOLERANCE):
+            np.maximum(tableau[:-1, -1], 0.0, out=tableau[:-1, -1])
+            return self._solve_phase2(tableau, basis, form, keep, phase1_tableaus, run_simplex)
+        if np.all(tableau[-1, :-1] <= EPSILON):
+            return self._solve_phase2(tableau, basis, form, keep, phase1_tableaus, run_dual_simplex)
+        return None
+
+    def _solve_phase2(self, tableau, basis, form, keep, phase1_tableaus, runner, redundant=False):
+        sign = -1.0 if self.opt_type == "Maximizar" else 1.0
+        phase2_names = tuple(form.column_names[idx] for idx in keep)
+        phase2_costs = np.zeros(len(phase2_names))
+        phase2_costs[:self.num_vars] = sign * self.obj_coeffs[:self.num_vars]
+        price_out(tableau, basis, phase2_costs)
+        status, phase2_tableaus = self._run_phase(tableau, basis, phase2_names, sign * phase2_costs, sign, runner, phase=2)
+        if status == "infeasible":
+            return "El problema no tiene solución factible."
+        if status == "unbounded":
+            return "El problema no está acotado."
+        if status != "optimal":
+            return "No se pudo encontrar una solución óptima."
+
+        if not redundant:
+            matrix, relations, rhs = self._constraint_arrays()
+            self._warm_start = (
+                np.array(matrix, copy=True), relations.copy(), form.row_signs.copy(), rhs.copy(), keep, basis.copy(), phase1_tableaus
+            )
+        solution = self._extract_solution(tableau, basis, sign)
+        return {
+            "phase1_tableaus": phase1_tableaus,
+            "phase2_tableaus": phase2_tableaus,
+            "solution": solution,
+        }
+
+    def _solve_revised(self):
+        form = self._standard_form("sparse")
+        if form is None:
+            return "Error en la configuración del problema"
+
+        sign = -1.0 if self.opt_type == "Maximizar" else 1.0
+        costs = np.zeros(form.matrix.shape[1])
+        costs[:self.num_vars] = sign * self.obj_coeffs[:self.num_vars]
+        on_iteration = None
+        if self._progress is not None:
+            progress = self._progress
+
+            def on_iteration(phase, iteration, objective):
+                progress(phase, iteration, sign * objective if phase == 2 else objective)
+
+        solver = RevisedSimplexSolver(form.matrix, form.rhs, costs, on_iteration=on_iteration)
+        result = solver.solve(form.basis, form.artificial_indices)
+        self._count("phase1_pivots", result["iterations"]["phase1"])
+        self._count("phase2_pivots", result["iterations"]["phase2"])
+
+        if result["status"] == "infeasible":
+            return "El problema no tiene solución factible."
+        if result["status"] == "unbounded":
+            return "El problema no está acotado."
+        if result["status"] != "optimal":
+            return "No se pudo encontrar una solución óptima."
+
+        return {
+            "phase1_tableaus": [],
+            "phase2_tableaus": [],
+            "solution": {"X": result["x"][:self.num_vars].tolist(), "Z": sign * result["objective"]},
+            "iterations": result["iterations"],
+        }
+
+    def _solve_highs(self):
+        lp_solution = self._solve_with_linprog()
+        if isinstance(lp_solution, str):
+            return lp_solution
+        return {
+            "phase1_tableaus": [],
+            "phase2_tableaus": [],
+            "solution": self._format_solution(lp_solution),
+        }
+
+    def _solve_portfolio(self):
+        """
+        Corre HiGHS simplex dual, HiGHS punto interior y el simplex revisado a la vez.
+
+        Gana el primero que entrega una solución factible cuyo c x coincide
+        con su Z (la optimalidad se confía al solver); el simplex
+        revisado se cancela y lo que HiGHS siga calculando se descarta. Una
+        infactibilidad o un no acotamiento no se puede comprobar así y HiGHS a veces informa infactible un problema no acotado (sus
+        dos métodos comparten el presolve, así que coincidir no lo confirma):
+        esas conclusiones solo se aceptan del simplex revisado, al que se
+        espera o se corre si no estaba en la carrera. El ganador queda en
+        result["portfolio"] y en portfolio_stats.
+        """
+        matrix, relations, rhs = self._constraint_arrays()
+        obj_coeffs = self.obj_coeffs[:self.num_vars]
+        size = size_class(matrix)
+        progress = self._progress
+
+        def racer(backend):
+            def run(cancelled):
+                model = TwoPhaseMethodModel.from_arrays(
+                    self.opt_type, obj_coeffs, matrix, relations, rhs, backend=backend, labels=self._labels
+                )
+
+                def check(phase, iteration, objective):
+                    if cancelled.is_set():
+                        raise SolveCancelled()
+                    if progress is not None:
+                        progress(phase, iteration, objective)
+
+                model._progress = check
+                return model._solve_backend()
+
+            return run
+
+        def accept(name, result):
+            if isinstance(result, str):
+                return name == "revised" and result in CONCLUSIVE_MESSAGES
+            return verify_feasible_value(obj_coeffs, matrix, relations, rhs, result["solution"])
+
+        # Con menos núcleos que backends corren solo los que más vienen ganando.
+        backends = self.portfolio_stats.ranking(size)[:os.cpu_count() or 1]
+        racers = {backend: racer(backend) for backend in backends}
+        winner, result, seconds, finished, accepted = race(racers, accept)
+        if not accepted and result in CONCLUSIVE_MESSAGES and "revised" not in finished:
+            started = time.perf_counter()
+            winner, result = "revised", racer("revised")(threading.Event())
+            seconds += time.perf_counter() - started
+            finished.append(winner)
+            accepted = accept(winner, result)
+        if accepted:
+            self.portfolio_stats.record(size, winner, seconds)
+            self._count(f"portfolio_{winner}_wins")
+        if isinstance(result, str):
+            return result
+        result["portfolio"] = {"winner": winner, "seconds": seconds, "size_class": size, "finished": finished}
+        return result
+
+    def _constraint_arrays(self):
+        if self._arrays is not None:
+            return self._arrays
+        with self._stage("constraint_matrix"):
+            return self._build_constraint_arrays()
+
+    def _build_constraint_arrays(self):
+        matrix = np.zeros((len(self.constraints), self.num_vars))
+        for row, (coeffs, _, _) in enumerate(self.constraints):
+            matrix[row, :len(coeffs)] = coeffs
+        relations = np.array([relation for _, relation, _ in self.constraints])
+        rhs = np.array([rhs for _, _, rhs in self.constraints], dtype=float)
+        return matrix, relations, rhs
+
+    def _standard_form(self, layout):
+        matrix, relations, rhs = self._constraint_arrays()
+        if not np.isin(relations, RELATIONS).all():
+            return None
+        with self._stage("standard_form"):
+            return build_standard_form(matrix, relations, rhs, layout, self._labels)
 
     def _solve_with_linprog(self):
-        A, b = self._build_linprog_matrices()
+        # scipy.optimize es la importación más pesada y solo la usa el backend highs.
+        from scipy.optimize import linprog
+
+        with self._stage("linprog_matrices"):
+            linprog_form = self._build_linprog_matrices()
         objective_coeffs = self.obj_coeffs.copy()
         if self.opt_type == "Maximizar":
             objective_coeffs = -objective_coeffs
 
-        result = linprog(c=objective_coeffs, A_ub=A, b_ub=b, method="highs")
+        # HiGHS no admite callbacks: este backend no reporta progreso.
+        result = linprog(c=objective_coeffs, **linprog_form, method=self.backend)
+        self._count("highs_iterations", int(getattr(result, "nit", 0)))
 
+        if result.status == 2:
+            return "El problema no tiene solución factible."
+        if result.status == 3:
+            return "El problema no está acotado."
         if not result.success:
             return "No se pudo encontrar una solución óptima."
         return result
 
-    def _build_phase1_tableau(self, constraints_matrix, rhs, variable_names, artificial_indices):
-        header = ["V. Básica", "Z", *variable_names, "Solución"]
-        tableau = [header]
+    def _run_phase(self, tableau, basis, variable_names, display_costs, sign, runner=run_simplex, phase=2):
+        history = TableauHistory(tableau, basis, variable_names, display_costs, sign)
+        objective_sign = sign if phase == 2 else 1.0
 
-        objective_row = [1.0] + [-c for c in self.obj_coeffs] + [0.0 for _ in variable_names[len(self.obj_coeffs):]] + [0.0]
-        tableau.append(["Z", *objective_row])
+        def record(current, current_basis):
+            history.record(current, current_basis)
+            if self._progress is not None:
+                self._progress(phase, len(history) - 1, objective_sign * current[-1, -1])
 
-        for row_data, rhs_value in zip(constraints_matrix, rhs):
-            padded_row = row_data["values"] + [0.0] * (len(variable_names) - len(row_data["values"]))
-            tableau.append([row_data["basic"], 0.0, *padded_row, rhs_value])
+        # Una sola etapa por fase (pivoteos más historial): medir cada pivoteo costaría más que registrarlo.
+        with self._stage(f"phase{phase}"):
+            status = runner(tableau, basis, on_iteration=record)
+        self._count(f"phase{phase}_pivots", len(history) - 1)
+        return status, history
 
-        zj_row = [0.0 for _ in range(len(variable_names) + 2)]
-        tableau.append(["Zj - Cj", *zj_row[1:]])
-        return tableau
+    def _drive_out_artificials(self, tableau, basis, artificial_indices, variable_names, phase1_tableaus):
+        is_artificial = np.zeros(len(variable_names), dtype=bool)
+        is_artificial[artificial_indices] = True
 
-    def _build_phase2_tableau(self, result, variable_names, artificial_indices):
-        filtered_names = [name for idx, name in enumerate(variable_names) if idx not in artificial_indices]
+        redundant_rows = []
+        for row in np.flatnonzero(is_artificial[basis]):
+            candidates = np.flatnonzero((np.abs(tableau[row, :-1]) > EPSILON) & ~is_artificial)
+            if not candidates.size:
+                redundant_rows.append(row)
+                continue
+            pivot(tableau, row, candidates[0])
+            basis[row] = candidates[0]
+            phase1_tableaus.record(tableau, basis)
+            self._count("phase1_pivots")
 
-        header = ["V. Básica", "Z", *filtered_names, "Solución"]
-        tableau = [header]
-
-        z_value = -result.fun if self.opt_type == "Maximizar" else result.fun
-        objective_row = [1.0] + [0.0 for _ in filtered_names] + [z_value]
-        tableau.append(["Z", *objective_row])
+        if redundant_rows:
+            tableau = np.delete(tableau, redundant_rows, axis=0)
+            basis = np.delete(basis, redundant_rows)
+        return tableau, basis
 
-        solution_row = [0.0 for _ in filtered_names]
-        for idx, value in enumerate(result.x):
-            if idx < len(solution_row):
-                solution_row[idx] = value
-        tableau.append(["Sol", 0.0, *solution_row, z_value])
+    def _remove_columns(self, tableau, basis, keep):
+        new_positions = np.full(tableau.shape[1] - 1, -1, dtype=np.intp)
+        new_positions[keep] = np.arange(keep.size)
+        columns = np.append(keep, tableau.shape[1] - 1)
+        return np.ascontiguousarray(tableau[:, columns]), new_positions[basis]
 
-        zj_row = [0.0 for _ in range(len(filtered_names) + 2)]
-        tableau.append(["Zj - Cj", *zj_row[1:]])
-        return tableau
+    def _extract_solution(self, tableau, basis, sign):
+        values = np.zeros(tableau.shape[1] - 1)
+        values[basis] = tableau[:-1, -1]
+        return {"X": values[:self.num_vars].tolist(), "Z": float(sign * tableau[-1, -1])}
 
     def _build_linprog_matrices(self):
-        A = []
-        b = []
-        for coeffs, relation, rhs in self.constraints:
-            if relation == ">=":
-                A.append([-c for c in coeffs])
-                b.append(-rhs)
-            elif relation == "<=":
-                A.append(coeffs)
-                b.append(rhs)
-            elif relation == "=":
-                A.append(coeffs)
-                b.append(rhs)
-                A.append([-c for c in coeffs])
-                b.append(-rhs)
-        return A, b
+        matrix, relations, rhs = self._constraint_arrays()
+        return build_linprog_form(matrix, relations, rhs, self.num_vars)
 
     def _format_solution(self, result):
         z_value = -result.fun if self.opt_type == "Maximizar" else result.fun
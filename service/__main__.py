@@ -0,0 +1,4 @@
+from service.http_service import main
+
+if __name__ == "__main__":
+    raise SystemExit(main())
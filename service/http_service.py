@@ -0,0 +1,335 @@
+"""
+Servicio local de resolución: JSON sobre HTTP con asyncio y un pool de procesos.
+
+Uso:
+    python -m service --port 8765 --workers 4 --max-queue 64 --timeout 30
+
+Rutas:
+    POST /solve[?timeout=segundos]  cuerpo: un problema con el formato de `python -m cli`
+    GET  /metrics                   contadores e histogramas de latencia (JSON)
+    GET  /health                    {"status": "ok"}
+
+La respuesta de /solve es el mismo registro que escribe la CLI (estado,
+X, Z, iteraciones...). Los problemas idénticos que llegan mientras uno
+igual se está resolviendo esperan ese mismo resultado en vez de encolarse
+de nuevo. Si ya hay `max_queue` problemas distintos pendientes la
+solicitud se rechaza con 503; si no termina antes del tiempo límite se
+responde 504. Solo escucha en localhost y usa únicamente la biblioteca
+estándar (más las dependencias del modelo en los procesos del pool).
+"""
+import argparse
+import asyncio
+import bisect
+import hashlib
+import json
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+HOST = "127.0.0.1"
+PORT = 8765
+MAX_QUEUE = 64
+TIMEOUT = 30.0
+MAX_BODY_BYTES = 8 * 1024 * 1024
+KEEP_ALIVE_SECONDS = 15.0
+# Límites superiores (ms) de los buckets de los histogramas; el último es +inf.
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+    413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable", 504: "Gateway Timeout",
+}
+
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class LatencyHistogram:
+    """Histograma acumulado de latencias en milisegundos con buckets fijos."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS_MS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total_ms = 0.0
+
+    def observe(self, milliseconds):
+        self.counts[bisect.bisect_left(self.buckets, milliseconds)] += 1
+        self.total_ms += milliseconds
+
+    def as_dict(self):
+        count = sum(self.counts)
+        return {
+            "count": count,
+            "sum_ms": self.total_ms,
+            "mean_ms": self.total_ms / count if count else 0.0,
+            "buckets": {**{f"le_{bound}": value for bound, value in zip(self.buckets, self.counts)}, "le_inf": self.counts[-1]},
+        }
+
+
+def _initialize_worker(cache_path):
+    # Importa el modelo una sola vez por proceso; con `cache_path` todos los
+    # procesos comparten además la caché SQLite de soluciones.
+    from model.two_phase_model import TwoPhaseMethodModel
+
+    if cache_path:
+        from model.disk_cache import DiskSolveCache
+        from model.solve_cache import SolveCache
+
+        TwoPhaseMethodModel.cache = DiskSolveCache(cache_path, memory=SolveCache())
+
+
+def _solve_request(problem, backend, presolve, tableaus):
+    """Se ejecuta en un proceso del pool: resuelve y arma el registro de la CLI."""
+    from cli.batch_solver import solve_problem
+
+    arguments = argparse.Namespace(backend=backend, presolve=presolve, tableaus=tableaus, instrument=False, instrument_allocations=False)
+    return solve_problem("solve", problem, arguments)
+
+
+class SolveService:
+    """
+    Front end asyncio sobre un ProcessPoolExecutor.
+
+    `jobs` guarda las resoluciones en curso por clave del problema; cada
+    una es un future del pool más la cantidad de solicitudes que la
+    esperan. Una solicitud que vence su tiempo límite deja de esperar, y si
+    era la última y el trabajo todavía no empezó, se cancela.
+    """
+
+    def __init__(self, workers=None, max_queue=MAX_QUEUE, timeout=TIMEOUT, backend="revised", presolve=False, cache_path=None, max_body_bytes=MAX_BODY_BYTES):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.backend = backend
+        self.presolve = presolve
+        self.max_body_bytes = max_body_bytes
+        # Con fork los procesos (que se crean al primer envío) heredarían los
+        # sockets de las conexiones abiertas y el cliente nunca vería el cierre.
+        self.executor = ProcessPoolExecutor(
+            self.workers, multiprocessing.get_context("spawn"), _initialize_worker, (cache_path,)
+        )
+        self.jobs = {}
+        self.started = time.monotonic()
+        self.counters = {
+            "requests": 0, "solved": 0, "coalesced": 0, "rejected": 0,
+            "timeouts": 0, "cancelled_jobs": 0, "client_errors": 0,
+        }
+        self.responses = {}
+        self.statuses = {}
+        self.latency = {"request": LatencyHistogram(), "solve": LatencyHistogram(), "queue_wait": LatencyHistogram()}
+
+    def problem_key(self, problem, options):
+        text = json.dumps([problem, options], sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+    async def solve(self, problem, timeout=None):
+        """Resuelve `problem` (dict) compartiendo el trabajo con solicitudes idénticas en curso."""
+        options = (
+            problem.get("backend", self.backend),
+            bool(problem.get("presolve", self.presolve)),
+            bool(problem.pop("tableaus", False)),
+        )
+        # El nombre no cambia la solución: dos solicitudes que solo difieren en él se unen.
+        key = self.problem_key({name: value for name, value in problem.items() if name != "name"}, options)
+        job = self.jobs.get(key)
+        if job is None:
+            if len(self.jobs) >= self.max_queue:
+                self.counters["rejected"] += 1
+                raise HttpError(503, f"Cola llena: {len(self.jobs)} problemas pendientes")
+            future = self.executor.submit(_solve_request, problem, *options)
+            job = self.jobs[key] = {"future": future, "result": asyncio.wrap_future(future), "waiters": 0, "queued": time.perf_counter()}
+            job["result"].add_done_callback(lambda _, key=key, job=job: self._finish(key, job))
+        else:
+            self.counters["coalesced"] += 1
+
+        job["waiters"] += 1
+        try:
+            record = await asyncio.wait_for(asyncio.shield(job["result"]), timeout or self.timeout)
+        except asyncio.TimeoutError:
+            self.counters["timeouts"] += 1
+            raise HttpError(504, f"Tiempo límite de {timeout or self.timeout:g} s agotado") from None
+        finally:
+            job["waiters"] -= 1
+            # Solo se puede cancelar un trabajo que todavía no tomó ningún proceso.
+            if job["waiters"] == 0 and job["future"].cancel():
+                self.counters["cancelled_jobs"] += 1
+        return {**record, "name": problem.get("name", record["name"])}
+
+    def _finish(self, key, job):
+        if self.jobs.get(key) is job:
+            del self.jobs[key]
+        if job["result"].cancelled() or job["result"].exception() is not None:
+            return
+        record = job["result"].result()
+        elapsed_ms = (time.perf_counter() - job["queued"]) * 1000
+        self.counters["solved"] += 1
+        self.statuses[record["status"]] = self.statuses.get(record["status"], 0) + 1
+        self.latency["solve"].observe(record["seconds"] * 1000)
+        self.latency["queue_wait"].observe(max(0.0, elapsed_ms - record["seconds"] * 1000))
+
+    def metrics(self):
+        return {
+            "uptime_seconds": time.monotonic() - self.started,
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "queue_depth": len(self.jobs),
+            "waiting_requests": sum(job["waiters"] for job in self.jobs.values()),
+            "counters": dict(self.counters),
+            "responses": {str(status): count for status, count in sorted(self.responses.items())},
+            "statuses": dict(self.statuses),
+            "latency_ms": {name: histogram.as_dict() for name, histogram in self.latency.items()},
+        }
+
+    async def route(self, method, target, body):
+        """Retorna (código, objeto JSON) para una solicitud ya leída."""
+        url = urlsplit(target)
+        if url.path == "/solve":
+            if method != "POST":
+                raise HttpError(405, "Use POST")
+            try:
+                problem = json.loads(body or b"null")
+            except ValueError as error:
+                raise HttpError(400, f"JSON inválido: {error}") from None
+            if not isinstance(problem, dict):
+                raise HttpError(400, "Se esperaba un objeto JSON con el problema")
+            return 200, await self.solve(problem, self.parse_timeout(url.query))
+        if url.path == "/metrics" and method == "GET":
+            return 200, self.metrics()
+        if url.path == "/health" and method == "GET":
+            return 200, {"status": "ok"}
+        raise HttpError(404, f"Ruta desconocida: {method} {url.path}")
+
+    def parse_timeout(self, query):
+        """Tiempo límite de ?timeout=segundos, o None si no se indicó."""
+        values = parse_qs(query).get("timeout")
+        if not values:
+            return None
+        try:
+            timeout = float(values[0])
+        except ValueError:
+            timeout = math.nan
+        if not (math.isfinite(timeout) and timeout > 0):
+            raise HttpError(400, f"Tiempo límite inválido: {values[0]}")
+        return timeout
+
+    async def handle_connection(self, reader, writer):
+        """Atiende solicitudes HTTP/1.1 sobre una conexión (keep-alive) hasta que el cliente la cierre."""
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(self.read_request(reader), KEEP_ALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    break
+                if request is None:
+                    break
+                method, target, headers, body = request
+                start = time.perf_counter()
+                self.counters["requests"] += 1
+                try:
+                    status, payload = await self.route(method, target, body)
+                except HttpError as error:
+                    status, payload = error.status, {"status": "error", "message": str(error)}
+                    self.counters["client_errors"] += 400 <= error.status < 500
+                except Exception as error:
+                    status, payload = 500, {"status": "error", "message": f"Error interno: {error!r}"}
+                self.responses[status] = self.responses.get(status, 0) + 1
+                keep_alive = headers.get("connection", "").lower() != "close"
+                await self.write_response(writer, status, payload, keep_alive)
+                self.latency["request"].observe((time.perf_counter() - start) * 1000)
+                if not keep_alive:
+                    break
+        except HttpError as error:
+            # Solicitud mal formada: se responde y se cierra, el resto del flujo no se puede interpretar.
+            self.counters["client_errors"] += 1
+            self.responses[error.status] = self.responses.get(error.status, 0) + 1
+            await self.write_response(writer, error.status, {"status": "error", "message": str(error)}, False)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def read_request(self, reader):
+        line = await reader.readline()
+        if not line.strip():
+            return None
+        try:
+            method, target, _ = line.decode("latin-1").split(" ", 2)
+        except ValueError:
+            raise HttpError(400, "Línea de solicitud inválida") from None
+        headers = {}
+        while True:
+            header = await reader.readline()
+            if header in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = header.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        try:
+            length = int(headers.get("content-length") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            raise HttpError(400, f"Content-Length inválido: {headers['content-length']}")
+        if length > self.max_body_bytes:
+            raise HttpError(413, f"El cuerpo supera {self.max_body_bytes} bytes")
+        body = await reader.readexactly(length) if length else b""
+        return method.upper(), target, headers, body
+
+    async def write_response(self, writer, status, payload, keep_alive):
+        body = json.dumps(payload, ensure_ascii=False, default=float).encode()
+        head = (
+            f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        )
+        if status == 503:
+            head += "Retry-After: 1\r\n"
+        writer.write(head.encode("latin-1") + b"\r\n" + body)
+        await writer.drain()
+
+    async def serve(self, host=HOST, port=PORT, ready=None):
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        if ready is not None:
+            ready(server)
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m service", description="Servicio local JSON/HTTP de resolución.")
+    parser.add_argument("--host", default=HOST, help="por defecto solo localhost")
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--workers", type=int, help="procesos del pool (por defecto uno por núcleo)")
+    parser.add_argument("--max-queue", type=int, default=MAX_QUEUE, help="problemas distintos pendientes antes de responder 503")
+    parser.add_argument("--timeout", type=float, default=TIMEOUT, help="segundos por solicitud antes de responder 504")
+    parser.add_argument("--backend", choices=("tableau", "revised", "highs", "highs-ds", "highs-ipm", "portfolio", "ipm"), default="revised")
+    parser.add_argument("--presolve", action="store_true")
+    parser.add_argument("--cache", help="caché SQLite de soluciones compartida por los procesos")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    arguments = parse_arguments(argv)
+    service = SolveService(
+        arguments.workers, arguments.max_queue, arguments.timeout, arguments.backend, arguments.presolve, arguments.cache
+    )
+
+    def ready(server):
+        address = server.sockets[0].getsockname()
+        print(f"Escuchando en http://{address[0]}:{address[1]} con {service.workers} procesos", flush=True)
+
+    try:
+        asyncio.run(service.serve(arguments.host, arguments.port, ready))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+    return 0
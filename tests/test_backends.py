@@ -0,0 +1,143 @@
+import numpy as np
+import pytest
+from scipy.optimize import linprog
+
+from model.linprog_form import build_linprog_form
+from model.portfolio import PortfolioStats, verify_feasible_value
+from model.two_phase_model import TwoPhaseMethodModel
+
+BACKENDS = ("tableau", "revised", "highs", "highs-ds", "highs-ipm", "portfolio", "ipm")
+STATUS_MESSAGES = {
+    2: "El problema no tiene solución factible.",
+    3: "El problema no está acotado.",
+}
+NUM_PROBLEMS = 150
+TOLERANCE = 1e-6
+
+
+@pytest.fixture(autouse=True)
+def no_cache(monkeypatch):
+    # Cada caso debe pasar por el solver, no por la caché compartida.
+    monkeypatch.setattr(TwoPhaseMethodModel, "cache", None)
+
+
+def random_problem(rng):
+    num_vars = int(rng.integers(1, 5))
+    num_constraints = int(rng.integers(1, 5))
+    matrix = rng.integers(-5, 6, size=(num_constraints, num_vars)).astype(float)
+    relations = rng.choice(["<=", ">=", "="], size=num_constraints, p=[0.5, 0.3, 0.2])
+    rhs = rng.integers(-3, 11, size=num_constraints).astype(float)
+    opt_type = str(rng.choice(["Maximizar", "Minimizar"]))
+    costs = rng.integers(-5, 6, size=num_vars).astype(float)
+    return opt_type, costs, matrix, relations, rhs
+
+
+def reference(opt_type, costs, matrix, relations, rhs):
+    sign = -1.0 if opt_type == "Maximizar" else 1.0
+    result = linprog(sign * costs, **build_linprog_form(matrix, relations, rhs, costs.size), method="highs")
+    if result.status == 0:
+        return sign * result.fun
+    return STATUS_MESSAGES[result.status]
+
+
+def solve(backend, presolve, opt_type, costs, matrix, relations, rhs):
+    constraints = [(row.tolist(), relation, value) for row, relation, value in zip(matrix, relations, rhs)]
+    model = TwoPhaseMethodModel(costs.size, len(constraints), opt_type, costs.tolist(), constraints, backend, presolve)
+    return model.solve()
+
+
+def assert_feasible(x, matrix, relations, rhs):
+    assert np.all(x >= -TOLERANCE)
+    activity = matrix @ x
+    allowed = TOLERANCE * (1.0 + np.abs(rhs))
+    for value, relation, limit, slack in zip(activity, relations, rhs, allowed):
+        if relation == "<=":
+            assert value <= limit + slack
+        elif relation == ">=":
+            assert value >= limit - slack
+        else:
+            assert abs(value - limit) <= slack
+
+
+def check(result, expected, costs, matrix, relations, rhs):
+    if isinstance(expected, str):
+        assert result == expected
+        return
+    assert isinstance(result, dict), result
+    solution = result["solution"]
+    x = np.asarray(solution["X"], dtype=float)
+    assert solution["Z"] == pytest.approx(expected, rel=TOLERANCE, abs=TOLERANCE)
+    assert costs @ x == pytest.approx(solution["Z"], rel=TOLERANCE, abs=TOLERANCE)
+    assert_feasible(x, matrix, relations, rhs)
+
+
+@pytest.mark.parametrize("presolve", [False, True], ids=["", "presolve"])
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_random_problems_match_linprog(backend, presolve):
+    rng = np.random.default_rng(2024)
+    for _ in range(NUM_PROBLEMS):
+        problem = random_problem(rng)
+        check(solve(backend, presolve, *problem), reference(*problem), *problem[1:])
+
+
+CASES = {
+    "optimo": ("Maximizar", [3.0, 5.0], [[1.0, 0.0], [0.0, 2.0], [3.0, 2.0]], ["<=", "<=", "<="], [4.0, 12.0, 18.0]),
+    "mayor_igual": ("Minimizar", [2.0, 3.0], [[1.0, 1.0], [1.0, 3.0]], [">=", ">="], [4.0, 6.0]),
+    "infactible": ("Maximizar", [1.0, 1.0], [[1.0, 1.0], [1.0, 1.0]], ["<=", ">="], [2.0, 5.0]),
+    "no_acotado": ("Maximizar", [1.0, 1.0], [[1.0, -1.0]], ["<="], [1.0]),
+    "igualdades_incompatibles": ("Minimizar", [1.0], [[-3.0], [4.0]], ["=", "="], [-2.0, 10.0]),
+    "igualdades_redundantes": ("Minimizar", [1.0, 2.0], [[1.0, 1.0], [2.0, 2.0]], ["=", "="], [3.0, 6.0]),
+    "fila_vacia_no_acotado": ("Maximizar", [5.0], [[0.0]], ["<="], [4.0]),
+    "fila_vacia_optimo": ("Minimizar", [5.0], [[0.0]], ["<="], [4.0]),
+}
+
+
+def case(name):
+    opt_type, costs, matrix, relations, rhs = CASES[name]
+    return opt_type, np.array(costs), np.array(matrix), np.array(relations), np.array(rhs)
+
+
+@pytest.mark.parametrize("presolve", [False, True], ids=["", "presolve"])
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("name", list(CASES))
+def test_known_cases(name, backend, presolve):
+    problem = case(name)
+    check(solve(backend, presolve, *problem), reference(*problem), *problem[1:])
+
+
+@pytest.mark.parametrize("presolve", [False, True], ids=["", "presolve"])
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_unknown_relation_is_a_configuration_error(backend, presolve):
+    constraints = [([1.0, 1.0], "<>", 4.0)]
+    result = TwoPhaseMethodModel(2, 1, "Maximizar", [2.0, 1.0], constraints, backend, presolve).solve()
+    assert result == "Error en la configuración del problema"
+
+
+def test_unknown_backend_is_rejected():
+    result = TwoPhaseMethodModel(1, 1, "Maximizar", [1.0], [([1.0], "<=", 1.0)], backend="simplex").solve()
+    assert result == "Error: Backend desconocido: simplex"
+
+
+@pytest.mark.parametrize("cpus", [1, 3])
+def test_portfolio_does_not_trust_a_lone_highs_conclusion(monkeypatch, cpus):
+    # HiGHS a veces informa infactible un problema que en realidad no está acotado.
+    monkeypatch.setattr(TwoPhaseMethodModel, "_solve_highs", lambda self: "El problema no tiene solución factible.")
+    monkeypatch.setattr(TwoPhaseMethodModel, "portfolio_stats", PortfolioStats())
+    monkeypatch.setattr("os.cpu_count", lambda: cpus)
+    assert solve("portfolio", False, *case("no_acotado")) == "El problema no está acotado."
+
+
+def test_portfolio_check_covers_feasibility_and_value_only():
+    _, costs, matrix, relations, rhs = case("optimo")
+    assert verify_feasible_value(costs, matrix, relations, rhs, {"X": [2.0, 6.0], "Z": 36.0})
+    assert not verify_feasible_value(costs, matrix, relations, rhs, {"X": [2.0, 6.0], "Z": 35.0})
+    assert not verify_feasible_value(costs, matrix, relations, rhs, {"X": [4.0, 6.0], "Z": 42.0})
+    assert not verify_feasible_value(costs, matrix, relations, rhs, {"X": [-1.0, 0.0], "Z": -3.0})
+    # Un punto factible pero no óptimo pasa: la optimalidad no se comprueba.
+    assert verify_feasible_value(costs, matrix, relations, rhs, {"X": [0.0, 0.0], "Z": 0.0})
+
+
+def test_interior_point_reports_its_iterations():
+    result = solve("ipm", False, *case("optimo"))
+    assert result["iterations"]["interior_point"] > 0
+    assert result["solution"]["X"] == pytest.approx([2.0, 6.0])
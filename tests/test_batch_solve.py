@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+
+from model import batch_solve
+from model.two_phase_model import TwoPhaseMethodModel
+
+MESSAGES = {
+    "infeasible": "El problema no tiene solución factible.",
+    "unbounded": "El problema no está acotado.",
+}
+TOLERANCE = 1e-6
+
+
+@pytest.fixture(autouse=True)
+def no_cache(monkeypatch):
+    monkeypatch.setattr(TwoPhaseMethodModel, "cache", None)
+
+
+def model(opt_type, costs, matrix, relations, rhs):
+    constraints = [(list(row), relation, value) for row, relation, value in zip(matrix, relations, rhs)]
+    return TwoPhaseMethodModel(len(costs), len(constraints), opt_type, list(costs), constraints)
+
+
+def assert_matches_cold_solve(batch, scenario, opt_type, costs, matrix, relations, rhs):
+    expected = model(opt_type, costs, matrix, relations, rhs).solve()
+    status = batch["status"][scenario]
+    if isinstance(expected, str):
+        assert MESSAGES.get(status) == expected, (scenario, status, expected)
+        return
+    assert status == "optimal", (scenario, status)
+    assert batch["Z"][scenario] == pytest.approx(expected["solution"]["Z"], rel=TOLERANCE, abs=TOLERANCE)
+    assert np.asarray(costs) @ batch["X"][scenario] == pytest.approx(batch["Z"][scenario], rel=TOLERANCE, abs=TOLERANCE)
+
+
+def random_system(rng):
+    num_vars = int(rng.integers(2, 5))
+    num_constraints = int(rng.integers(2, 5))
+    matrix = rng.integers(-4, 6, size=(num_constraints, num_vars)).astype(float)
+    relations = rng.choice(["<=", ">=", "="], size=num_constraints, p=[0.5, 0.3, 0.2]).tolist()
+    return matrix, relations
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_rhs_batch_matches_independent_solves(seed):
+    rng = np.random.default_rng(seed)
+    matrix, relations = random_system(rng)
+    opt_type = str(rng.choice(["Maximizar", "Minimizar"]))
+    costs = rng.integers(-4, 6, size=matrix.shape[1]).astype(float)
+    # Lados derechos de ambos signos: mezcla escenarios óptimos, infactibles y no acotados.
+    rhs_batch = rng.integers(-6, 12, size=(12, matrix.shape[0])).astype(float)
+    batch = model(opt_type, costs, matrix, relations, rhs_batch[0]).solve_batch(rhs=rhs_batch)
+    for scenario, rhs in enumerate(rhs_batch):
+        assert_matches_cold_solve(batch, scenario, opt_type, costs, matrix, relations, rhs)
+
+
+def test_rhs_batch_recovers_after_infeasible_and_unbounded_scenarios():
+    # x1 - x2 <= b1, x1 + x2 >= b2, x2 <= b3: la última fila acota el objetivo.
+    matrix = np.array([[1.0, -1.0], [1.0, 1.0], [0.0, 1.0]])
+    relations = ["<=", ">=", "<="]
+    rhs_batch = np.array([
+        [1.0, 2.0, -1.0],
+        [1.0, 2.0, 5.0],
+        [-3.0, 2.0, 1.0],
+        [2.0, -4.0, 3.0],
+        [0.0, 0.0, 0.0],
+    ])
+    costs = [1.0, 2.0]
+    batch = model("Maximizar", costs, matrix, relations, rhs_batch[0]).solve_batch(rhs=rhs_batch)
+    assert batch["status"].tolist() == ["infeasible", "optimal", "infeasible", "optimal", "optimal"]
+    for scenario, rhs in enumerate(rhs_batch):
+        assert_matches_cold_solve(batch, scenario, "Maximizar", costs, matrix, relations, rhs)
+
+    # Sin la última fila el objetivo no está acotado en los escenarios factibles.
+    rhs_batch = np.array([[1.0, 2.0], [1.0, -2.0], [-3.0, 0.0]])
+    batch = model("Maximizar", costs, matrix[:2], relations[:2], rhs_batch[0]).solve_batch(rhs=rhs_batch)
+    assert batch["status"].tolist() == ["unbounded"] * 3
+    for scenario, rhs in enumerate(rhs_batch):
+        assert_matches_cold_solve(batch, scenario, "Maximizar", costs, matrix[:2], relations[:2], rhs)
+
+
+def test_batch_builds_the_standard_form_once(monkeypatch):
+    calls = []
+    original = batch_solve.build_standard_form
+    monkeypatch.setattr(batch_solve, "build_standard_form", lambda *args, **kwargs: calls.append(1) or original(*args, **kwargs))
+    matrix = np.array([[1.0, 1.0], [0.0, 1.0]])
+    rhs_batch = np.array([[4.0, -1.0], [4.0, -2.0], [4.0, 1.0], [-1.0, 1.0], [6.0, 2.0]])
+    batch = model("Maximizar", [1.0, 1.0], matrix, ["<=", "<="], rhs_batch[0]).solve_batch(rhs=rhs_batch)
+    assert batch["status"].tolist() == ["infeasible", "infeasible", "optimal", "infeasible", "optimal"]
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_objective_batch_matches_independent_solves(seed):
+    rng = np.random.default_rng(1000 + seed)
+    matrix, relations = random_system(rng)
+    rhs = rng.integers(-3, 12, size=matrix.shape[0]).astype(float)
+    opt_type = str(rng.choice(["Maximizar", "Minimizar"]))
+    objectives = rng.integers(-4, 6, size=(12, matrix.shape[1])).astype(float)
+    batch = model(opt_type, objectives[0], matrix, relations, rhs).solve_batch(objectives=objectives)
+    for scenario, costs in enumerate(objectives):
+        assert_matches_cold_solve(batch, scenario, opt_type, costs, matrix, relations, rhs)
+
+
+def test_objective_batch_recovers_after_unbounded_scenarios():
+    matrix = np.array([[1.0, -1.0], [1.0, 0.0]])
+    relations = ["<=", ">="]
+    rhs = [2.0, -1.0]
+    objectives = np.array([[1.0, 1.0], [-1.0, -1.0], [0.0, 1.0], [-2.0, 1.0], [-1.0, 0.0]])
+    batch = model("Minimizar", objectives[0], matrix, relations, rhs).solve_batch(objectives=objectives)
+    assert batch["status"].tolist() == ["optimal", "unbounded", "optimal", "unbounded", "unbounded"]
+    for scenario, costs in enumerate(objectives):
+        assert_matches_cold_solve(batch, scenario, "Minimizar", costs, matrix, relations, rhs)
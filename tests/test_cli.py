@@ -0,0 +1,47 @@
+import argparse
+
+import pytest
+
+from cli.batch_solver import solve_problem
+from model.two_phase_model import TwoPhaseMethodModel
+
+PROBLEM = {"opt_type": "Maximizar", "objective": [3, 5], "constraints": [[[1, 0], "<=", 4], [[0, 2], "<=", 12], [[3, 2], "<=", 18]]}
+
+
+class ListSink:
+    def __init__(self):
+        self.records = []
+
+    def write(self, record):
+        self.records.append(record)
+
+
+def arguments(**overrides):
+    values = {"backend": "revised", "presolve": False, "tableaus": False, "instrument": False, "instrument_allocations": False}
+    return argparse.Namespace(**{**values, **overrides})
+
+
+@pytest.fixture(autouse=True)
+def no_cache(monkeypatch):
+    monkeypatch.setattr(TwoPhaseMethodModel, "cache", None)
+
+
+def test_record_contains_solution():
+    record = solve_problem("p", dict(PROBLEM), arguments())
+    assert record["status"] == "optimal"
+    assert record["X"] == pytest.approx([2.0, 6.0])
+    assert record["Z"] == pytest.approx(36.0)
+
+
+def test_instrumentation_is_labelled_with_the_problem_backend():
+    sink = ListSink()
+    solve_problem("p", {**PROBLEM, "backend": "tableau"}, arguments(backend="revised"), sink)
+    solve_problem("q", dict(PROBLEM), arguments(backend="revised"), sink)
+    assert [record["backend"] for record in sink.records] == ["tableau", "revised"]
+
+
+def test_unknown_relation_is_reported_as_error():
+    problem = {**PROBLEM, "constraints": [[[1, 1], "<>", 2]]}
+    record = solve_problem("p", problem, arguments(backend="highs"))
+    assert record["status"] == "error"
+    assert record["message"] == "Error en la configuración del problema"
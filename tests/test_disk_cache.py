@@ -0,0 +1,108 @@
+import multiprocessing
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from model import disk_cache
+from model.disk_cache import DiskSolveCache
+from model.solve_cache import SolveCache
+
+
+class Clock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(disk_cache, "time", SimpleNamespace(time=clock))
+    return clock
+
+
+@pytest.mark.parametrize("memory", [False, True], ids=["disco", "memoria"])
+def test_entries_expire_after_max_age(tmp_path, clock, memory):
+    cache = DiskSolveCache(tmp_path / "cache.db", max_age_seconds=60, memory=SolveCache() if memory else None)
+    cache.put("a", {"Z": 1.0})
+    clock.now += 59
+    assert cache.get("a") == {"Z": 1.0}
+    clock.now += 2
+    assert cache.get("a") is None
+    assert "a" not in cache
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_memory_promotion_keeps_the_disk_creation_time(tmp_path, clock):
+    DiskSolveCache(tmp_path / "cache.db", max_age_seconds=60).put("a", 1)
+    clock.now += 50
+    cache = DiskSolveCache(tmp_path / "cache.db", max_age_seconds=60, memory=SolveCache())
+    assert cache.get("a") == 1
+    clock.now += 20
+    assert cache.get("a") is None
+
+
+def test_size_eviction_drops_least_recently_used(tmp_path, clock):
+    payload = "x" * 1000
+    cache = DiskSolveCache(tmp_path / "cache.db", max_bytes=3500)
+    for key in "abc":
+        cache.put(key, payload)
+        clock.now += 1
+    cache.get("a")
+    clock.now += 1
+    cache.put("d", payload)
+    assert "a" in cache and "c" in cache and "d" in cache
+    assert "b" not in cache
+    assert cache.stats()["bytes"] <= 3500
+
+
+def test_oversized_payload_is_not_stored(tmp_path):
+    cache = DiskSolveCache(tmp_path / "cache.db", max_bytes=100)
+    cache.put("a", "x" * 1000)
+    assert len(cache) == 0
+
+
+def test_concurrent_gets_count_every_lookup(tmp_path):
+    cache = DiskSolveCache(tmp_path / "cache.db", memory=SolveCache(max_entries=4))
+    for key in range(8):
+        cache.put(key, key)
+
+    def work():
+        for index in range(200):
+            cache.get(index % 12)
+
+    threads = [threading.Thread(target=work) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats = cache.stats()
+    assert stats["hits"] + stats["misses"] == 6 * 200
+    assert stats["misses"] == 6 * sum(1 for index in range(200) if index % 12 >= 8)
+
+
+def write_entries(path, keys):
+    cache = DiskSolveCache(path)
+    for key in keys:
+        cache.put(key, {"key": key})
+    cache.close()
+
+
+def test_entries_are_shared_between_processes(tmp_path):
+    path = tmp_path / "cache.db"
+    cache = DiskSolveCache(path, memory=SolveCache())
+    cache.put("padre", {"key": "padre"})
+    context = multiprocessing.get_context("spawn")
+    writers = [context.Process(target=write_entries, args=(path, [f"p{number}-{index}" for index in range(20)])) for number in range(2)]
+    for writer in writers:
+        writer.start()
+    for writer in writers:
+        writer.join()
+        assert writer.exitcode == 0
+    assert len(cache) == 41
+    assert cache.get("p1-19") == {"key": "p1-19"}
+    assert DiskSolveCache(path).get("padre") == {"key": "padre"}
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+from scipy.optimize import linprog
+
+from model.GraphicMethodModel import GraphicMethodModel, solve_2d
+from model.solve_progress import SolveCancelled
+
+
+def random_restrictions(rng):
+    restrictions = []
+    for _ in range(int(rng.integers(1, 8))):
+        coef1, coef2 = rng.integers(-5, 6, size=2).astype(float)
+        restrictions.append((coef1, coef2, str(rng.choice(["<=", ">=", "="], p=[0.6, 0.3, 0.1])), float(rng.integers(-3, 15))))
+    return restrictions
+
+
+def reference(costs, restrictions):
+    upper, upper_rhs, equal, equal_rhs = [], [], [], []
+    for coef1, coef2, inequality, limit in restrictions:
+        if inequality == "=":
+            equal.append((coef1, coef2))
+            equal_rhs.append(limit)
+        else:
+            sign = 1.0 if inequality == "<=" else -1.0
+            upper.append((sign * coef1, sign * coef2))
+            upper_rhs.append(sign * limit)
+    return linprog(
+        costs,
+        A_ub=np.array(upper).reshape(-1, 2), b_ub=upper_rhs,
+        A_eq=np.array(equal).reshape(-1, 2), b_eq=equal_rhs,
+        method="highs",
+    )
+
+
+def test_seidel_matches_linprog():
+    rng = np.random.default_rng(7)
+    statuses = {0: "optimal", 2: "infeasible", 3: "unbounded"}
+    for _ in range(300):
+        costs = rng.integers(-5, 6, size=2).astype(float)
+        restrictions = random_restrictions(rng)
+        expected = reference(costs, restrictions)
+        status, point = solve_2d(costs, restrictions)
+        assert status == statuses[expected.status]
+        if status == "optimal":
+            assert costs @ point == pytest.approx(expected.fun, abs=1e-6)
+
+
+@pytest.mark.parametrize(
+    "objective, restrictions, expected",
+    [
+        (("max", 3.0, 5.0), [(1.0, 0.0, "<=", 4.0), (0.0, 2.0, "<=", 12.0), (3.0, 2.0, "<=", 18.0)], {"X": [2.0, 6.0], "Z": 36.0}),
+        (("min", 2.0, 3.0), [(1.0, 1.0, ">=", 4.0), (1.0, 3.0, ">=", 6.0)], {"X": [3.0, 1.0], "Z": 9.0}),
+        (("max", 1.0, 1.0), [(1.0, 1.0, "<=", 2.0), (1.0, 1.0, ">=", 5.0)], "El problema no tiene solución factible."),
+        (("max", 1.0, 1.0), [(1.0, -1.0, "<=", 1.0)], "El problema no está acotado."),
+    ],
+    ids=["maximo", "minimo", "infactible", "no_acotado"],
+)
+def test_graphic_model(objective, restrictions, expected):
+    model = GraphicMethodModel()
+    model.set_objective(*objective)
+    model.set_restrictions(restrictions)
+    result = model.solve()
+    if isinstance(expected, str):
+        assert result == expected
+    else:
+        assert result["X"] == pytest.approx(expected["X"])
+        assert result["Z"] == pytest.approx(expected["Z"])
+
+
+def tangent_restrictions(count):
+    # Tangentes al círculo de radio 10: todas aportan un borde distinto.
+    angles = np.linspace(0.0, 2.0 * np.pi, count, endpoint=False)
+    return [(float(np.cos(angle)), float(np.sin(angle)), "<=", 10.0) for angle in angles]
+
+
+def test_cancellation_check_runs_inside_the_seidel_loop():
+    calls = []
+    status, _ = solve_2d(np.array([-1.0, -1.0]), tangent_restrictions(20_000), check=lambda: calls.append(1))
+    assert status == "optimal"
+    assert len(calls) >= 20_000 // 1024
+
+    def cancel():
+        if len(calls) > 3:
+            raise SolveCancelled()
+        calls.append(1)
+
+    calls.clear()
+    model = GraphicMethodModel()
+    model.set_objective("Maximizar", 1.0, 1.0)
+    model.set_restrictions(tangent_restrictions(20_000))
+    with pytest.raises(SolveCancelled):
+        model.solve(cancel)
+    assert len(calls) == 4
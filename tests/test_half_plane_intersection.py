@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from model.solve_progress import SolveCancelled
+from utils.half_plane_intersection import feasible_polygon, half_plane_intersection
+
+VIEWPORT = (0.0, 10.0, 0.0, 10.0)
+
+
+def polygon_area(vertices):
+    x, y = vertices[:, 0], vertices[:, 1]
+    return 0.5 * (np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+
+
+def test_triangle_is_counterclockwise():
+    vertices = feasible_polygon([(1.0, 1.0, "<=", 4.0)], VIEWPORT)
+    assert vertices.shape == (3, 2)
+    assert polygon_area(vertices) == pytest.approx(8.0, rel=1e-6)
+
+
+def test_unbounded_region_is_clipped_to_viewport():
+    vertices = feasible_polygon([(1.0, -1.0, "<=", 0.0)], VIEWPORT)
+    assert vertices.max(axis=0) == pytest.approx([10.0, 10.0])
+    assert polygon_area(vertices) == pytest.approx(50.0, rel=1e-6)
+
+
+def test_equality_gives_segment():
+    vertices = feasible_polygon([(1.0, 1.0, "=", 4.0)], VIEWPORT)
+    assert vertices.shape == (2, 2)
+    assert sorted(vertices.round(6).tolist()) == [[0.0, 4.0], [4.0, 0.0]]
+
+
+def test_degenerate_point_and_empty_regions():
+    assert feasible_polygon([(1.0, 1.0, "<=", 0.0)], VIEWPORT).round(6).tolist() == [[0.0, 0.0]]
+    assert feasible_polygon([(1.0, 1.0, ">=", 5.0), (1.0, 1.0, "<=", 4.0)], VIEWPORT).size == 0
+    assert half_plane_intersection([(0.0, 0.0)], [-1.0], VIEWPORT).size == 0
+
+
+def test_many_cuts_approach_quarter_circle():
+    rng = np.random.default_rng(3)
+    angles = rng.uniform(0, np.pi / 2, size=300)
+    coeffs = np.column_stack([np.cos(angles), np.sin(angles)])
+    vertices = half_plane_intersection(coeffs, np.full(300, 5.0), VIEWPORT)
+    # Las tangentes a un círculo de radio 5 encierran casi un cuarto de círculo.
+    assert polygon_area(vertices) == pytest.approx(np.pi * 25 / 4, rel=1e-3)
+
+
+def test_cancellation_check_runs_inside_the_sweep():
+    angles = np.linspace(0.0, 2.0 * np.pi, 5000, endpoint=False)
+    coeffs = np.column_stack([np.cos(angles), np.sin(angles)])
+    calls = []
+    vertices = half_plane_intersection(coeffs, np.full(5000, 4.0), (-5.0, 5.0, -5.0, 5.0), check=lambda: calls.append(1))
+    assert vertices.shape[0] > 1000
+    assert len(calls) == 5
+
+    def cancel():
+        raise SolveCancelled()
+
+    with pytest.raises(SolveCancelled):
+        feasible_polygon([(1.0, 1.0, "<=", 4.0)], VIEWPORT, check=cancel)
@@ -0,0 +1,33 @@
+from model.instrumentation import Instrumentation
+from model.two_phase_model import TwoPhaseMethodModel
+
+
+def test_nested_stage_keeps_outer_peak():
+    instrumentation = Instrumentation(track_allocations=True)
+    with instrumentation.stage("outer"):
+        block = bytearray(4 * 1024 * 1024)
+        del block
+        with instrumentation.stage("inner"):
+            small = bytearray(1024)
+            del small
+    assert instrumentation.stages["outer"]["peak_kb"] >= 4 * 1024
+    assert instrumentation.stages["inner"]["peak_kb"] < 1024
+
+
+def test_inner_peak_counts_for_outer_stage():
+    instrumentation = Instrumentation(track_allocations=True)
+    with instrumentation.stage("outer"):
+        with instrumentation.stage("inner"):
+            block = bytearray(4 * 1024 * 1024)
+            del block
+    assert instrumentation.stages["outer"]["peak_kb"] >= 4 * 1024
+
+
+def test_solve_reports_one_stage_per_phase(monkeypatch):
+    monkeypatch.setattr(TwoPhaseMethodModel, "cache", None)
+    constraints = [([1.0, 0.0], "<=", 4.0), ([0.0, 2.0], "<=", 12.0), ([3.0, 2.0], "<=", 18.0), ([1.0, 1.0], ">=", 2.0)]
+    instrumentation = Instrumentation()
+    result = TwoPhaseMethodModel(2, 4, "Maximizar", [3.0, 5.0], constraints).solve(instrumentation=instrumentation)
+    stages = result["instrumentation"]["stages"]
+    assert stages["phase1"]["calls"] == 1 and stages["phase2"]["calls"] == 1
+    assert result["instrumentation"]["counters"]["phase2_pivots"] == len(result["phase2_tableaus"]) - 1
@@ -0,0 +1,127 @@
+import os
+import time
+
+import numpy as np
+import pytest
+from scipy import sparse
+
+from model import parallel_batch
+from model.parallel_batch import solve_parallel
+
+SOLVE_ONE = parallel_batch._solve_one
+
+
+def delayed_solve(problem, keep_tableaus):
+    # Reemplaza a _solve_one en los workers para fijar qué problema termina último.
+    time.sleep(problem.get("delay", 0.0))
+    return SOLVE_ONE(problem, keep_tableaus)
+
+
+@pytest.fixture
+def created_blocks(monkeypatch):
+    """Nombres de los bloques de memoria compartida creados durante el test."""
+    names = []
+
+    class RecordingSharedMatrix(parallel_batch.SharedMatrix):
+        def __init__(self, matrix):
+            super().__init__(matrix)
+            names.append(self.memory.name)
+
+    monkeypatch.setattr(parallel_batch, "SharedMatrix", RecordingSharedMatrix)
+    return names
+
+
+def leftover(names):
+    return [name for name in names if os.path.exists(os.path.join("/dev/shm", name.lstrip("/")))]
+
+
+def problem(matrix, rhs, **extra):
+    return {"objective": [3.0, 5.0], "matrix": matrix, "relations": ["<=", "<=", "<="], "rhs": rhs, **extra}
+
+
+MATRIX = np.array([[1.0, 0.0], [0.0, 2.0], [3.0, 2.0]])
+
+
+def expected_z(rhs):
+    # Maximizar 3 x1 + 5 x2 con x1 <= b1, 2 x2 <= b2, 3 x1 + 2 x2 <= b3 (b >= 0).
+    x2 = min(rhs[1] / 2.0, rhs[2] / 2.0)
+    x1 = min(rhs[0], (rhs[2] - 2.0 * x2) / 3.0)
+    return 3.0 * x1 + 5.0 * x2
+
+
+def sweep(count):
+    return [[4.0 + index, 12.0, 18.0 + index] for index in range(count)]
+
+
+@pytest.mark.parametrize("ordered", [True, False], ids=["ordenado", "desordenado"])
+def test_ordered_and_unordered_output(monkeypatch, ordered):
+    monkeypatch.setattr(parallel_batch, "_solve_one", delayed_solve)
+    rhs = sweep(4)
+    problems = [problem(MATRIX, values, delay=1.0 if index == 0 else 0.0) for index, values in enumerate(rhs)]
+    output = list(solve_parallel(problems, processes=2, ordered=ordered))
+    indices = [index for index, _ in output]
+    if ordered:
+        assert indices == [0, 1, 2, 3]
+    else:
+        assert sorted(indices) == [0, 1, 2, 3]
+        assert indices[-1] == 0
+    for index, result in output:
+        assert result["solution"]["Z"] == pytest.approx(expected_z(rhs[index]))
+        assert result["phase2_tableaus"] == []
+
+
+@pytest.mark.parametrize("ordered", [True, False], ids=["ordenado", "desordenado"])
+def test_generator_input_respects_max_in_flight(ordered):
+    consumed = []
+
+    def problems():
+        for index, values in enumerate(sweep(12)):
+            consumed.append(index)
+            yield problem(MATRIX, values)
+
+    yielded = 0
+    for index, result in solve_parallel(problems(), processes=2, ordered=ordered, max_in_flight=3):
+        assert len(consumed) <= yielded + 3
+        assert result["solution"]["Z"] == pytest.approx(expected_z(sweep(12)[index]))
+        yielded += 1
+    assert yielded == 12
+
+
+@pytest.mark.parametrize("layout", ["dense", "csr", "csc"])
+def test_problems_with_the_same_matrix_share_one_block(created_blocks, layout):
+    first = MATRIX if layout == "dense" else sparse.csr_matrix(MATRIX).asformat(layout)
+    second = first.copy()
+    problems = [problem(first, values) for values in sweep(5)] + [problem(second, values) for values in sweep(3)]
+    output = dict(solve_parallel(problems, processes=2, share_min_bytes=0))
+    assert len(created_blocks) == 2
+    assert leftover(created_blocks) == []
+    rhs = sweep(5) + sweep(3)
+    for index, result in output.items():
+        assert result["solution"]["Z"] == pytest.approx(expected_z(rhs[index]))
+
+
+def test_small_matrices_are_sent_with_the_task(created_blocks):
+    output = list(solve_parallel([problem(MATRIX, values) for values in sweep(3)], processes=1))
+    assert len(output) == 3
+    assert created_blocks == []
+
+
+def test_closing_the_generator_early_releases_every_block(monkeypatch, created_blocks):
+    monkeypatch.setattr(parallel_batch, "_solve_one", delayed_solve)
+    problems = [problem(MATRIX.copy(), values, delay=0.0 if index == 0 else 0.5) for index, values in enumerate(sweep(6))]
+    gen = solve_parallel(problems, processes=2, max_in_flight=4, share_min_bytes=0)
+    index, result = next(gen)
+    assert index == 0
+    assert len(created_blocks) >= 2
+    gen.close()
+    assert leftover(created_blocks) == []
+
+
+def test_idle_blocks_are_released_beyond_the_limit(monkeypatch, created_blocks):
+    monkeypatch.setattr(parallel_batch, "MAX_ATTACHED", 1)
+    problems = [problem(MATRIX.copy(), values) for values in sweep(8)]
+    for _ in solve_parallel(problems, processes=1, max_in_flight=1, share_min_bytes=0):
+        # Como mucho el bloque en curso y uno ocioso.
+        assert len(leftover(created_blocks)) <= 2
+    assert len(created_blocks) == 8
+    assert leftover(created_blocks) == []
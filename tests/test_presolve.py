@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+from scipy import sparse
+
+from model.presolve import presolve
+from model.two_phase_model import TwoPhaseMethodModel
+
+
+@pytest.fixture(autouse=True)
+def no_cache(monkeypatch):
+    monkeypatch.setattr(TwoPhaseMethodModel, "cache", None)
+
+
+def test_empty_row_is_removed_and_singleton_row_becomes_bound():
+    matrix = np.array([[1.0, 1.0, 0.0], [0.0, 0.0, 0.0], [2.0, 0.0, 0.0], [1.0, 1.0, 1.0]])
+    reduced = presolve(np.array([-1.0, -2.0, 0.0]), matrix, np.array(["<=", "<=", "<=", "="]), np.array([4.0, 3.0, 2.0, 5.0]))
+    assert reduced.status == "reduced"
+    assert reduced.removed_rows == 1
+    # 2 x1 <= 2 queda como la cota x1 <= 1 al final.
+    assert reduced.relations.tolist() == ["<=", "=", "<="]
+    assert reduced.rhs.tolist() == [4.0, 5.0, 1.0]
+
+
+@pytest.mark.parametrize(
+    "matrix, relations, rhs",
+    [
+        ([[0.0, 0.0]], ["<="], [-1.0]),
+        ([[1.0, 0.0], [1.0, 0.0]], [">=", "<="], [3.0, 2.0]),
+    ],
+    ids=["fila_vacia", "cotas_cruzadas"],
+)
+def test_detects_infeasibility(matrix, relations, rhs):
+    reduced = presolve(np.ones(2), np.array(matrix), np.array(relations), np.array(rhs))
+    assert reduced.status == "infeasible"
+
+
+def test_postsolve_restores_fixed_columns():
+    costs = np.array([1.0, 1.0])
+    reduced = presolve(costs, np.array([[1.0, 0.0], [1.0, 1.0]]), np.array(["=", "<="]), np.array([3.0, 5.0]))
+    assert reduced.variable_indices.size == 0
+    assert reduced.postsolve(np.zeros(0)).tolist() == [3.0, 0.0]
+    assert reduced.objective_offset(costs) == pytest.approx(3.0)
+
+
+def test_sparse_input_stays_sparse():
+    matrix = sparse.csr_matrix(np.array([[1.0, 2.0, 0.0], [0.0, 1.0, 1.0], [0.0, 0.0, 0.0]]))
+    reduced = presolve(np.array([-1.0, -1.0, -1.0]), matrix, np.array(["<=", "<=", "<="]), np.array([4.0, 3.0, 1.0]))
+    assert sparse.issparse(reduced.matrix)
+    assert reduced.removed_rows == 1
+
+
+@pytest.mark.parametrize("backend", ["tableau", "revised"])
+def test_model_postsolve_reports_original_columns(backend):
+    constraints = [([1.0, 1.0], "<=", 4.0), ([0.0, 0.0], "<=", 1.0), ([1.0, 0.0], "=", 1.0)]
+    result = TwoPhaseMethodModel(2, 3, "Maximizar", [2.0, 3.0], constraints, backend, presolve=True).solve()
+    plain = TwoPhaseMethodModel(2, 3, "Maximizar", [2.0, 3.0], constraints, backend).solve()
+    assert result["solution"]["X"] == pytest.approx(plain["solution"]["X"])
+    assert result["solution"]["Z"] == pytest.approx(plain["solution"]["Z"])
+    assert result["solution"]["columns"] == pytest.approx({"X1": 1.0, "X2": 3.0, "S1": 0.0, "S2": 1.0, "R1": 0.0})
+    assert result["presolve"]["rows_removed"] >= 1
@@ -0,0 +1,133 @@
+import asyncio
+import json
+
+import numpy as np
+import pytest
+
+from service.http_service import SolveService
+
+
+def problem(size, seed=0, name=None):
+    rng = np.random.default_rng(seed)
+    matrix = rng.uniform(1.0, 10.0, size=(size, size))
+    data = {
+        "opt_type": "Maximizar",
+        "objective": rng.uniform(1.0, 10.0, size=size).tolist(),
+        "constraints": [[row.tolist(), "<=", 100.0] for row in matrix],
+    }
+    if name is not None:
+        data["name"] = name
+    return data
+
+
+async def exchange(port, raw):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(raw)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(body) if body else None
+
+
+def request(method, path, body=None, headers=""):
+    data = b"" if body is None else json.dumps(body).encode()
+    head = f"{method} {path} HTTP/1.1\r\nHost: test\r\nContent-Length: {len(data)}\r\n{headers}Connection: close\r\n\r\n"
+    return head.encode() + data
+
+
+def run(scenario, **options):
+    """Levanta el servicio en un puerto libre, corre scenario(service, port) y lo apaga."""
+
+    async def main():
+        service = SolveService(**{"workers": 1, **options})
+        ready = asyncio.Event()
+        ports = []
+
+        def started(server):
+            ports.append(server.sockets[0].getsockname()[1])
+            ready.set()
+
+        server = asyncio.create_task(service.serve("127.0.0.1", 0, started))
+        await ready.wait()
+        try:
+            return await scenario(service, ports[0])
+        finally:
+            server.cancel()
+            service.close()
+
+    return asyncio.run(main())
+
+
+def test_identical_requests_are_coalesced():
+    async def scenario(service, port):
+        shared = problem(60, seed=1)
+        responses = await asyncio.gather(*(exchange(port, request("POST", "/solve", {**shared, "name": f"p{index}"})) for index in range(5)))
+        return service, responses
+
+    service, responses = run(scenario)
+    assert [status for status, _ in responses] == [200] * 5
+    assert sorted(body["name"] for _, body in responses) == [f"p{index}" for index in range(5)]
+    assert len({body["Z"] for _, body in responses}) == 1
+    assert service.counters["solved"] == 1
+    assert service.counters["coalesced"] == 4
+
+
+def test_full_queue_answers_503():
+    async def scenario(service, port):
+        return await asyncio.gather(*(exchange(port, request("POST", "/solve", problem(60, seed=seed))) for seed in range(5)))
+
+    statuses = sorted(status for status, _ in run(scenario, max_queue=2))
+    assert statuses == [200, 200, 503, 503, 503]
+
+
+def test_expired_timeout_answers_504():
+    async def scenario(service, port):
+        return await exchange(port, request("POST", "/solve?timeout=0.001", problem(80, seed=3)))
+
+    status, body = run(scenario)
+    assert status == 504
+    assert body["status"] == "error"
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        (b"POST /solve HTTP/1.1\r\nContent-Length: abc\r\n\r\n", 400),
+        (b"POST /solve HTTP/1.1\r\nContent-Length: -5\r\n\r\n", 400),
+        (b"BASURA\r\n\r\n", 400),
+        (request("POST", "/solve?timeout=-1", problem(2)), 400),
+        (request("POST", "/solve?timeout=abc", problem(2)), 400),
+        (b"POST /solve HTTP/1.1\r\nContent-Length: 3\r\nConnection: close\r\n\r\n{x}", 400),
+        (request("POST", "/solve", [1, 2]), 400),
+        (request("GET", "/solve"), 405),
+        (request("GET", "/nada"), 404),
+    ],
+    ids=["longitud_no_numerica", "longitud_negativa", "linea_invalida", "timeout_negativo", "timeout_no_numerico",
+         "json_invalido", "no_es_objeto", "metodo", "ruta"],
+)
+def test_malformed_requests(raw, expected):
+    async def scenario(service, port):
+        return await exchange(port, raw)
+
+    status, body = run(scenario)
+    assert status == expected
+    assert body["status"] == "error"
+
+
+def test_metrics_report_counters_and_latency():
+    async def scenario(service, port):
+        await exchange(port, request("POST", "/solve", problem(3)))
+        await exchange(port, request("GET", "/nada"))
+        return await exchange(port, request("GET", "/metrics"))
+
+    status, metrics = run(scenario)
+    assert status == 200
+    assert metrics["counters"]["requests"] == 3
+    assert metrics["counters"]["solved"] == 1
+    assert metrics["counters"]["client_errors"] == 1
+    assert metrics["responses"] == {"200": 1, "404": 1}
+    assert metrics["statuses"] == {"optimal": 1}
+    assert metrics["latency_ms"]["solve"]["count"] == 1
+    assert metrics["latency_ms"]["request"]["count"] == 2
+    assert metrics["queue_depth"] == 0
@@ -0,0 +1,57 @@
+import threading
+
+import numpy as np
+
+from model import two_phase_model
+from model.solve_cache import SolveCache, problem_fingerprint
+from model.two_phase_model import TwoPhaseMethodModel
+
+
+def test_fingerprint_ignores_rounding_noise():
+    first = problem_fingerprint("Maximizar", [1.0, 2.0], np.eye(2), ["<=", "<="], [1.0, 1.0])
+    second = problem_fingerprint("Maximizar", [1.0 + 1e-13, 2.0], np.eye(2), ["<=", "<="], [1.0, 1.0])
+    assert first == second
+    assert first != problem_fingerprint("Minimizar", [1.0, 2.0], np.eye(2), ["<=", "<="], [1.0, 1.0])
+
+
+def test_lru_eviction_respects_entry_budget():
+    cache = SolveCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    assert "a" in cache and "c" in cache and "b" not in cache
+
+
+def test_concurrent_access_keeps_accounting_consistent():
+    cache = SolveCache(max_entries=16)
+
+    def work(offset):
+        for index in range(500):
+            cache.put((offset + index) % 40, list(range(50)))
+            cache.get((offset * 7 + index) % 40)
+
+    threads = [threading.Thread(target=work, args=(offset,)) for offset in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    stats = cache.stats()
+    assert stats["entries"] <= 16
+    assert stats["hits"] + stats["misses"] == 8 * 500
+    assert stats["bytes"] == sum(len(payload) for payload in cache._entries.values())
+
+
+def test_large_tableau_histories_are_not_cached(monkeypatch):
+    cache = SolveCache()
+    monkeypatch.setattr(TwoPhaseMethodModel, "cache", cache)
+    constraints = [([1.0, 0.0], "<=", 4.0), ([0.0, 2.0], "<=", 12.0), ([3.0, 2.0], "<=", 18.0)]
+    TwoPhaseMethodModel(2, 3, "Maximizar", [3.0, 5.0], constraints).solve()
+    assert len(cache) == 1
+
+    monkeypatch.setattr(two_phase_model, "MAX_CACHED_HISTORY_BYTES", 0)
+    TwoPhaseMethodModel(2, 3, "Maximizar", [3.0, 6.0], constraints).solve()
+    assert len(cache) == 1
+    # Con otro backend sin historial la solución sí se guarda.
+    TwoPhaseMethodModel(2, 3, "Maximizar", [3.0, 6.0], constraints, backend="revised").solve()
+    assert len(cache) == 2
@@ -0,0 +1,82 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from model.simplex_tableau import run_simplex
+from model.standard_form import build_standard_form
+from model.tableau_history import TableauHistory
+
+
+def record_phase(history_options, size=40, seed=0):
+    """Corre el simplex sobre un problema aleatorio y guarda cada tableau completo además del historial."""
+    rng = np.random.default_rng(seed)
+    matrix = rng.uniform(1.0, 10.0, size=(size, size))
+    costs = rng.uniform(1.0, 10.0, size=size)
+    form = build_standard_form(matrix, ["<="] * size, np.full(size, 100.0))
+    tableau = form.tableau
+    # Maximizar costs x: Zj - Cj de la base de holguras es costs.
+    tableau[-1, :size] = costs
+    basis = form.basis.copy()
+    history = TableauHistory(tableau, basis, form.column_names, costs, -1.0, **history_options)
+    expected = [(tableau.copy(), basis.copy())]
+
+    def record(current, current_basis):
+        history.record(current, current_basis)
+        expected.append((current.copy(), current_basis.copy()))
+
+    assert run_simplex(tableau, basis, on_iteration=record) == "optimal"
+    return history, expected
+
+
+def assert_same(snapshot, expected):
+    body, basis = expected
+    assert np.array_equal(snapshot.body, body)
+    assert np.array_equal(snapshot.basis, basis)
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{}, {"checkpoint_every": 3}, {"checkpoint_every": 2, "max_checkpoint_bytes": 1}],
+    ids=["sin_copias", "copias", "raleo"],
+)
+def test_every_iteration_is_reconstructed_exactly(options):
+    history, expected = record_phase(options)
+    assert len(expected) > 10
+    assert len(history) == len(expected)
+    for index in range(len(expected)):
+        assert_same(history[index], expected[index])
+    for snapshot, recorded in zip(history, expected):
+        assert_same(snapshot, recorded)
+
+
+def test_random_access_after_thinning():
+    history, expected = record_phase({"checkpoint_every": 2, "max_checkpoint_bytes": 1})
+    # Con el tope de memoria las copias se ralean: quedan pocas y el intervalo crece.
+    assert history.checkpoint_every > 2
+    assert len(history.checkpoints) <= 3
+    order = np.random.default_rng(1).permutation(len(expected)).tolist()
+    for index in order + order[::-1]:
+        assert_same(history[index], expected[index])
+    assert_same(history[-1], expected[-1])
+    with pytest.raises(IndexError):
+        history[len(expected)]
+
+
+def test_thinning_keeps_checkpoints_aligned_with_their_iteration():
+    # Caben cuatro copias del tableau de 41 x 81: al pasarse se descarta una de cada dos.
+    history, expected = record_phase({"checkpoint_every": 2, "max_checkpoint_bytes": 4 * 41 * 81 * 8})
+    assert history.checkpoint_every > 2
+    assert len(history.checkpoints) > 1
+    for number, checkpoint in enumerate(history.checkpoints):
+        body, basis = expected[number * history.checkpoint_every]
+        assert np.array_equal(checkpoint[0], body)
+        assert np.array_equal(checkpoint[1], basis)
+
+
+def test_pickled_history_reconstructs_the_same_tableaus():
+    history, expected = record_phase({"checkpoint_every": 4})
+    history[len(expected) // 2]
+    restored = pickle.loads(pickle.dumps(history))
+    for index in range(len(expected) - 1, -1, -1):
+        assert_same(restored[index], expected[index])
@@ -0,0 +1,78 @@
+import pytest
+
+from model.instrumentation import Instrumentation
+from model.two_phase_model import TwoPhaseMethodModel
+
+CONSTRAINTS = [([1.0, 0.0], "<=", 4.0), ([0.0, 2.0], "<=", 12.0), ([3.0, 2.0], "<=", 18.0)]
+
+
+@pytest.fixture(autouse=True)
+def no_cache(monkeypatch):
+    monkeypatch.setattr(TwoPhaseMethodModel, "cache", None)
+
+
+def resolve(model, obj_coeffs, constraints):
+    model.update("Maximizar", obj_coeffs, constraints)
+    instrumentation = Instrumentation()
+    return model.solve(instrumentation=instrumentation), instrumentation.counters
+
+
+def cold(obj_coeffs, constraints):
+    return TwoPhaseMethodModel(2, len(constraints), "Maximizar", obj_coeffs, constraints).solve()
+
+
+def solved_model():
+    model = TwoPhaseMethodModel(2, 3, "Maximizar", [3.0, 5.0], CONSTRAINTS)
+    assert model.solve()["solution"]["Z"] == pytest.approx(36.0)
+    return model
+
+
+def test_cost_change_reoptimizes_with_primal_simplex():
+    model = solved_model()
+    result, counters = resolve(model, [3.0, 1.0], CONSTRAINTS)
+    expected = cold([3.0, 1.0], CONSTRAINTS)
+    assert result["solution"] == pytest.approx(expected["solution"])
+    # Desde la base anterior alcanza con un pivoteo; en frío hacen falta más.
+    assert counters.get("phase2_pivots", 0) < len(expected["phase2_tableaus"]) - 1
+
+
+def test_rhs_change_reoptimizes_with_dual_simplex():
+    model = solved_model()
+    constraints = [CONSTRAINTS[0], ([0.0, 2.0], "<=", 20.0), CONSTRAINTS[2]]
+    result, counters = resolve(model, [3.0, 5.0], constraints)
+    assert result["solution"] == pytest.approx(cold([3.0, 5.0], constraints)["solution"])
+    assert counters.get("phase2_pivots", 0) == 1
+
+
+def test_rhs_change_to_infeasible_is_reported():
+    model = solved_model()
+    constraints = CONSTRAINTS + [([1.0, 1.0], ">=", 20.0)]
+    assert resolve(model, [3.0, 5.0], constraints)[0] == "El problema no tiene solución factible."
+    constraints = [CONSTRAINTS[0], CONSTRAINTS[1], ([3.0, 2.0], "<=", -1.0)]
+    assert resolve(model, [3.0, 5.0], constraints)[0] == "El problema no tiene solución factible."
+
+
+def test_matrix_change_solves_from_scratch():
+    model = solved_model()
+    constraints = [CONSTRAINTS[0], CONSTRAINTS[1], ([3.0, 3.0], "<=", 18.0)]
+    result, _ = resolve(model, [3.0, 5.0], constraints)
+    expected = cold([3.0, 5.0], constraints)
+    assert result["solution"] == pytest.approx(expected["solution"])
+    assert len(result["phase2_tableaus"]) == len(expected["phase2_tableaus"])
+
+
+def test_phase1_tableaus_survive_warm_start():
+    constraints = CONSTRAINTS + [([1.0, 1.0], ">=", 2.0)]
+    model = TwoPhaseMethodModel(2, 4, "Maximizar", [3.0, 5.0], constraints)
+    first = model.solve()
+    assert len(first["phase1_tableaus"]) > 1
+
+    result, counters = resolve(model, [3.0, 1.0], constraints)
+    assert "phase1_pivots" not in counters
+    assert [table.to_rows() for table in result["phase1_tableaus"]] == [table.to_rows() for table in first["phase1_tableaus"]]
+
+    # Con otro lado derecho la Fase 1 cambia: se resuelve desde cero.
+    changed = constraints[:3] + [([1.0, 1.0], ">=", 3.0)]
+    result, counters = resolve(model, [3.0, 1.0], changed)
+    assert counters["phase1_pivots"] > 0
+    assert result["solution"] == pytest.approx(cold([3.0, 1.0], changed)["solution"])
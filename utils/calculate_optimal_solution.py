@@ -1,7 +1,47 @@
 import numpy as np
 
+TOLERANCE = 1e-7
+CHUNK_SIZE = 2048
+MAX_CUTS = 32
+LESS_EQUAL = ("≤", "<=")
+GREATER_EQUAL = ("≥", ">=")
 
-def calculate_optimal_solution(coef_x1, coef_x2, restrictions, obj_type):
+
+def _constraint_arrays(restrictions, nonnegative):
+    rows = [(coef1, coef2, limit) for coef1, coef2, _, limit in restrictions]
+    relations = [inequality for _, _, inequality, _ in restrictions]
+    if nonnegative:
+        rows += [(1.0, 0.0, 0.0), (0.0, 1.0, 0.0)]
+        relations += ["≥", "≥"]
+    data = np.array(rows, dtype=float).reshape(-1, 3)
+    relations = np.array(relations, dtype=object)
+    return data, np.isin(relations, LESS_EQUAL), np.isin(relations, GREATER_EQUAL)
+
+
+def _as_upper_bounds(data, less_equal, greater_equal):
+    """Reescribe todo como G x <= h (">=" se niega, "=" aporta ambas filas)."""
+    upper = data[~greater_equal]
+    lower = -data[~less_equal]
+    rows = np.vstack([upper, lower])
+    rows[:, 2] += TOLERANCE * (1.0 + np.abs(rows[:, 2]))
+    return rows[:, :2], rows[:, 2]
+
+
+def _pair_intersections(coeffs, limits):
+    """Intersección de cada par de rectas (regla de Cramer vectorizada)."""
+    first, second = np.triu_indices(coeffs.shape[0], k=1)
+    a1, b1, c1 = coeffs[first, 0], coeffs[first, 1], limits[first]
+    a2, b2, c2 = coeffs[second, 0], coeffs[second, 1], limits[second]
+    determinant = a1 * b2 - a2 * b1
+    scale = np.maximum(np.hypot(a1, b1) * np.hypot(a2, b2), 1.0)
+    unique = np.abs(determinant) > TOLERANCE * scale
+    determinant = determinant[unique]
+    x1 = (c1[unique] * b2[unique] - c2[unique] * b1[unique]) / determinant
+    x2 = (a1[unique] * c2[unique] - a2[unique] * c1[unique]) / determinant
+    return np.column_stack([x1, x2])
+
+
+def calculate_optimal_solution(coef_x1, coef_x2, restrictions, obj_type, nonnegative=True):
     """
     Calcula la solución óptima usando el método gráfico.
 
@@ -10,63 +50,44 @@ def calculate_optimal_solution(coef_x1, coef_x2, restrictions, obj_type):
     - coef_x2: Coeficiente de x2 en la función objetivo.
     - restrictions: Lista de restricciones en formato [(coef1, coef2, inequality, limit)].
     - obj_type: Tipo de objetivo ("max" para maximizar, "min" para minimizar).
+    - nonnegative: Si se agregan x1 >= 0 y x2 >= 0 (y los ejes como rectas candidatas).
+
+    Los vértices candidatos son las intersecciones de todos los pares de
+    rectas, calculadas de una vez con NumPy. Los bloques con mejor Z se
+    verifican contra todas las restricciones con una sola comparación
+    matricial y el primer candidato factible es el óptimo; las restricciones
+    que descartan un bloque filtran a los candidatos restantes.
 
     Retorna:
-    - x1_opt: Valor óptimo de x1.
-    - x2_opt: Valor óptimo de x2.
-    - z_opt: Valor óptimo de Z.
+    - (x1_opt, x2_opt, z_opt), o None si no hay ningún vértice factible.
     """
-    # Paso 1: Encontrar los puntos de intersección de las restricciones
-    intersection_points = []
-
-    # Generar todas las combinaciones de restricciones para encontrar intersecciones
-    for i in range(len(restrictions)):
-        for j in range(i + 1, len(restrictions)):
-            A = np.array([
-                [restrictions[i][0], restrictions[i][1]],
-                [restrictions[j][0], restrictions[j][1]]
-            ])
-            b = np.array([restrictions[i][3], restrictions[j][3]])
-
-            try:
-                # Resolver el sistema de ecuaciones para encontrar la intersección
-                intersection = np.linalg.solve(A, b)
-                intersection_points.append(intersection)
-            except np.linalg.LinAlgError:
-                # Si el sistema no tiene solución única, ignorar
-                continue
-
-    # Paso 2: Filtrar los puntos que cumplen todas las restricciones
-    feasible_points = []
-    for point in intersection_points:
-        x1, x2 = point
-        feasible = True
-        for coef1, coef2, inequality, limit in restrictions:
-            if inequality == "≤" and coef1 * x1 + coef2 * x2 > limit:
-                feasible = False
-                break
-            elif inequality == "≥" and coef1 * x1 + coef2 * x2 < limit:
-                feasible = False
-                break
-            elif inequality == "=" and not np.isclose(coef1 * x1 + coef2 * x2, limit):
-                feasible = False
-                break
-        if feasible:
-            feasible_points.append((x1, x2))
-
-    # Paso 3: Calcular el valor de Z para cada punto factible
-    z_values = []
-    for x1, x2 in feasible_points:
-        z = coef_x1 * x1 + coef_x2 * x2
-        z_values.append(z)
+    data, less_equal, greater_equal = _constraint_arrays(restrictions, nonnegative)
+    points = _pair_intersections(data[:, :2], data[:, 2])
+    if not points.shape[0]:
+        return None
 
-    # Paso 4: Encontrar la solución óptima
-    if obj_type == "max":
-        optimal_index = np.argmax(z_values)
-    else:
-        optimal_index = np.argmin(z_values)
+    coeffs, limits = _as_upper_bounds(data, less_equal, greater_equal)
+    z_values = points @ np.array([coef_x1, coef_x2], dtype=float)
+    keys = -z_values if obj_type == "max" else z_values
 
-    x1_opt, x2_opt = feasible_points[optimal_index]
-    z_opt = z_values[optimal_index]
+    while keys.size:
+        # Solo se ordena el bloque con mejor Z; el resto se filtra sin ordenar.
+        if keys.size > CHUNK_SIZE:
+            head = np.argpartition(keys, CHUNK_SIZE - 1)[:CHUNK_SIZE]
+        else:
+            head = np.arange(keys.size)
+        head = head[np.argsort(keys[head], kind="stable")]
+        excess = points[head] @ coeffs.T - limits
+        feasible = (excess <= 0).all(axis=1)
+        if feasible.any():
+            best = head[np.argmax(feasible)]
+            return float(points[best, 0]), float(points[best, 1]), float(z_values[best])
 
-    return x1_opt, x2_opt, z_opt
\ No newline at end of file
+        # Las restricciones que descartaron al bloque suelen descartar a muchos
+        # candidatos más; se usan para filtrar al resto antes del chequeo completo.
+        culprits, counts = np.unique(np.argmax(excess, axis=1), return_counts=True)
+        culprits = culprits[np.argsort(-counts)[:MAX_CUTS]]
+        keep = (points @ coeffs[culprits].T <= limits[culprits]).all(axis=1)
+        keep[head] = False
+        points, z_values, keys = points[keep], z_values[keep], keys[keep]
+    return None
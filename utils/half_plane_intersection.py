@@ -0,0 +1,131 @@
+from collections import deque
+
+import numpy as np
+
+TOLERANCE = 1e-9
+SNAP = 1e-7
+CHECK_EVERY = 1024
+LESS_EQUAL = ("≤", "<=")
+GREATER_EQUAL = ("≥", ">=")
+
+
+def _intersection(first, second):
+    a1, b1, c1 = first
+    a2, b2, c2 = second
+    determinant = a1 * b2 - a2 * b1
+    return (c1 * b2 - c2 * b1) / determinant, (a1 * c2 - a2 * c1) / determinant
+
+
+def _outside(half_plane, point):
+    return half_plane[0] * point[0] + half_plane[1] * point[1] > half_plane[2]
+
+
+def _snap(vertices, scale):
+    """Colapsa vértices repetidos y reduce polígonos sin área a un segmento o un punto."""
+    tolerance = SNAP * scale
+    distinct = [vertices[0]]
+    for vertex in vertices[1:]:
+        if np.hypot(*(vertex - distinct[-1])) > tolerance:
+            distinct.append(vertex)
+    if len(distinct) > 1 and np.hypot(*(distinct[0] - distinct[-1])) <= tolerance:
+        distinct.pop()
+    vertices = np.array(distinct)
+    if vertices.shape[0] == 1:
+        return vertices
+
+    x, y = vertices[:, 0], vertices[:, 1]
+    area = 0.5 * abs(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+    spread = vertices - vertices.mean(axis=0)
+    _, _, directions = np.linalg.svd(spread, full_matrices=False)
+    projection = spread @ directions[0]
+    length = projection.max() - projection.min()
+    if vertices.shape[0] == 2 or area <= tolerance * max(length, tolerance):
+        if length <= tolerance:
+            return vertices[:1]
+        return vertices[[np.argmin(projection), np.argmax(projection)]]
+    return vertices
+
+
+def half_plane_intersection(coeffs, limits, viewport, check=None):
+    """
+    Intersección de los semiplanos a x1 + b x2 <= c recortada al viewport.
+
+    `coeffs` es (n, 2), `limits` (n,) y `viewport` (x_min, x_max, y_min,
+    y_max). Los semiplanos se ordenan por ángulo y se recorren una vez con
+    una deque (O(n log n) por el ordenamiento). El lado derecho se relaja
+    levemente para que las regiones degeneradas no se pierdan y luego se
+    ajustan: retorna los vértices en sentido antihorario (k >= 3), los dos
+    extremos de un segmento (k = 2), un punto (k = 1) o un arreglo vacío.
+    `check`, si se da, se llama cada CHECK_EVERY semiplanos (puede lanzar
+    SolveCancelled).
+    """
+    x_min, x_max, y_min, y_max = viewport
+    box = np.array([[-1.0, 0.0, -x_min], [1.0, 0.0, x_max], [0.0, -1.0, -y_min], [0.0, 1.0, y_max]])
+    planes = np.column_stack([np.asarray(coeffs, dtype=float).reshape(-1, 2), np.asarray(limits, dtype=float)])
+
+    norms = np.hypot(planes[:, 0], planes[:, 1])
+    degenerate = norms <= TOLERANCE
+    if np.any(planes[degenerate, 2] < -TOLERANCE):
+        return np.empty((0, 2))
+    planes = np.vstack([planes[~degenerate] / norms[~degenerate, None], box])
+
+    scale = max(1.0, *np.abs(viewport))
+    planes[:, 2] += TOLERANCE * scale
+
+    # Con la región factible a la izquierda, la dirección del borde es (-b, a).
+    angles = np.arctan2(planes[:, 0], -planes[:, 1])
+    order = np.lexsort((planes[:, 2], angles))
+    planes, angles = planes[order], angles[order]
+    first_of_angle = np.ones(angles.shape[0], dtype=bool)
+    first_of_angle[1:] = np.diff(angles) > TOLERANCE
+    planes = planes[first_of_angle]
+
+    lines = deque()
+    for position, plane in enumerate(planes.tolist()):
+        if check is not None and position % CHECK_EVERY == 0:
+            check()
+        while len(lines) > 1 and _outside(plane, _intersection(lines[-1], lines[-2])):
+            lines.pop()
+        while len(lines) > 1 and _outside(plane, _intersection(lines[0], lines[1])):
+            lines.popleft()
+        if lines:
+            back = lines[-1]
+            cross = back[0] * plane[1] - back[1] * plane[0]
+            if abs(cross) <= TOLERANCE:
+                # Paralelo opuesto sobreviviente: la región está vacía.
+                if back[0] * plane[0] + back[1] * plane[1] < 0:
+                    return np.empty((0, 2))
+                continue
+        lines.append(plane)
+
+    while len(lines) > 2 and _outside(lines[0], _intersection(lines[-1], lines[-2])):
+        lines.pop()
+    while len(lines) > 2 and _outside(lines[-1], _intersection(lines[0], lines[1])):
+        lines.popleft()
+    if len(lines) < 3:
+        return np.empty((0, 2))
+
+    lines = list(lines)
+    vertices = np.array([_intersection(lines[i], lines[(i + 1) % len(lines)]) for i in range(len(lines))])
+    return _snap(vertices, scale)
+
+
+def feasible_polygon(restrictions, viewport, nonnegative=True, check=None):
+    """
+    Región factible de restricciones [(coef1, coef2, inequality, limit)] en el viewport.
+
+    Las igualdades aportan dos semiplanos opuestos y, si `nonnegative`, se
+    agregan x1 >= 0 y x2 >= 0.
+    """
+    coeffs, limits = [], []
+    for coef1, coef2, inequality, limit in restrictions:
+        if inequality not in GREATER_EQUAL:
+            coeffs.append((coef1, coef2))
+            limits.append(limit)
+        if inequality not in LESS_EQUAL:
+            coeffs.append((-coef1, -coef2))
+            limits.append(-limit)
+    if nonnegative:
+        coeffs += [(-1.0, 0.0), (0.0, -1.0)]
+        limits += [0.0, 0.0]
+    return half_plane_intersection(np.array(coeffs, dtype=float).reshape(-1, 2), np.array(limits, dtype=float), viewport, check)
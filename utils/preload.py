@@ -0,0 +1,33 @@
+import importlib
+import threading
+
+# Módulos pesados que la primera ventana no necesita pero el primer cálculo sí.
+PRELOAD_MODULES = (
+    "numpy",
+    "model.two_phase_model",
+    "scipy.optimize",
+    "matplotlib.figure",
+    "matplotlib.patches",
+)
+PRELOAD_DELAY_MS = 300
+
+
+def preload_modules(modules=PRELOAD_MODULES):
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+
+
+def preload_in_background(root, modules=PRELOAD_MODULES, delay_ms=PRELOAD_DELAY_MS):
+    """
+    Importa `modules` en un hilo daemon una vez dibujada la ventana `root`.
+
+    Si el usuario calcula antes de que termine, el import del hilo principal
+    simplemente espera al del hilo (el bloqueo de imports lo serializa).
+    """
+    def start():
+        threading.Thread(target=preload_modules, args=(modules,), name="preload", daemon=True).start()
+
+    root.after(delay_ms, start)
@@ -0,0 +1,95 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from model.solve_progress import PROGRESS_INTERVAL, ProgressReporter, SolveCancelled
+
+POLL_MS = 50
+
+
+class SolverWorker:
+    """
+    Ejecuta resoluciones en un hilo aparte para que el mainloop de Tk no se bloquee.
+
+    `submit(task, ...)` corre `task(progress)` en el hilo del worker, donde
+    `progress` es un ProgressReporter. Los eventos vuelven por una cola que
+    el hilo de Tk vacía con root.after, así que los callbacks siempre corren
+    en el hilo de la interfaz. Solo se entregan los eventos del último
+    trabajo: enviar uno nuevo cancela el anterior.
+    """
+
+    def __init__(self, root, poll_ms=POLL_MS, progress_interval=PROGRESS_INTERVAL):
+        self.root = root
+        self.poll_ms = poll_ms
+        self.progress_interval = progress_interval
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="solver")
+        self.events = queue.SimpleQueue()
+        self.job = 0
+        self.cancel_event = None
+        self.callbacks = None
+        self.polling = False
+        root.bind("<Destroy>", self.on_destroy, add="+")
+
+    @property
+    def busy(self):
+        return self.callbacks is not None
+
+    def submit(self, task, on_done, on_progress=None, on_cancel=None):
+        self.cancel()
+        self.job += 1
+        job = self.job
+        self.cancel_event = threading.Event()
+        self.callbacks = (on_done, on_progress, on_cancel)
+        reporter = ProgressReporter(lambda update: self.events.put((job, "progress", update)), self.cancel_event, self.progress_interval)
+        self.executor.submit(self.run, job, task, reporter)
+        if not self.polling:
+            self.polling = True
+            self.root.after(self.poll_ms, self.poll)
+
+    def run(self, job, task, reporter):
+        try:
+            reporter.check()
+            self.events.put((job, "done", task(reporter)))
+        except SolveCancelled:
+            self.events.put((job, "cancelled", None))
+        except Exception as error:
+            self.events.put((job, "done", f"Error: {error}"))
+
+    def cancel(self):
+        """Pide detener el trabajo en curso; se detiene en su siguiente pivoteo."""
+        if self.cancel_event is not None:
+            self.cancel_event.set()
+
+    def poll(self):
+        progress = None
+        while True:
+            try:
+                job, kind, payload = self.events.get_nowait()
+            except queue.Empty:
+                break
+            if job != self.job or self.callbacks is None:
+                continue
+            if kind == "progress":
+                # Solo interesa la actualización más reciente de cada vuelta.
+                progress = payload
+                continue
+            on_done, _, on_cancel = self.callbacks
+            self.callbacks = None
+            progress = None
+            if kind == "done":
+                on_done(payload)
+            elif on_cancel is not None:
+                on_cancel()
+
+        if progress is not None and self.callbacks is not None and self.callbacks[1] is not None:
+            self.callbacks[1](progress)
+        if self.callbacks is None:
+            self.polling = False
+            return
+        self.root.after(self.poll_ms, self.poll)
+
+    def on_destroy(self, event):
+        if event.widget is self.root:
+            self.callbacks = None
+            self.cancel()
+            self.executor.shutdown(wait=False, cancel_futures=True)
@@ -1,15 +1,23 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.patches import Polygon
-from scipy.optimize import linprog
+from controller.GraphicMethodController import GraphicMethodController
 from utils.center_window import center_window
-from scipy.spatial import ConvexHull
+from utils.half_plane_intersection import feasible_polygon
+from utils.solver_worker import SolverWorker
+from view.status_bar import StatusBar
+
+# matplotlib y scipy se importan dentro de los métodos que los usan para no
+# retrasar la primera ventana; utils.preload los carga en segundo plano.
+
+PLOT_EXTENT = 100.0
 
 
 class GraphicMethodView:
+    # Compartida entre instancias para sobrevivir a volver_al_menu_anterior.
+    solution_cache = None
+    _MISSING = object()
+
     def __init__(self, initial_restrictions=0):
         self.colors = {
             "bg": "#0f172a",
@@ -27,6 +35,8 @@ class GraphicMethodView:
         self.graph_frame = self.create_graph_frame()
         self.restrictions = []
         self.initial_restrictions = max(0, initial_restrictions)
+        self.controller = GraphicMethodController()
+        self.worker = SolverWorker(self.root)
 
         self.create_widgets()
         center_window(self.root)
@@ -211,9 +221,14 @@ class GraphicMethodView:
         self.calculate_button.pack(pady=20)
 
     def create_graph_widgets(self):
-        self.figure, self.ax = plt.subplots(figsize=(6, 4), facecolor=self.colors["bg"])
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+
+        self.figure = Figure(figsize=(6, 4), facecolor=self.colors["bg"])
+        self.ax = self.figure.add_subplot()
         self.canvas = FigureCanvasTkAgg(self.figure, master=self.graph_frame)
         self.canvas.get_tk_widget().pack(expand=True, fill=tk.BOTH, padx=20, pady=20)
+        self.create_plot_artists()
         self.result_label = tk.Label(
             self.graph_frame,
             text="",
@@ -222,6 +237,8 @@ class GraphicMethodView:
             fg=self.colors["text"],
         )
         self.result_label.pack(pady=10)
+        self.status_bar = StatusBar(self.graph_frame, self.worker.cancel, self.colors["bg"], self.colors["muted"], self.colors["accent"])
+        self.status_bar.pack(fill=tk.X)
 
     def create_footer_label(self):
         footer_label = tk.Label(
@@ -309,124 +326,205 @@ class GraphicMethodView:
 
                 restrictions.append((coef1, coef2, inequality, limit))
 
-            # Graficar y calcular la solución
-            self.plot_solution(coef_x1, coef_x2, restrictions, obj_type)
-            
         except ValueError as ve:
             messagebox.showerror("Error", str(ve))
+            return
+
+        def solve(progress):
+            # Corre en el hilo del worker; el dibujo queda para on_solution.
+            extent = self.plot_extent(restrictions)
+            polygon_points = feasible_polygon(restrictions, (0.0, extent, 0.0, extent), check=progress.check)
+            result = self.calculate_optimal_solution(coef_x1, coef_x2, restrictions, obj_type, progress.check)
+            return restrictions, extent, polygon_points, result
+
+        self.calculate_button.config(state=tk.DISABLED)
+        self.status_bar.start()
+        self.worker.submit(solve, self.on_solution, on_cancel=self.on_cancelled)
+
+    def on_solution(self, solution):
+        self.calculate_button.config(state=tk.NORMAL)
+        self.status_bar.finish()
+        if isinstance(solution, str):
+            self.result_label.config(text=solution)
+            return
+        self.plot_solution(*solution)
+
+    def on_cancelled(self):
+        self.calculate_button.config(state=tk.NORMAL)
+        self.status_bar.finish("Cálculo cancelado.")
+
+    def create_plot_artists(self):
+        """
+        Estiliza los ejes una sola vez y crea los artistas que plot_solution actualiza.
+
+        Las rectas de las restricciones forman una sola LineCollection. Los
+        artistas que cambian con cada cálculo son "animated": no forman parte
+        del fondo y se dibujan encima con blitting. La leyenda también es
+        animated (sus etiquetas cambian con las restricciones y el óptimo) y
+        solo se reconstruye cuando cambian sus etiquetas.
+        """
+        from matplotlib import rcParams
+        from matplotlib.collections import LineCollection
+        from matplotlib.patches import Polygon
 
-    def plot_solution(self, coef_x1, coef_x2, restrictions, obj_type):
-        self.ax.clear()
         self.ax.set_facecolor('#0f172a')
         self.ax.set_xlabel('x1', color='#e5e7eb')
         self.ax.set_ylabel('x2', color='#e5e7eb')
-        self.ax.spines['bottom'].set_color('#e5e7eb')
-        self.ax.spines['top'].set_color('#e5e7eb')
-        self.ax.spines['right'].set_color('#e5e7eb')
-        self.ax.spines['left'].set_color('#e5e7eb')
-        self.ax.tick_params(axis='x', colors='#e5e7eb')
-        self.ax.tick_params(axis='y', colors='#e5e7eb')
-
-        x = np.linspace(0, 100, 400)
-        feasible_region = []
-        for coef1, coef2, inequality, limit in restrictions:
-            if abs(coef2) < 1e-9:
-                x_val = limit / coef1 if coef1 != 0 else 0
-                y_vals = np.linspace(0, max(10, limit * 1.5 if limit >= 0 else 10), 400)
-                x_vals = np.full_like(y_vals, x_val)
-                self.ax.plot(x_vals, y_vals, label=f"{coef1}x1 {inequality} {limit}")
-            else:
-                y_vals = (limit - coef1 * x) / coef2
-                self.ax.plot(x, y_vals, label=f"{coef1}x1 + {coef2}x2 {inequality} {limit}")
-            if inequality == '≤' or inequality == '<=':
-                feasible_region.append((coef1, coef2, limit, '<='))
-            elif inequality == '≥' or inequality == '>=':
-                feasible_region.append((coef1, coef2, limit, '>='))
-            else:
-                feasible_region.append((coef1, coef2, limit, '='))
-
+        for spine in self.ax.spines.values():
+            spine.set_color('#e5e7eb')
+        self.ax.tick_params(axis='both', colors='#e5e7eb')
         self.ax.axhline(0, color='#e5e7eb')
         self.ax.axvline(0, color='#e5e7eb')
         self.ax.grid(color='#1f2937')
+        self.ax.set_xlim(-0.02 * PLOT_EXTENT, PLOT_EXTENT)
+        self.ax.set_ylim(-0.02 * PLOT_EXTENT, PLOT_EXTENT)
+        self.figure.tight_layout()
+
+        self.line_colors = rcParams['axes.prop_cycle'].by_key()['color']
+        self.plot_extent_value = PLOT_EXTENT
+        self.constraint_segments = []
+        self.constraint_keys = []
+        self.constraint_labels = []
+        self.legend = None
+        self.legend_labels = None
+        self.background = None
+        self.constraint_collection = LineCollection([], linewidths=1.5, animated=True)
+        self.ax.add_collection(self.constraint_collection, autolim=False)
+        self.region_patch = Polygon(np.zeros((3, 2)), closed=True, fill=True, color='#22d3ee', alpha=0.2, animated=True, visible=False)
+        self.ax.add_patch(self.region_patch)
+        (self.region_line,) = self.ax.plot([], [], color=self.colors["accent"], linewidth=4, marker='o', alpha=0.6, animated=True)
+        (self.optimum_marker,) = self.ax.plot([], [], 'ro', label='Óptimo', animated=True)
+        self.canvas.mpl_connect('draw_event', self.on_canvas_draw)
+
+    def on_canvas_draw(self, event):
+        """Tras cada dibujo completo (inicio, redimensión) guarda el fondo y repinta los artistas."""
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self.draw_artists()
+
+    def draw_artists(self):
+        self.ax.draw_artist(self.constraint_collection)
+        self.ax.draw_artist(self.region_patch)
+        self.ax.draw_artist(self.region_line)
+        self.ax.draw_artist(self.optimum_marker)
+        if self.legend is not None:
+            self.ax.draw_artist(self.legend)
+
+    def constraint_segment(self, coef1, coef2, limit, extent):
+        if abs(coef2) < 1e-9:
+            x_val = limit / coef1 if coef1 != 0 else 0
+            return [(x_val, 0), (x_val, extent)]
+        return [(0, limit / coef2), (extent, (limit - coef1 * extent) / coef2)]
+
+    def update_constraint_lines(self, restrictions, extent):
+        """Recalcula solo las rectas cuya restricción (o el viewport) cambió desde el último dibujo."""
+        del self.constraint_segments[len(restrictions):]
+        del self.constraint_keys[len(restrictions):]
+        del self.constraint_labels[len(restrictions):]
+        for index, (coef1, coef2, inequality, limit) in enumerate(restrictions):
+            key = (coef1, coef2, inequality, limit, extent)
+            if index < len(self.constraint_keys) and self.constraint_keys[index] == key:
+                continue
+            segment = self.constraint_segment(coef1, coef2, limit, extent)
+            label = f"{coef1}x1 {inequality} {limit}" if abs(coef2) < 1e-9 else f"{coef1}x1 + {coef2}x2 {inequality} {limit}"
+            if index < len(self.constraint_keys):
+                self.constraint_segments[index] = segment
+                self.constraint_keys[index] = key
+                self.constraint_labels[index] = label
+            else:
+                self.constraint_segments.append(segment)
+                self.constraint_keys.append(key)
+                self.constraint_labels.append(label)
+        self.constraint_collection.set_segments(self.constraint_segments)
+        self.constraint_collection.set_colors(
+            [self.line_colors[index % len(self.line_colors)] for index in range(len(self.constraint_segments))]
+        )
 
-        corners = []
-        for i in range(len(feasible_region)):
-            for j in range(i + 1, len(feasible_region)):
-                coef1_i, coef2_i, limit_i, sign_i = feasible_region[i]
-                coef1_j, coef2_j, limit_j, sign_j = feasible_region[j]
-                det = coef1_i * coef2_j - coef1_j * coef2_i
-                if det == 0:
-                    continue
-                x_int = (limit_i * coef2_j - limit_j * coef2_i) / det
-                y_int = (coef1_i * limit_j - coef1_j * limit_i) / det
-                corners.append((x_int, y_int))
-
-        corners.append((0, 0))
-        corners.extend([(0, limit / coef2) for coef1, coef2, _, limit in restrictions if coef2 != 0])
-        corners.extend([(limit / coef1, 0) for coef1, _, _, limit in restrictions if coef1 != 0])
-        corners = [corner for corner in corners if corner[0] >= 0 and corner[1] >= 0]
-
-        feasible_points = []
-        for corner in corners:
-            if all(self.satisfies_restriction(corner, coef1, coef2, limit, sign) for coef1, coef2, limit, sign in feasible_region):
-                feasible_points.append(corner)
-
-        if len(feasible_points) >= 3:
-            hull = ConvexHull(feasible_points)
-            polygon_points = [feasible_points[i] for i in hull.vertices]
-            polygon = Polygon(polygon_points, closed=True, fill=True, color='#22d3ee', alpha=0.2)
-            self.ax.add_patch(polygon)
-        elif feasible_points:
-            self.ax.fill(
-                [p[0] for p in feasible_points],
-                [p[1] for p in feasible_points],
-                color=self.colors["accent"],
-                alpha=0.15,
-            )
-
-        result = self.calculate_optimal_solution(coef_x1, coef_x2, feasible_region, obj_type)
-
-        if result:
-            x_opt, y_opt, z_opt = result
-            self.ax.plot(x_opt, y_opt, 'ro', label='Óptimo')
+    def update_legend(self):
+        """Rehace la leyenda solo si cambiaron sus etiquetas."""
+        from matplotlib.lines import Line2D
+
+        labels = list(self.constraint_labels)
+        if self.optimum_marker.get_visible():
+            labels.append(self.optimum_marker.get_label())
+        if labels == self.legend_labels:
+            return
+        if self.legend is not None:
+            self.legend.remove()
+            self.legend = None
+        self.legend_labels = labels
+        if labels:
+            handles = [
+                Line2D([], [], color=self.line_colors[index % len(self.line_colors)])
+                for index in range(len(self.constraint_labels))
+            ]
+            if self.optimum_marker.get_visible():
+                handles.append(Line2D([], [], color='red', marker='o', linestyle=''))
+            # loc fijo: "best" revisa el solapamiento con cada recta en cada dibujo.
+            self.legend = self.ax.legend(handles, labels, loc='upper right', facecolor='#111827', edgecolor='#22d3ee', labelcolor='#e5e7eb')
+            self.legend.set_animated(True)
+
+    def plot_solution(self, restrictions, extent, polygon_points, result):
+        """Actualiza el gráfico con una solución ya calculada (ver calculate)."""
+        full_redraw = extent != self.plot_extent_value or self.background is None
+        if extent != self.plot_extent_value:
+            self.ax.set_xlim(-0.02 * extent, extent)
+            self.ax.set_ylim(-0.02 * extent, extent)
+            self.plot_extent_value = extent
+
+        self.update_constraint_lines(restrictions, extent)
+
+        self.region_patch.set_visible(len(polygon_points) >= 3)
+        if len(polygon_points) >= 3:
+            self.region_patch.set_xy(polygon_points)
+        # Región degenerada: un segmento o un punto.
+        degenerate = polygon_points if 0 < len(polygon_points) < 3 else np.empty((0, 2))
+        self.region_line.set_data(degenerate[:, 0], degenerate[:, 1])
+
+        if isinstance(result, dict):
+            x_opt, y_opt = result["X"]
+            z_opt = result["Z"]
+            self.optimum_marker.set_data([x_opt], [y_opt])
+            self.optimum_marker.set_visible(True)
             self.result_label.config(text=f"Solución óptima: x1 = {x_opt:.2f}, x2 = {y_opt:.2f}, Z = {z_opt:.2f}")
         else:
-            self.result_label.config(text="No se encontró solución óptima")
+            self.optimum_marker.set_visible(False)
+            self.result_label.config(text=result)
 
-        self.ax.legend(facecolor='#111827', edgecolor='#22d3ee', labelcolor='#e5e7eb')
-        self.figure.tight_layout()
-        self.canvas.draw()
-
-    def calculate_optimal_solution(self, coef_x1, coef_x2, restrictions, obj_type):
-        c = [-coef_x1, -coef_x2] if obj_type == 'max' else [coef_x1, coef_x2]
-        A = []
-        b = []
-
-        for coef1, coef2, limit, sign in restrictions:
-            if sign in ('<=', '≤'):
-                A.append([coef1, coef2])
-                b.append(limit)
-            elif sign in ('>=', '≥'):
-                A.append([-coef1, -coef2])
-                b.append(-limit)
-            else:
-                A.append([coef1, coef2])
-                b.append(limit)
-                A.append([-coef1, -coef2])
-                b.append(-limit)
-        bounds = [(0, None), (0, None)]
-        result = linprog(c, A_ub=A, b_ub=b, bounds=bounds, method='highs')
-        if result.success:
-            x_opt, y_opt = result.x
-            z_opt = coef_x1 * x_opt + coef_x2 * y_opt
-            return x_opt, y_opt, z_opt
-        return None
-
-    def satisfies_restriction(self, point, coef1, coef2, limit, sign):
-        x1, x2 = point
-        if sign == '<=':
-            return coef1 * x1 + coef2 * x2 <= limit + 1e-6
-        elif sign == '>=':
-            return coef1 * x1 + coef2 * x2 >= limit - 1e-6
+        self.update_legend()
+        if full_redraw:
+            # draw() dispara on_canvas_draw, que guarda el fondo y pinta los artistas.
+            self.canvas.draw()
         else:
-            return abs(coef1 * x1 + coef2 * x2 - limit) < 1e-6
\ No newline at end of file
+            self.canvas.restore_region(self.background)
+            self.draw_artists()
+        self.canvas.blit(self.figure.bbox)
+
+    def calculate_optimal_solution(self, coef_x1, coef_x2, restrictions, obj_type, check=None):
+        """Resuelve con GraphicMethodController; retorna {"X", "Z"} o el mensaje de error."""
+        from model.solve_cache import SolveCache, problem_fingerprint
+
+        if GraphicMethodView.solution_cache is None:
+            GraphicMethodView.solution_cache = SolveCache()
+        matrix = np.array([[coef1, coef2] for coef1, coef2, _, _ in restrictions], dtype=float).reshape(-1, 2)
+        relations = [{'≤': '<=', '≥': '>='}.get(inequality, inequality) for _, _, inequality, _ in restrictions]
+        rhs = [limit for _, _, _, limit in restrictions]
+        key = problem_fingerprint(obj_type, [coef_x1, coef_x2], matrix, relations, rhs)
+        cached = self.solution_cache.get(key, self._MISSING)
+        if cached is not self._MISSING:
+            return cached
+
+        result = self.controller.solve(obj_type, coef_x1, coef_x2, restrictions, check)
+        self.solution_cache.put(key, result)
+        return result
+
+    def plot_extent(self, restrictions):
+        """
+        Lado del viewport [0, extent]^2: al menos 100 y con margen sobre los cortes con los ejes.
+
+        Se redondea hacia arriba a 1, 2 o 5 x 10^k para que cambios pequeños
+        no muevan los ejes (y no obliguen a redibujar el fondo).
+        """
+        intercepts = [abs(limit / coef) for coef1, coef2, _, limit in restrictions for coef in (coef1, coef2) if coef != 0]
+        extent = max([PLOT_EXTENT] + [1.5 * intercept for intercept in intercepts])
+        magnitude = 10.0 ** np.floor(np.log10(extent))
+        return float(next(step * magnitude for step in (1, 2, 5, 10) if step * magnitude >= extent))
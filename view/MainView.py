@@ -1,8 +1,6 @@
 import tkinter as tk
 from tkinter import ttk
 from utils.center_window import center_window
-from view.GraphicMethodView import GraphicMethodView
-from view.TwoPhaseMethodView import TwoPhaseMethodView
 
 
 class MainView:
@@ -65,8 +63,12 @@ class MainView:
 
     def open_graphic_method_view(self):
         self.root.destroy()  # Cierra la ventana actual
+        from view.GraphicMethodView import GraphicMethodView
+
         GraphicMethodView()  # Abre la vista del método gráfico
 
     def open_two_phase_method_view(self):
         self.root.destroy()  # Cierra la ventana actual
+        from view.TwoPhaseMethodView import TwoPhaseMethodView
+
         TwoPhaseMethodView()  # Abre la vista del método de dos fases
\ No newline at end of file
@@ -2,6 +2,12 @@ import tkinter as tk
 from tkinter import ttk
 from controller.two_phase_controller import TwoPhaseMethodController
 from utils.center_window import center_window
+from utils.preload import preload_in_background
+from view.status_bar import StatusBar
+from view.tableau_grid import TableauGrid
+
+# Con más iteraciones que esto, cada fase muestra una iteración a la vez.
+STACKED_ITERATIONS = 10
 
 
 class TwoPhaseMethodView:
@@ -38,6 +44,7 @@ class TwoPhaseMethodView:
         self.controller = TwoPhaseMethodController(self)
 
         center_window(self.root)
+        preload_in_background(self.root)
         self.root.mainloop()
 
     def configure_styles(self):
@@ -259,6 +266,8 @@ class TwoPhaseMethodView:
             fg=self.text_muted,
         )
         self.footer_label.pack(side=tk.BOTTOM, pady=20)
+        self.status_bar = StatusBar(self.root, self.on_cancel, self.bg_color, self.text_muted, self.accent_color)
+        self.status_bar.pack(side=tk.BOTTOM, fill="x")
 
     def init_input_section(self):
         self.input_frame = tk.Frame(self.frame, bg=self.bg_color)
@@ -353,6 +362,14 @@ class TwoPhaseMethodView:
         self.obj_coeff_entries = []
         self.controller.create_matrix_entries(num_vars, num_constraints)
 
+    def on_cancel(self):
+        self.controller.cancel_solution()
+
+    def set_busy(self, busy):
+        """Deshabilita "Calcular Solución" mientras hay una resolución en curso."""
+        if self.calculate_button:
+            self.calculate_button.config(state=tk.DISABLED if busy else tk.NORMAL)
+
     def on_back(self):
         self.root.destroy()
         from view.TwoPhaseMethodView import TwoPhaseMethodView
@@ -376,11 +393,21 @@ class TwoPhaseMethodView:
         notebook = ttk.Notebook(self.result_frame)
         notebook.pack(expand=True, fill="both")
 
-        self.display_phase(notebook, result.get("phase1_tableaus", []), "Fase 1")
-        self.display_phase(notebook, result.get("phase2_tableaus", []), "Fase 2")
+        # Las iteraciones de cada fase se construyen la primera vez que se abre su pestaña.
+        pending = {}
+        self.display_phase(notebook, result.get("phase1_tableaus", []), "Fase 1", pending)
+        self.display_phase(notebook, result.get("phase2_tableaus", []), "Fase 2", pending)
         self.display_solution(notebook, result.get("solution", {}))
 
-    def display_phase(self, notebook, phase_tableaus, phase_name):
+        def on_tab_changed(event=None):
+            build = pending.pop(notebook.select(), None)
+            if build is not None:
+                build()
+
+        notebook.bind("<<NotebookTabChanged>>", on_tab_changed)
+        on_tab_changed()
+
+    def display_phase(self, notebook, phase_tableaus, phase_name, pending):
         phase_frame = ttk.Frame(notebook)
         notebook.add(phase_frame, text=phase_name)
 
@@ -388,10 +415,43 @@ class TwoPhaseMethodView:
             ttk.Label(phase_frame, text="Sin iteraciones", background=self.bg_color, foreground=self.text_primary).pack(pady=10)
             return
 
-        for idx, tableau in enumerate(phase_tableaus):
-            group = ttk.LabelFrame(phase_frame, text=f"Iteración {idx + 1}")
+        def build():
+            if len(phase_tableaus) <= STACKED_ITERATIONS:
+                for idx, tableau in enumerate(phase_tableaus):
+                    group = ttk.LabelFrame(phase_frame, text=f"Iteración {idx + 1}")
+                    group.pack(fill="both", expand=True, padx=10, pady=5)
+                    self.display_tableau(group, tableau)
+            else:
+                self.display_iteration_selector(phase_frame, phase_tableaus)
+
+        pending[str(phase_frame)] = build
+
+    def display_iteration_selector(self, parent, phase_tableaus):
+        """Muestra una iteración a la vez; el historial la reconstruye al elegirla."""
+        controls = ttk.Frame(parent)
+        controls.pack(pady=5)
+        ttk.Label(controls, text="Iteración", background=self.bg_color, foreground=self.text_primary).pack(side=tk.LEFT, padx=5)
+        selected = tk.IntVar(value=1)
+        selector = ttk.Spinbox(controls, from_=1, to=len(phase_tableaus), textvariable=selected, width=8)
+        selector.pack(side=tk.LEFT)
+        ttk.Label(controls, text=f"de {len(phase_tableaus)}", background=self.bg_color, foreground=self.text_primary).pack(side=tk.LEFT, padx=5)
+        holder = ttk.Frame(parent)
+        holder.pack(fill="both", expand=True)
+
+        def show(event=None):
+            try:
+                index = min(max(int(selected.get()), 1), len(phase_tableaus))
+            except (tk.TclError, ValueError):
+                return
+            for widget in holder.winfo_children():
+                widget.destroy()
+            group = ttk.LabelFrame(holder, text=f"Iteración {index}")
             group.pack(fill="both", expand=True, padx=10, pady=5)
-            self.display_tableau(group, tableau)
+            self.display_tableau(group, phase_tableaus[index - 1])
+
+        selector.configure(command=show)
+        selector.bind("<Return>", show)
+        show()
 
     def display_solution(self, notebook, solution):
         solution_frame = ttk.Frame(notebook)
@@ -413,36 +473,6 @@ class TwoPhaseMethodView:
             ).pack()
 
     def display_tableau(self, parent, tableau):
-        frame = ttk.Frame(parent)
-        frame.pack(fill="both", expand=True, padx=10, pady=10)
-
-        headers = tableau[0]
-        for col, header in enumerate(headers):
-            cell = ttk.Label(
-                frame,
-                text=header,
-                borderwidth=1,
-                relief="solid",
-                padding=5,
-                background=self.panel_color,
-                foreground=self.text_primary,
-            )
-            cell.grid(row=0, column=col, sticky="nsew")
-
-        for row_idx, row in enumerate(tableau[1:], start=1):
-            for col_idx, value in enumerate(row):
-                bg_color = "#0b1220" if row_idx != len(tableau) - 1 else "#1d4ed8"
-                cell = ttk.Label(
-                    frame,
-                    text=str(value),
-                    borderwidth=1,
-                    relief="solid",
-                    padding=5,
-                    background=bg_color,
-                    foreground=self.text_primary,
-                )
-                cell.grid(row=row_idx, column=col_idx, sticky="nsew")
-
-        for col in range(len(headers)):
-            frame.grid_columnconfigure(col, weight=1)
-
+        """Muestra el tableau en una grilla que solo dibuja las celdas visibles."""
+        colors = {"bg": self.bg_color, "panel": self.panel_color, "input": self.colors["input"], "text": self.text_primary}
+        TableauGrid(parent, tableau, colors).pack(fill="both", expand=True, padx=10, pady=10)
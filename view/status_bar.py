@@ -0,0 +1,43 @@
+import tkinter as tk
+
+PHASE_NAMES = {1: "Fase 1", 2: "Fase 2"}
+
+
+class StatusBar(tk.Frame):
+    """Barra de estado con el progreso de la resolución y un botón para cancelarla."""
+
+    def __init__(self, parent, on_cancel, bg, fg, accent):
+        super().__init__(parent, bg=bg)
+        self.label = tk.Label(self, text="", anchor="w", font=("Helvetica", 11), bg=bg, fg=fg)
+        self.label.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=10)
+        self.cancel_button = tk.Button(
+            self,
+            text="Cancelar",
+            command=on_cancel,
+            bg=bg,
+            fg=accent,
+            font=("Helvetica", 11, "bold"),
+            relief="flat",
+            bd=0,
+            padx=10,
+            pady=4,
+            activebackground="#1f2937",
+            state=tk.DISABLED,
+        )
+        self.cancel_button.config(borderwidth=0, highlightthickness=0)
+        self.cancel_button.pack(side=tk.RIGHT, padx=10)
+
+    def start(self, text="Resolviendo..."):
+        self.label.config(text=text)
+        self.cancel_button.config(state=tk.NORMAL)
+
+    def show_progress(self, update):
+        phase = PHASE_NAMES.get(update["phase"], "")
+        self.label.config(
+            text=f"Resolviendo... {phase} · iteración {update['iteration']} · "
+            f"objetivo {update['objective']:.4f} · {update['elapsed']:.1f} s"
+        )
+
+    def finish(self, text=""):
+        self.label.config(text=text)
+        self.cancel_button.config(state=tk.DISABLED)
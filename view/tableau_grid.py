@@ -0,0 +1,121 @@
+import tkinter as tk
+from bisect import bisect_right
+from itertools import accumulate
+
+CELL_HEIGHT = 26
+CHAR_WIDTH = 8
+MIN_COLUMN_WIDTH = 56
+MAX_COLUMN_WIDTH = 160
+VISIBLE_ROWS = 12
+WIDTH_SAMPLE_ROWS = 50
+
+
+class TableauGrid(tk.Frame):
+    """
+    model.tableau.Tableau dibujado en un Canvas con barras de desplazamiento.
+
+    Solo existen ítems para las celdas visibles: al desplazar o
+    redimensionar se reutilizan los mismos rectángulos y textos con las
+    coordenadas y valores de las celdas que entran en vista. La fila de
+    encabezados y la columna de variables básicas quedan fijas.
+    """
+
+    def __init__(self, parent, tableau, colors):
+        super().__init__(parent, bg=colors["bg"])
+        self.tableau = tableau
+        self.header = tableau.header
+        self.num_rows = tableau.shape[0]
+        self.colors = colors
+        self.column_edges = [0, *accumulate(self.column_width(col) for col in range(len(self.header)))]
+        self.width = self.column_edges[-1]
+        self.height = CELL_HEIGHT * (self.num_rows + 1)
+        self.cells = []
+        self.shown = 0
+        self.redraw_pending = False
+
+        self.canvas = tk.Canvas(
+            self,
+            bg=colors["bg"],
+            highlightthickness=0,
+            height=CELL_HEIGHT * (min(self.num_rows, VISIBLE_ROWS) + 1),
+            width=min(self.width, 1000),
+            scrollregion=(0, 0, self.width, self.height),
+        )
+        y_scroll = tk.Scrollbar(self, orient=tk.VERTICAL, command=self.canvas.yview)
+        x_scroll = tk.Scrollbar(self, orient=tk.HORIZONTAL, command=self.canvas.xview)
+        self.canvas.configure(
+            yscrollcommand=lambda *args: self.on_scroll(y_scroll, args),
+            xscrollcommand=lambda *args: self.on_scroll(x_scroll, args),
+            xscrollincrement=CHAR_WIDTH,
+            yscrollincrement=CELL_HEIGHT,
+        )
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        y_scroll.grid(row=0, column=1, sticky="ns")
+        x_scroll.grid(row=1, column=0, sticky="ew")
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+        self.canvas.bind("<Configure>", lambda event: self.schedule_redraw())
+
+    def column_width(self, col):
+        """Ancho según el encabezado y una muestra de filas (no se recorre el tableau entero)."""
+        sample = range(min(self.num_rows, WIDTH_SAMPLE_ROWS))
+        chars = max([len(self.header[col])] + [len(str(self.tableau.cell(row, col))) for row in sample])
+        return min(MAX_COLUMN_WIDTH, max(MIN_COLUMN_WIDTH, chars * CHAR_WIDTH + 12))
+
+    def on_scroll(self, scrollbar, args):
+        scrollbar.set(*args)
+        self.schedule_redraw()
+
+    def schedule_redraw(self):
+        if not self.redraw_pending:
+            self.redraw_pending = True
+            self.after_idle(self.redraw)
+
+    def visible_columns(self, left, right):
+        first = max(1, bisect_right(self.column_edges, left) - 1)
+        last = min(len(self.header), bisect_right(self.column_edges, right))
+        return range(first, last)
+
+    def redraw(self):
+        self.redraw_pending = False
+        left, top = self.canvas.canvasx(0), self.canvas.canvasy(0)
+        right = left + self.canvas.winfo_width()
+        bottom = top + self.canvas.winfo_height()
+        first_row = int(top // CELL_HEIGHT)
+        last_row = min(self.num_rows, int(bottom // CELL_HEIGHT) + 1)
+        columns = self.visible_columns(left + self.column_edges[1], right)
+        last_index = self.num_rows - 1
+
+        # Los ítems se reutilizan siempre en el mismo orden, así que los que se
+        # ubican después (columna y fila fijas) quedan encima del cuerpo.
+        used = 0
+        for row in range(first_row, last_row):
+            y = (row + 1) * CELL_HEIGHT
+            fill = "#1d4ed8" if row == last_index else self.colors["input"]
+            for col in columns:
+                used = self.place(used, self.column_edges[col], y, col, self.tableau.cell(row, col), fill)
+        for row in range(first_row, last_row):
+            fill = "#1d4ed8" if row == last_index else self.colors["panel"]
+            used = self.place(used, left, (row + 1) * CELL_HEIGHT, 0, self.tableau.cell(row, 0), fill)
+        for col in columns:
+            used = self.place(used, self.column_edges[col], top, col, self.header[col], self.colors["panel"])
+        used = self.place(used, left, top, 0, self.header[0], self.colors["panel"])
+
+        for rectangle, text in self.cells[used:self.shown]:
+            self.canvas.itemconfigure(rectangle, state=tk.HIDDEN)
+            self.canvas.itemconfigure(text, state=tk.HIDDEN)
+        self.shown = used
+
+    def place(self, used, x, y, col, value, fill):
+        """Ubica la celda `used` del grupo de ítems reutilizables; retorna el siguiente índice libre."""
+        if used == len(self.cells):
+            rectangle = self.canvas.create_rectangle(0, 0, 0, 0, outline="#1f2937")
+            text = self.canvas.create_text(0, 0, fill=self.colors["text"], font=("Helvetica", 10))
+            self.cells.append((rectangle, text))
+        rectangle, text = self.cells[used]
+        width = self.column_edges[col + 1] - self.column_edges[col]
+        self.canvas.coords(rectangle, x, y, x + width, y + CELL_HEIGHT)
+        self.canvas.itemconfigure(rectangle, fill=fill, state=tk.NORMAL)
+        self.canvas.coords(text, x + width / 2, y + CELL_HEIGHT / 2)
+        self.canvas.itemconfigure(text, text=str(value), state=tk.NORMAL)
+        return used + 1